@@ -1,13 +1,20 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import FileResponse, PlainTextResponse
 import json
 import os
 from pathlib import Path
 from typing import List, Dict, Any
 
+from traitors_ai.logging_utils import decode_belief_updates
+from traitors_ai.replay import build_snapshots
+
 app = FastAPI(title="Traitors AI Replay Server")
 
+# Event logs are highly repetitive JSON, so compress responses
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Enable CORS for React frontend
 app.add_middleware(
     CORSMiddleware,
@@ -19,6 +26,7 @@ app.add_middleware(
 
 # Path to results directory
 RESULTS_DIR = Path(__file__).parent.parent / "results" / "logs"
+METRICS_FILE = Path(os.getenv("TRAITORS_METRICS_FILE", RESULTS_DIR.parent / "metrics.prom"))
 
 
 @app.get("/")
@@ -59,8 +67,12 @@ def get_game_summary(game_id: str) -> Dict[str, Any]:
 
 
 @app.get("/games/{game_id}/events")
-def get_game_events(game_id: str) -> List[Dict[str, Any]]:
-    """Get all events for a specific game from JSONL log."""
+def get_game_events(game_id: str, decode_beliefs: bool = False) -> List[Dict[str, Any]]:
+    """Get all events for a specific game from JSONL log.
+
+    Delta-encoded belief updates are sent as logged unless
+    ``decode_beliefs`` is set; the viewer decodes them client-side.
+    """
     log_path = RESULTS_DIR / f"{game_id}.jsonl"
     
     if not log_path.exists():
@@ -72,9 +84,42 @@ def get_game_events(game_id: str) -> List[Dict[str, Any]]:
             if line.strip():
                 events.append(json.loads(line))
     
+    if decode_beliefs:
+        return decode_belief_updates(events)
     return events
 
 
+@app.get("/games/{game_id}/snapshots")
+def get_game_snapshots(game_id: str, every: int = Query(50, ge=1, le=10_000)) -> List[Dict[str, Any]]:
+    """Get precomputed replay state snapshots for a game.
+
+    Snapshots are taken at every round boundary and every ``every`` events.
+    The last spacing requested is cached next to the log, one file per game,
+    until the log changes.
+    """
+    log_path = RESULTS_DIR / f"{game_id}.jsonl"
+    if not log_path.exists():
+        raise HTTPException(status_code=404, detail=f"Game log {game_id} not found")
+
+    cache_path = RESULTS_DIR / f"{game_id}_snapshots.json"
+    if cache_path.exists() and cache_path.stat().st_mtime >= log_path.stat().st_mtime:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached.get("every") == every:
+            return cached["snapshots"]
+
+    n_players = None
+    summary_path = RESULTS_DIR / f"{game_id}_summary.json"
+    if summary_path.exists():
+        with open(summary_path, "r", encoding="utf-8") as f:
+            n_players = json.load(f).get("config", {}).get("n_players")
+
+    snapshots = build_snapshots(get_game_events(game_id), every=every, n_players=n_players)
+    with open(cache_path, "w", encoding="utf-8") as f:
+        json.dump({"every": every, "snapshots": snapshots}, f)
+    return snapshots
+
+
 @app.get("/games/{game_id}/personas")
 def get_game_personas(game_id: str) -> Dict[int, Dict[str, Any]]:
     """Extract persona assignments from game events."""
@@ -90,6 +135,14 @@ def get_game_personas(game_id: str) -> Dict[int, Dict[str, Any]]:
     return personas
 
 
+@app.get("/metrics", response_class=PlainTextResponse)
+def get_metrics() -> str:
+    """Latest metrics written by a running batch, in Prometheus text format."""
+    if not METRICS_FILE.exists():
+        return ""
+    return METRICS_FILE.read_text(encoding="utf-8")
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000, reload=True)
@@ -1,66 +1,129 @@
-import React from 'react';
+import React, { useEffect, useMemo, useRef, useState, memo } from 'react';
+
+// Rows have a fixed height so the visible window can be computed from scrollTop
+const ROW_HEIGHT = 64;
+const VIEWPORT_HEIGHT = 540;
+const OVERSCAN = 6;
+
+const getEventIcon = (event) => {
+  switch (event.action_type) {
+    case 'public_message': return '💬';
+    case 'vote': return '🗳️';
+    case 'banish':
+    case 'banish_result': return '⚖️';
+    case 'murder':
+    case 'murder_result': return '🔪';
+    case 'recruit_result': return '🤝';
+    case 'belief_update': return '🧠';
+    case 'traitor_chat': return '🗡️';
+    default: return '📝';
+  }
+};
+
+const getEventDescription = (event) => {
+  switch (event.action_type) {
+    case 'public_message':
+      return `P${event.actor_id}: ${(event.payload?.content || '').substring(0, 50)}...`;
+    case 'vote':
+      return `P${event.actor_id} votes for P${event.payload?.target_id ?? event.payload?.target}`;
+    case 'banish':
+      return `P${event.payload?.player_id} was banished`;
+    case 'banish_result':
+      return `P${event.payload?.eliminated} was banished`;
+    case 'murder':
+      return `P${event.payload?.target} was murdered`;
+    case 'murder_result':
+      return `P${event.payload?.eliminated} was murdered`;
+    case 'recruit_result':
+      return `P${event.payload?.recruited} was recruited`;
+    case 'belief_update':
+      return `P${event.actor_id} updated beliefs`;
+    case 'traitor_chat':
+      return `Traitor P${event.actor_id} strategizing`;
+    default:
+      return event.action_type;
+  }
+};
+
+const EventRow = memo(function EventRow({ row, index, isCurrent, onSelectEvent }) {
+  return (
+    <div
+      onClick={() => onSelectEvent(index)}
+      className="absolute left-0 right-0"
+      style={{ top: index * ROW_HEIGHT, height: ROW_HEIGHT, paddingBottom: 8 }}
+    >
+      <div
+        className={`
+          h-full p-3 rounded cursor-pointer transition-colors
+          ${isCurrent
+            ? 'bg-blue-600 text-white shadow-lg'
+            : 'bg-gray-700 text-gray-300 hover:bg-gray-600'
+          }
+        `}
+      >
+        <div className="flex items-start space-x-2">
+          <span className="text-lg">{row.icon}</span>
+          <div className="flex-1 min-w-0">
+            <div className="text-xs opacity-75">
+              {row.label}
+            </div>
+            <div className="text-sm truncate">
+              {row.description}
+            </div>
+          </div>
+        </div>
+      </div>
+    </div>
+  );
+});
 
 function EventLog({ events, currentIndex, onSelectEvent }) {
-  const getEventIcon = (event) => {
-    switch (event.action_type) {
-      case 'public_message': return '💬';
-      case 'vote': return '🗳️';
-      case 'banish': return '⚖️';
-      case 'murder': return '🔪';
-      case 'belief_update': return '🧠';
-      case 'traitor_chat': return '🗡️';
-      default: return '📝';
-    }
-  };
+  const containerRef = useRef(null);
+  const [scrollTop, setScrollTop] = useState(0);
 
-  const getEventDescription = (event) => {
-    switch (event.action_type) {
-      case 'public_message':
-        return `P${event.actor_id}: ${(event.payload?.content || '').substring(0, 50)}...`;
-      case 'vote':
-        return `P${event.actor_id} votes for P${event.payload?.target}`;
-      case 'banish':
-        return `P${event.payload?.player_id} was banished`;
-      case 'murder':
-        return `P${event.payload?.target} was murdered`;
-      case 'belief_update':
-        return `P${event.actor_id} updated beliefs`;
-      case 'traitor_chat':
-        return `Traitor P${event.actor_id} strategizing`;
-      default:
-        return event.action_type;
+  // Descriptions only depend on the events, not on the playback position
+  const rows = useMemo(() => events.map(event => ({
+    icon: getEventIcon(event),
+    label: `R${event.round} - ${event.phase}`,
+    description: getEventDescription(event)
+  })), [events]);
+
+  // Keep the current event in view during playback and seeking
+  useEffect(() => {
+    const container = containerRef.current;
+    if (!container) return;
+    const rowTop = currentIndex * ROW_HEIGHT;
+    if (rowTop < container.scrollTop || rowTop + ROW_HEIGHT > container.scrollTop + VIEWPORT_HEIGHT) {
+      container.scrollTop = Math.max(0, rowTop - VIEWPORT_HEIGHT / 2 + ROW_HEIGHT / 2);
     }
-  };
+  }, [currentIndex]);
+
+  const start = Math.max(0, Math.floor(scrollTop / ROW_HEIGHT) - OVERSCAN);
+  const end = Math.min(events.length, Math.ceil((scrollTop + VIEWPORT_HEIGHT) / ROW_HEIGHT) + OVERSCAN);
+  const visible = [];
+  for (let index = start; index < end; index++) {
+    visible.push(
+      <EventRow
+        key={index}
+        row={rows[index]}
+        index={index}
+        isCurrent={index === currentIndex}
+        onSelectEvent={onSelectEvent}
+      />
+    );
+  }
 
   return (
-    <div className="bg-gray-800 rounded-lg p-4" style={{ maxHeight: '600px', overflowY: 'auto' }}>
+    <div className="bg-gray-800 rounded-lg p-4">
       <h3 className="text-xl font-bold text-white mb-4">Event Log</h3>
-      <div className="space-y-2">
-        {events.map((event, index) => (
-          <div
-            key={index}
-            onClick={() => onSelectEvent(index)}
-            className={`
-              p-3 rounded cursor-pointer transition-all
-              ${index === currentIndex 
-                ? 'bg-blue-600 text-white shadow-lg' 
-                : 'bg-gray-700 text-gray-300 hover:bg-gray-600'
-              }
-            `}
-          >
-            <div className="flex items-start space-x-2">
-              <span className="text-lg">{getEventIcon(event)}</span>
-              <div className="flex-1 min-w-0">
-                <div className="text-xs opacity-75">
-                  R{event.round} - {event.phase}
-                </div>
-                <div className="text-sm truncate">
-                  {getEventDescription(event)}
-                </div>
-              </div>
-            </div>
-          </div>
-        ))}
+      <div
+        ref={containerRef}
+        onScroll={(e) => setScrollTop(e.currentTarget.scrollTop)}
+        style={{ height: VIEWPORT_HEIGHT, overflowY: 'auto' }}
+      >
+        <div className="relative" style={{ height: events.length * ROW_HEIGHT }}>
+          {visible}
+        </div>
       </div>
     </div>
   );
@@ -1,14 +1,17 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useMemo } from 'react';
 import axios from 'axios';
 import RoundTable from './RoundTable';
 import EventLog from './EventLog';
 import PlaybackControls from './PlaybackControls';
+import { decodeBeliefUpdates } from '../utils/beliefs';
+import { stateAt } from '../utils/replayState';
 
 const API_BASE = 'http://localhost:8000';
 
 function GameViewer({ gameId, onBack }) {
   const [summary, setSummary] = useState(null);
   const [events, setEvents] = useState([]);
+  const [snapshots, setSnapshots] = useState([]);
   const [currentEventIndex, setCurrentEventIndex] = useState(0);
   const [isPlaying, setIsPlaying] = useState(false);
   const [playbackSpeed, setPlaybackSpeed] = useState(1000); // ms between events
@@ -36,12 +39,14 @@ function GameViewer({ gameId, onBack }) {
 
   const loadGameData = async () => {
     try {
-      const [summaryRes, eventsRes] = await Promise.all([
+      const [summaryRes, eventsRes, snapshotsRes] = await Promise.all([
         axios.get(`${API_BASE}/games/${gameId}/summary`),
-        axios.get(`${API_BASE}/games/${gameId}/events`)
+        axios.get(`${API_BASE}/games/${gameId}/events`),
+        axios.get(`${API_BASE}/games/${gameId}/snapshots`)
       ]);
       setSummary(summaryRes.data);
-      setEvents(eventsRes.data);
+      setEvents(decodeBeliefUpdates(eventsRes.data));
+      setSnapshots(snapshotsRes.data);
       setLoading(false);
     } catch (error) {
       console.error('Error loading game data:', error);
@@ -49,15 +54,12 @@ function GameViewer({ gameId, onBack }) {
     }
   };
 
-  const getCurrentState = () => {
-    // Build game state up to current event
-    const eventsUpToCurrent = events.slice(0, currentEventIndex + 1);
-    return {
-      events: eventsUpToCurrent,
-      currentEvent: events[currentEventIndex],
-      summary
-    };
-  };
+  // Nearest precomputed snapshot plus a short delta, instead of replaying the whole prefix
+  const currentState = useMemo(() => ({
+    replay: stateAt(snapshots, events, currentEventIndex),
+    currentEvent: events[currentEventIndex],
+    summary
+  }), [snapshots, events, currentEventIndex, summary]);
 
   if (loading) {
     return (
@@ -94,7 +96,7 @@ function GameViewer({ gameId, onBack }) {
       <div className="grid grid-cols-1 lg:grid-cols-3 gap-6">
         {/* Round Table - takes up 2 columns */}
         <div className="lg:col-span-2">
-          <RoundTable gameState={getCurrentState()} />
+          <RoundTable gameState={currentState} />
         </div>
 
         {/* Event Log - takes up 1 column */}
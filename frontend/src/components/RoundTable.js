@@ -2,7 +2,7 @@ import React from 'react';
 import AgentAvatar from './AgentAvatar';
 
 function RoundTable({ gameState }) {
-  if (!gameState?.events) {
+  if (!gameState?.replay) {
     return (
       <div className="bg-gray-800 rounded-lg p-8 text-center">
         <p className="text-gray-400">No game data available</p>
@@ -10,34 +10,23 @@ function RoundTable({ gameState }) {
     );
   }
 
-  // Extract player info from events
+  // Derive player info from the replay state at the current event
   const getPlayerInfo = () => {
+    const { replay, currentEvent } = gameState;
+    const alive = new Set(replay.alive);
+    const ids = new Set([
+      ...Object.keys(replay.roles).map(id => parseInt(id)),
+      ...replay.alive,
+      ...replay.eliminations.map(e => e.player_id)
+    ]);
     const players = {};
-    const { events, currentEvent } = gameState;
-    
-    // Find role assignments
-    events.forEach(event => {
-      if (event.action_type === 'assign_roles') {
-        const roles = event.payload?.roles || {};
-        Object.entries(roles).forEach(([playerId, role]) => {
-          players[playerId] = {
-            id: parseInt(playerId),
-            role: role,
-            alive: true,
-            speaking: false
-          };
-        });
-      }
-    });
-
-    // Track eliminations
-    events.forEach(event => {
-      if (event.action_type === 'banish' || event.action_type === 'murder') {
-        const eliminated = event.payload?.player_id || event.payload?.target;
-        if (eliminated && players[eliminated]) {
-          players[eliminated].alive = false;
-        }
-      }
+    ids.forEach(id => {
+      players[id] = {
+        id,
+        role: replay.roles[id],
+        alive: alive.has(id),
+        speaking: false
+      };
     });
 
     // Highlight current speaker
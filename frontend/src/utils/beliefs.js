@@ -0,0 +1,21 @@
+// Rebuild full suspicion scores from delta-encoded belief_update events.
+// Full-mode logs pass through unchanged.
+export function decodeBeliefUpdates(events) {
+  const latest = {};
+  return events.map(event => {
+    if (event.action_type !== 'belief_update') return event;
+    const payload = { ...event.payload };
+    if (payload.delta) {
+      const scores = { ...(latest[event.actor_id] || {}) };
+      (payload.removed || []).forEach(playerId => {
+        delete scores[playerId];
+      });
+      Object.assign(scores, payload.delta);
+      delete payload.delta;
+      delete payload.removed;
+      payload.scores = scores;
+    }
+    latest[event.actor_id] = payload.scores || {};
+    return { ...event, payload };
+  });
+}
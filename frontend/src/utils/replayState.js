@@ -0,0 +1,78 @@
+// Mirrors traitors_ai.replay.apply_event so the viewer can roll a backend
+// snapshot forward by the few events between it and the current index.
+function cloneState(state) {
+  return {
+    ...state,
+    roles: { ...state.roles },
+    alive: [...state.alive],
+    eliminations: [...state.eliminations],
+    vote_tallies: { ...state.vote_tallies },
+    suspicions: { ...state.suspicions }
+  };
+}
+
+export function applyEvent(state, event, index) {
+  const payload = event.payload || {};
+  state.event_index = index;
+  state.round = event.round ?? state.round;
+  state.phase = event.phase ?? state.phase;
+  switch (event.action_type) {
+    case 'assign_roles':
+      state.roles = { ...(payload.roles || {}) };
+      state.alive = Object.keys(state.roles).map(id => parseInt(id)).sort((a, b) => a - b);
+      break;
+    case 'vote': {
+      const voteRound = `${state.round}:${state.phase}`;
+      if (state.vote_round !== voteRound) {
+        state.vote_round = voteRound;
+        state.vote_tallies = {};
+      }
+      const target = String(payload.target_id);
+      state.vote_tallies[target] = (state.vote_tallies[target] || 0) + 1;
+      break;
+    }
+    case 'banish_result':
+    case 'murder_result': {
+      for (const eliminated of [payload.eliminated, ...(payload.also_eliminated || [])]) {
+        if (eliminated !== null && eliminated !== undefined && state.alive.includes(eliminated)) {
+          state.alive = state.alive.filter(id => id !== eliminated);
+          state.eliminations.push({
+            player_id: eliminated,
+            round: state.round,
+            cause: event.action_type === 'banish_result' ? 'banished' : 'murdered'
+          });
+        }
+      }
+      break;
+    }
+    case 'recruit_result':
+      state.roles = { ...state.roles, [String(payload.recruited)]: 'traitor' };
+      break;
+    case 'belief_update':
+      state.suspicions[String(event.actor_id)] = { ...(payload.scores || {}) };
+      break;
+    default:
+      break;
+  }
+  return state;
+}
+
+// Nearest snapshot at or before `index` via binary search, then a short replay.
+export function stateAt(snapshots, events, index) {
+  if (!snapshots.length) return null;
+  let lo = 0;
+  let hi = snapshots.length - 1;
+  while (lo < hi) {
+    const mid = Math.ceil((lo + hi) / 2);
+    if (snapshots[mid].event_index <= index) {
+      lo = mid;
+    } else {
+      hi = mid - 1;
+    }
+  }
+  const state = cloneState(snapshots[lo]);
+  for (let i = state.event_index + 1; i <= index && i < events.length; i++) {
+    applyEvent(state, events[i], i);
+  }
+  return state;
+}
@@ -1,14 +1,20 @@
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Tuple
+import asyncio
+from typing import Any, Dict, Generator, List, Optional, Tuple
 
 from langchain_core.output_parsers import PydanticOutputParser
 from langchain_core.messages import AIMessage
 
 from . import prompts
+from .routing import route_model, routing_enabled
 from .schemas import AgentPrivateState, BeliefUpdate, MurderAction, VoteAction
 
 
+def _as_request(request) -> Tuple[str, Any]:
+    return request if isinstance(request, tuple) else (request, None)
+
+
 class TraitorsAgent:
     def __init__(
         self,
@@ -17,23 +23,93 @@ class TraitorsAgent:
         role: str,
         llm_client,
         config,
+        prompt_cache=None,
     ) -> None:
         self.id = agent_id
         self.persona = persona
         self.role = role
         self.llm = llm_client
         self.config = config
+        self.prompt_cache = prompt_cache
+        self.models_used: Dict[str, str] = {}
+
+    def _call_kwargs(self, schema, route: Optional[str], model: Optional[str]) -> Dict[str, Any]:
+        kwargs = {"model": model, "route": route} if model else {}
+        if schema is None or not getattr(self.llm, "supports_json_schema", False):
+            return kwargs
+        return {"json_schema": schema.model_json_schema(), **kwargs}
+
+    def _cached(self, prompt: str, schema, model: Optional[str]) -> Optional[str]:
+        if self.prompt_cache is None:
+            return None
+        return self.prompt_cache.lookup(self.id, prompt, schema.__name__ if schema else None, model)
+
+    def _cache(self, prompt: str, schema, text: str, model: Optional[str]) -> str:
+        if self.prompt_cache is not None:
+            self.prompt_cache.store(prompt, schema.__name__ if schema else None, text, model)
+        return text
+
+    # Picks the model for one attempt of a routed call and remembers it for the
+    # event log. An agent never has two calls of the same method in flight.
+    def _route(self, route: Optional[str], failures: int) -> Optional[str]:
+        if route is None or not routing_enabled(self.config):
+            return None
+        model = route_model(self.config, route, failures)
+        self.models_used[route] = model
+        return model
 
-    def _invoke(self, prompt: str) -> str:
-        response = self.llm.invoke(prompt)
+    def _invoke(self, prompt: str, schema=None, route: Optional[str] = None, model: Optional[str] = None) -> str:
+        cached = self._cached(prompt, schema, model)
+        if cached is not None:
+            return cached
+        response = self.llm.invoke(prompt, **self._call_kwargs(schema, route, model))
         if isinstance(response, AIMessage):
-            return response.content
-        return str(response)
+            return self._cache(prompt, schema, response.content, model)
+        return self._cache(prompt, schema, str(response), model)
+
+    async def _ainvoke(self, prompt: str, schema=None, route: Optional[str] = None, model: Optional[str] = None) -> str:
+        cached = self._cached(prompt, schema, model)
+        if cached is not None:
+            return cached
+        kwargs = self._call_kwargs(schema, route, model)
+        if hasattr(self.llm, "ainvoke"):
+            response = await self.llm.ainvoke(prompt, **kwargs)
+        else:
+            response = await asyncio.to_thread(self.llm.invoke, prompt, **kwargs)
+        if isinstance(response, AIMessage):
+            return self._cache(prompt, schema, response.content, model)
+        return self._cache(prompt, schema, str(response), model)
+
+    # Each action is written once as a generator that yields prompts and receives
+    # raw LLM text; _run and _arun drive it through the sync or async client.
+    # Structured steps yield (prompt, schema) so constrained backends can enforce it.
+    # Every request after the first follows a failed parse, which drives escalation.
+    def _run(self, steps: Generator[Any, str, Any], route: Optional[str] = None) -> Any:
+        try:
+            request = next(steps)
+            failures = 0
+            while True:
+                prompt, schema = _as_request(request)
+                request = steps.send(self._invoke(prompt, schema, route, self._route(route, failures)))
+                failures += 1
+        except StopIteration as stop:
+            return stop.value
 
-    def _structured_invoke(self, prompt: str, parser, retries: int = 2) -> Tuple[Optional[object], Optional[str]]:
+    async def _arun(self, steps: Generator[Any, str, Any], route: Optional[str] = None) -> Any:
+        try:
+            request = next(steps)
+            failures = 0
+            while True:
+                prompt, schema = _as_request(request)
+                request = steps.send(await self._ainvoke(prompt, schema, route, self._route(route, failures)))
+                failures += 1
+        except StopIteration as stop:
+            return stop.value
+
+    def _structured_steps(self, prompt: str, parser, retries: int = 2):
         last_error: Optional[str] = None
         for attempt in range(retries + 1):
-            raw = self._invoke(prompt)
+            raw = yield prompt, parser.pydantic_object
             try:
                 return parser.parse(raw), None
             except Exception as exc:  # noqa: BLE001
@@ -56,6 +132,12 @@ class TraitorsAgent:
         return [player_names[pid] for pid in alive]
 
     def update_beliefs(self, view: Dict[str, object]) -> Tuple[BeliefUpdate, Optional[str]]:
+        return self._run(self._update_beliefs_steps(view), "update_beliefs")
+
+    async def aupdate_beliefs(self, view: Dict[str, object]) -> Tuple[BeliefUpdate, Optional[str]]:
+        return await self._arun(self._update_beliefs_steps(view), "update_beliefs")
+
+    def _update_beliefs_steps(self, view: Dict[str, object]):
         parser = PydanticOutputParser(pydantic_object=BeliefUpdate)
         prompt = prompts.belief_update_prompt(
             persona_card=prompts.format_persona(self.persona),
@@ -67,13 +149,19 @@ class TraitorsAgent:
             top_suspicions=view["top_suspicions"],
             format_instructions=parser.get_format_instructions(),
         )
-        result, error = self._structured_invoke(prompt, parser)
+        result, error = yield from self._structured_steps(prompt, parser)
         if result is None:
             scores = {pid: 0.5 for pid in view["alive_ids"] if pid != self.id}
             return BeliefUpdate(scores=scores, notes="fallback neutral"), error
         return result, error
 
     def speak(self, view: Dict[str, object]) -> str:
+        return self._run(self._speak_steps(view), "speak")
+
+    async def aspeak(self, view: Dict[str, object]) -> str:
+        return await self._arun(self._speak_steps(view), "speak")
+
+    def _speak_steps(self, view: Dict[str, object]):
         prompt = prompts.public_discussion_prompt(
             persona_card=prompts.format_persona(self.persona),
             role=self.role,
@@ -84,12 +172,18 @@ class TraitorsAgent:
             top_suspicions=view["top_suspicions"],
             message_char_limit=self.config.message_char_limit,
         )
-        text = self._invoke(prompt).strip()
+        text = (yield prompt).strip()
         if len(text) > self.config.message_char_limit:
             return text[: self.config.message_char_limit].rstrip()
         return text
 
     def vote(self, view: Dict[str, object]) -> Tuple[VoteAction, Optional[str]]:
+        return self._run(self._vote_steps(view), "vote")
+
+    async def avote(self, view: Dict[str, object]) -> Tuple[VoteAction, Optional[str]]:
+        return await self._arun(self._vote_steps(view), "vote")
+
+    def _vote_steps(self, view: Dict[str, object]):
         parser = PydanticOutputParser(pydantic_object=VoteAction)
         allowed_targets = view.get("allowed_targets", [])
         allowed_text = ", ".join([f"P{pid}" for pid in allowed_targets]) if allowed_targets else ""
@@ -104,7 +198,7 @@ class TraitorsAgent:
             format_instructions=parser.get_format_instructions(),
             allowed_targets=allowed_text,
         )
-        result, error = self._structured_invoke(prompt, parser)
+        result, error = yield from self._structured_steps(prompt, parser)
         if result is None:
             rng = view["rng"]
             candidates = [pid for pid in view["alive_ids"] if pid != self.id]
@@ -115,6 +209,12 @@ class TraitorsAgent:
         return result, error
 
     def traitor_chat(self, view: Dict[str, object]) -> str:
+        return self._run(self._traitor_chat_steps(view), "traitor_chat")
+
+    async def atraitor_chat(self, view: Dict[str, object]) -> str:
+        return await self._arun(self._traitor_chat_steps(view), "traitor_chat")
+
+    def _traitor_chat_steps(self, view: Dict[str, object]):
         prompt = prompts.traitor_chat_prompt(
             persona_card=prompts.format_persona(self.persona),
             role=self.role,
@@ -126,12 +226,18 @@ class TraitorsAgent:
             traitor_ids=view["traitor_ids"],
             traitor_summary=view.get("traitor_summary", ""),
         )
-        text = self._invoke(prompt).strip()
+        text = (yield prompt).strip()
         if len(text) > self.config.message_char_limit:
             return text[: self.config.message_char_limit].rstrip()
         return text
 
     def choose_murder(self, view: Dict[str, object]) -> Tuple[MurderAction, Optional[str]]:
+        return self._run(self._choose_murder_steps(view), "choose_murder")
+
+    async def achoose_murder(self, view: Dict[str, object]) -> Tuple[MurderAction, Optional[str]]:
+        return await self._arun(self._choose_murder_steps(view), "choose_murder")
+
+    def _choose_murder_steps(self, view: Dict[str, object]):
         parser = PydanticOutputParser(pydantic_object=MurderAction)
         prompt = prompts.murder_prompt(
             persona_card=prompts.format_persona(self.persona),
@@ -145,7 +251,7 @@ class TraitorsAgent:
             traitor_summary=view.get("traitor_summary", ""),
             format_instructions=parser.get_format_instructions(),
         )
-        result, error = self._structured_invoke(prompt, parser)
+        result, error = yield from self._structured_steps(prompt, parser)
         if result is None:
             rng = view["rng"]
             candidates = [pid for pid in view["alive_ids"] if pid not in view["traitor_ids"]]
@@ -153,6 +259,32 @@ class TraitorsAgent:
             return MurderAction(target_id=target, rationale="fallback"), error
         return result, error
 
+    def choose_joint_murder(self, view: Dict[str, object]) -> Tuple[MurderAction, Optional[str]]:
+        return self._run(self._choose_joint_murder_steps(view), "choose_joint_murder")
+
+    async def achoose_joint_murder(self, view: Dict[str, object]) -> Tuple[MurderAction, Optional[str]]:
+        return await self._arun(self._choose_joint_murder_steps(view), "choose_joint_murder")
+
+    def _choose_joint_murder_steps(self, view: Dict[str, object]):
+        parser = PydanticOutputParser(pydantic_object=MurderAction)
+        prompt = prompts.joint_murder_prompt(
+            persona_card=prompts.format_persona(self.persona),
+            role=self.role,
+            round_idx=view["round"],
+            alive_players=view["alive_names"],
+            public_summary=view["public_summary"],
+            memory_summary=view["memory_summary"],
+            top_suspicions=view["top_suspicions"],
+            traitor_ids=view["traitor_ids"],
+            traitor_summary=view.get("traitor_summary", ""),
+            proposed_target=view["proposed_target"],
+            format_instructions=parser.get_format_instructions(),
+        )
+        result, error = yield from self._structured_steps(prompt, parser)
+        if result is None:
+            return MurderAction(target_id=view["proposed_target"], rationale="fallback consensus"), error
+        return result, error
+
     def update_memory_after_round(self, state: AgentPrivateState, public_summary: str) -> None:
         if self.config.condition_name == "no_memory":
             state.memory_summary = ""
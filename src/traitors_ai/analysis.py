@@ -1,6 +1,23 @@
 from __future__ import annotations
 
-from typing import Dict, List
+import csv
+import json
+import math
+from typing import Any, Dict, List, Tuple
+
+from .schemas import GameSummary
+
+
+def load_game_summaries(table_path: str) -> List[Dict[str, Any]]:
+    with open(table_path, "r", newline="", encoding="utf-8") as handle:
+        rows = list(csv.DictReader(handle))
+    list_fields = {"eliminated_order", "eliminated_roles", "banish_correct"}
+    return [
+        GameSummary.model_validate(
+            {key: json.loads(value) if key in list_fields else (value or None) for key, value in row.items()}
+        ).model_dump()
+        for row in rows
+    ]
 
 
 def summarize_results(rows: List[Dict[str, object]]) -> Dict[str, float]:
@@ -14,3 +31,72 @@ def summarize_results(rows: List[Dict[str, object]]) -> Dict[str, float]:
         "traitor_win_rate": traitor_wins / total,
         "faithful_win_rate": faithful_wins / total,
     }
+
+
+def wilson_interval(successes: int, total: int, z: float = 1.96) -> Tuple[float, float]:
+    if total == 0:
+        return 0.0, 1.0
+    rate = successes / total
+    denom = 1 + z * z / total
+    center = (rate + z * z / (2 * total)) / denom
+    margin = z * math.sqrt(rate * (1 - rate) / total + z * z / (4 * total * total)) / denom
+    return max(0.0, center - margin), min(1.0, center + margin)
+
+
+def win_rate_interval(rows: List[Dict[str, object]], z: float = 1.96) -> Dict[str, float]:
+    total = len(rows)
+    traitor_wins = sum(1 for r in rows if r.get("winner") == "traitors")
+    low, high = wilson_interval(traitor_wins, total, z)
+    return {
+        "total": total,
+        "traitor_win_rate": traitor_wins / total if total else 0.0,
+        "low": low,
+        "high": high,
+        "half_width": (high - low) / 2,
+    }
+
+
+def precision_reached(
+    rows: List[Dict[str, object]],
+    target_half_width: float,
+    min_games: int = 10,
+    z: float = 1.96,
+) -> bool:
+    if len(rows) < min_games:
+        return False
+    return win_rate_interval(rows, z)["half_width"] <= target_half_width
+
+
+def summarize_skipped_work(events: List[Dict[str, object]]) -> Dict[str, int]:
+    skipped = [e for e in events if e.get("action_type") == "skipped_work"]
+    payloads = [e.get("payload", {}) for e in skipped]
+    return {
+        "rounds_with_skips": len({e.get("round") for e in skipped}),
+        "belief_updates_skipped": sum(len(p.get("belief_updates_skipped", [])) for p in payloads),
+        "speakers_skipped": sum(len(p.get("speakers_skipped", [])) for p in payloads),
+        "calls_saved": sum(int(p.get("calls_saved", 0)) for p in payloads),
+    }
+
+
+def summarize_murder_decisions(events: List[Dict[str, object]]) -> Dict[str, int]:
+    payloads = [e.get("payload", {}) for e in events if e.get("action_type") == "murder_decision"]
+    return {
+        "nights": len(payloads),
+        "joint_nights": sum(1 for p in payloads if p.get("path") == "joint"),
+        "murder_calls": sum(int(p.get("calls", 0)) for p in payloads),
+        "calls_saved": sum(int(p.get("calls_saved", 0)) for p in payloads),
+    }
+
+
+def belief_matrices(events: List[Dict[str, object]]) -> Dict[int, Dict[int, Dict[int, float]]]:
+    from .logging_utils import decode_belief_updates
+
+    matrices: Dict[int, Dict[int, Dict[int, float]]] = {}
+    for event in decode_belief_updates(events):
+        if event.get("action_type") != "belief_update":
+            continue
+        scores = event["payload"].get("scores", {})
+        matrices.setdefault(int(event["round"]), {})[int(event["actor_id"])] = {
+            int(pid): float(score) for pid, score in scores.items()
+        }
+    return matrices
@@ -1,26 +1,89 @@
 from __future__ import annotations
 
+import importlib.util
 import os
-from typing import Literal
+import threading
+from functools import lru_cache
+from typing import Any, Dict, Literal, Tuple
 
+import httpx
 from dotenv import load_dotenv
 from langchain_anthropic import ChatAnthropic
 from langchain_openai import ChatOpenAI
 
+from .local_llm import LlamaCppLLM, LocalLLM
+
 
 def load_env() -> None:
     load_dotenv()
 
 
-def get_llm_provider() -> Literal["openai", "anthropic"]:
+def get_llm_provider() -> Literal["openai", "anthropic", "local"]:
     provider = os.getenv("LLM_PROVIDER", "openai").strip().lower()
-    if provider not in {"openai", "anthropic"}:
-        raise ValueError("LLM_PROVIDER must be 'openai' or 'anthropic'")
+    if provider not in {"openai", "anthropic", "local"}:
+        raise ValueError("LLM_PROVIDER must be 'openai', 'anthropic' or 'local'")
     return provider  # type: ignore[return-value]
 
 
+def _http_limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=int(os.getenv("LLM_POOL_MAX_CONNECTIONS", "100")),
+        max_keepalive_connections=int(os.getenv("LLM_POOL_MAX_KEEPALIVE", "20")),
+        keepalive_expiry=float(os.getenv("LLM_POOL_KEEPALIVE_EXPIRY", "60")),
+    )
+
+
+def _http2_enabled() -> bool:
+    setting = os.getenv("LLM_HTTP2", "auto").strip().lower()
+    if setting in {"0", "false", "no", "off"}:
+        return False
+    return importlib.util.find_spec("h2") is not None
+
+
+@lru_cache(maxsize=1)
+def _shared_http_client() -> httpx.Client:
+    return httpx.Client(limits=_http_limits(), http2=_http2_enabled())
+
+
+@lru_cache(maxsize=1)
+def _shared_async_http_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(limits=_http_limits(), http2=_http2_enabled())
+
+
 def create_llm(model_name: str, temperature: float):
     provider = get_llm_provider()
     if provider == "openai":
-        return ChatOpenAI(model=model_name, temperature=temperature)
+        return ChatOpenAI(
+            model=model_name,
+            temperature=temperature,
+            http_client=_shared_http_client(),
+            http_async_client=_shared_async_http_client(),
+        )
+    if provider == "local":
+        max_tokens = int(os.getenv("LOCAL_LLM_MAX_TOKENS", "512"))
+        model_path = os.getenv("LOCAL_LLM_MODEL_PATH")
+        if model_path:
+            return LlamaCppLLM(model_path, temperature, max_tokens=max_tokens)
+        return LocalLLM(
+            model=model_name,
+            temperature=temperature,
+            base_url=os.getenv("LOCAL_LLM_BASE_URL", "http://127.0.0.1:8080/v1"),
+            max_tokens=max_tokens,
+            max_batch_size=int(os.getenv("LOCAL_LLM_MAX_BATCH", "8")),
+            batch_window_ms=float(os.getenv("LOCAL_LLM_BATCH_WINDOW_MS", "10")),
+        )
+    # langchain-anthropic caches its own httpx clients per base URL; LLM_POOL_* and
+    # LLM_HTTP2 only configure the OpenAI pools above.
     return ChatAnthropic(model=model_name, temperature=temperature)
+
+
+_CLIENTS: Dict[Tuple[str, str, float], Any] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+
+def get_shared_llm(model_name: str, temperature: float):
+    key = (get_llm_provider(), model_name, temperature)
+    with _CLIENTS_LOCK:
+        if key not in _CLIENTS:
+            _CLIENTS[key] = create_llm(model_name, temperature)
+        return _CLIENTS[key]
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import hashlib
+import json
 import random
 from typing import Dict, List, Optional, Set, Tuple
 
-from .schemas import Role
+from .schemas import GameConfig, Role
 
 
 def assign_roles(n_players: int, n_traitors: int, rng: random.Random) -> Tuple[Dict[int, Role], Set[int]]:
@@ -23,6 +24,13 @@ def apply_vote(
     for target in votes.values():
         if target in counts:
             counts[target] += 1
+    return resolve_counts(alive, counts, rng)
+
+
+# Plurality over counts keyed by the alive players; no votes at all picks at random.
+def resolve_counts(
+    alive: Set[int], counts: Dict[int, float], rng: random.Random
+) -> Tuple[Optional[int], Dict[str, object]]:
     max_votes = max(counts.values()) if counts else 0
     top = [pid for pid, cnt in counts.items() if cnt == max_votes and cnt > 0]
     if len(top) == 1:
@@ -66,6 +74,49 @@ def check_terminal(alive: Set[int], traitors: Set[int]) -> Optional[str]:
     return None
 
 
+def suspicion_consensus(
+    suspicion: Dict[int, Dict[int, float]],
+    alive: Set[int],
+) -> Tuple[Optional[int], float]:
+    top_choices: Dict[int, int] = {}
+    for observer in sorted(alive):
+        scores = {pid: score for pid, score in suspicion.get(observer, {}).items() if pid in alive and pid != observer}
+        if not scores:
+            continue
+        best = max(scores.values())
+        top = [pid for pid, score in scores.items() if score == best]
+        if len(top) == 1:
+            top_choices[top[0]] = top_choices.get(top[0], 0) + 1
+    if not top_choices or not alive:
+        return None, 0.0
+    target = min(top_choices, key=lambda pid: (-top_choices[pid], pid))
+    return target, top_choices[target] / len(alive)
+
+
+# The target every traitor ranks uniquely first among the candidates, if they all agree.
+def murder_consensus(
+    suspicion: Dict[int, Dict[int, float]],
+    traitors: List[int],
+    candidates: Set[int],
+) -> Optional[int]:
+    picks: Set[int] = set()
+    for traitor in traitors:
+        scores = {pid: score for pid, score in suspicion.get(traitor, {}).items() if pid in candidates}
+        if not scores:
+            return None
+        best = max(scores.values())
+        top = [pid for pid, score in scores.items() if score == best]
+        if len(top) != 1:
+            return None
+        picks.add(top[0])
+    return picks.pop() if len(picks) == 1 else None
+
+
 def generate_game_id(seed: int, condition: str) -> str:
     digest = hashlib.sha256(f"{seed}-{condition}".encode("utf-8")).hexdigest()[:8]
     return f"{condition}-{seed}-{digest}"
+
+
+def config_hash(config: GameConfig) -> str:
+    encoded = json.dumps(config.model_dump(), sort_keys=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()[:12]
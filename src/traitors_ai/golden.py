@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from .game_engine import generate_game_id
+from .profiling import StandInLLM
+from .recording import ReplayLLM, ReplayMismatchError, compare_event_logs, transcript_path
+from .schemas import GameConfig
+
+MANIFEST = "golden.json"
+
+
+def rng_digest(rng) -> str:
+    return hashlib.sha256(repr(rng.getstate()).encode("utf-8")).hexdigest()[:16]
+
+
+def _field(final_state, name: str) -> Any:
+    return final_state[name] if isinstance(final_state, dict) else getattr(final_state, name)
+
+
+def _play(config: GameConfig, outdir: str, llm, record: bool = False, use_async: bool = False) -> Tuple[Any, float]:
+    from .runner import _run_single_game, _run_single_game_async  # runner imports this module for its CLI
+
+    log_path = os.path.join(outdir, "logs", f"{generate_game_id(config.seed, config.condition_name)}.jsonl")
+    if os.path.exists(log_path):
+        os.remove(log_path)
+    start = time.perf_counter()
+    if use_async:
+        final_state = asyncio.run(_run_single_game_async(config, outdir, llm, record))
+    else:
+        final_state = _run_single_game(config, outdir, llm, record=record)
+    return final_state, time.perf_counter() - start
+
+
+def load_manifest(corpus_dir: str) -> Dict[str, Any]:
+    with open(os.path.join(corpus_dir, MANIFEST), "r", encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+# Plays each config against the stand-in model with recording on and freezes the
+# event log, the LLM transcript, the outcome and a replay-time baseline.
+def record_golden(configs: List[GameConfig], corpus_dir: str) -> str:
+    os.makedirs(corpus_dir, exist_ok=True)
+    cases = []
+    with tempfile.TemporaryDirectory() as workdir:
+        log_dir = os.path.join(workdir, "logs")
+        for config in configs:
+            final_state, _ = _play(config, workdir, StandInLLM(config.seed), record=True)
+            game_id = _field(final_state, "game_id")
+            shutil.copy(os.path.join(log_dir, f"{game_id}.jsonl"), os.path.join(corpus_dir, f"{game_id}.jsonl"))
+            shutil.copy(transcript_path(log_dir, game_id), transcript_path(corpus_dir, game_id))
+            cases.append({
+                "game_id": game_id,
+                "config": config.model_dump(),
+                "winner": _field(final_state, "winner"),
+                "rounds": _field(final_state, "round_idx"),
+                "rng": rng_digest(_field(final_state, "rng")),
+            })
+        # Baselines time a replay, which is what check_golden measures.
+        for case in cases:
+            _, seconds = _play(
+                GameConfig.model_validate(case["config"]), workdir, ReplayLLM(transcript_path(corpus_dir, case["game_id"]))
+            )
+            case["seconds"] = round(seconds, 3)
+    path = os.path.join(corpus_dir, MANIFEST)
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump({"cases": cases}, handle, indent=2, sort_keys=True)
+        handle.write("\n")
+    return path
+
+
+# Replays every recorded game, optionally with config overrides such as
+# {"pipeline": True} or through the async graph, and reports whether events, outcome, RNG state and runtime
+# still match the corpus. A game passes if its replay is at most max_slowdown
+# times its baseline plus slack seconds.
+def check_golden(
+    corpus_dir: str,
+    workdir: str,
+    overrides: Optional[Dict[str, Any]] = None,
+    max_slowdown: float = 2.0,
+    slack: float = 0.5,
+    use_async: bool = False,
+) -> List[Dict[str, Any]]:
+    results = []
+    for case in load_manifest(corpus_dir)["cases"]:
+        game_id = case["game_id"]
+        config = GameConfig.model_validate({**case["config"], **(overrides or {})})
+        llm = ReplayLLM(transcript_path(corpus_dir, game_id))
+        try:
+            final_state, seconds = _play(config, workdir, llm, use_async=use_async)
+        except ReplayMismatchError as exc:
+            results.append({"game_id": game_id, "passed": False, "error": str(exc)})
+            continue
+        mismatch = compare_event_logs(
+            os.path.join(corpus_dir, f"{game_id}.jsonl"), os.path.join(workdir, "logs", f"{game_id}.jsonl")
+        )
+        result = {
+            "game_id": game_id,
+            "events_identical": mismatch is None,
+            "first_mismatch": None if mismatch is None else mismatch[0],
+            "winner_matches": _field(final_state, "winner") == case["winner"],
+            "rounds_match": _field(final_state, "round_idx") == case["rounds"],
+            "rng_matches": rng_digest(_field(final_state, "rng")) == case["rng"],
+            "unused_responses": llm.unused(),
+            "seconds": round(seconds, 3),
+            "baseline_seconds": case["seconds"],
+            "within_baseline": seconds <= case["seconds"] * max_slowdown + slack,
+        }
+        result["passed"] = (
+            result["events_identical"]
+            and result["winner_matches"]
+            and result["rounds_match"]
+            and result["rng_matches"]
+            and result["unused_responses"] == 0
+            and result["within_baseline"]
+        )
+        results.append(result)
+    return results
+
+
+__all__ = ["MANIFEST", "rng_digest", "load_manifest", "record_golden", "check_golden"]
@@ -1,19 +1,27 @@
 from __future__ import annotations
 
-from typing import Dict, List, Tuple
+import inspect
+import logging
+from typing import Any, Callable, Dict, Generator, List, Tuple
 
 from langgraph.graph import END, StateGraph
 
 from .agent import TraitorsAgent
-from .game_engine import apply_murder, apply_vote, check_terminal
+from .game_engine import check_terminal, murder_consensus, suspicion_consensus
 from .logging_utils import JsonlLogger
-from .schemas import GameState, PublicMessage, validate_vote_action
+from .metrics import PHASE_SECONDS
+from .routing import routing_enabled
+from .rules import create_rules
+from .scheduler import AgentCall, AsyncInlineScheduler, InlineScheduler, Prefetch
+from .schemas import TRANSCRIPT_TAIL, GameState, PublicMessage, Role, validate_vote_action
+
+log = logging.getLogger(__name__)
 
 
 def _public_summary(messages: List[PublicMessage], max_chars: int = 600) -> str:
     if not messages:
         return "No public messages yet."
-    tail = messages[-6:]
+    tail = messages[-TRANSCRIPT_TAIL:]
     joined = " ".join([f"P{m.speaker_id}: {m.content}" for m in tail])
     return joined[-max_chars:]
 
@@ -21,75 +29,217 @@ def _public_summary(messages: List[PublicMessage], max_chars: int = 600) -> str:
 def _traitor_summary(messages: List[PublicMessage], max_chars: int = 400) -> str:
     if not messages:
         return "No private traitor messages yet."
-    tail = messages[-6:]
+    tail = messages[-TRANSCRIPT_TAIL:]
     joined = " ".join([f"P{m.speaker_id}: {m.content}" for m in tail])
     return joined[-max_chars:]
 
 
-def build_graph(agents: Dict[int, TraitorsAgent], logger: JsonlLogger):
-    def discussion_node(state: GameState) -> GameState:
-        print(f"Round {state.round_idx} - Discussion phase ({len(state.alive)} alive)")
+def _winner(state: GameState) -> str | None:
+    winner = check_terminal(state.alive, state.traitors & state.alive)
+    if not winner and state.round_idx >= state.config.max_rounds:
+        winner = "draw"
+    return winner
+
+
+DISCUSSION_MODES = ("legacy", "simultaneous", "sequential")
+NIGHT_MODES = ("legacy", "consensus")
+
+
+# Node bodies are generators that yield AgentCall/Prefetch requests and receive
+# the results back, so the same game logic runs under the sync and async graphs.
+Steps = Generator[Any, Any, GameState]
+
+
+def _game_steps(agents: Dict[int, TraitorsAgent], logger: JsonlLogger) -> Dict[str, Callable[[GameState], Any]]:
+    def discussion_views(state: GameState, only: List[int] | None = None) -> Dict[int, Dict[str, object]]:
         alive_ids = sorted(state.alive)
         player_names = {pid: f"P{pid}" for pid in alive_ids}
         public_summary = _public_summary(state.public_transcript)
-        for pid in alive_ids:
-            agent = agents[pid]
-            private_state = state.agent_states[pid]
-            view = agent.build_view(
+        return {
+            pid: agents[pid].build_view(
                 round_idx=state.round_idx,
                 alive_ids=alive_ids,
                 player_names=player_names,
                 public_summary=public_summary,
-                private_state=private_state,
+                private_state=state.agent_states[pid],
                 traitor_ids=sorted(state.traitors),
                 rng=state.rng,
             )
-            if state.config.condition_name != "no_memory":
-                belief_update, error = agent.update_beliefs(view)
-                normalized = {
-                    other: belief_update.scores.get(other, 0.5)
-                    for other in alive_ids
-                    if other != pid
-                }
-                private_state.suspicion_scores = normalized
-                private_state.last_rationale = belief_update.notes
-                logger.log_event(
-                    game_id=state.game_id,
-                    seed=state.config.seed,
-                    condition=state.config.condition_name,
-                    round_idx=state.round_idx,
-                    phase="belief_update",
-                    actor_id=pid,
-                    action_type="belief_update",
-                    payload={
-                        "scores": belief_update.scores,
-                        "notes": belief_update.notes,
-                        "error": error,
-                    },
-                )
-            for _ in range(state.config.discussion_turns):
-                content = agent.speak(view)
-                message = PublicMessage(
-                    round=state.round_idx,
-                    phase="discussion",
-                    speaker_id=pid,
-                    content=content,
-                )
-                state.public_transcript.append(message)
-                logger.log_event(
-                    game_id=state.game_id,
-                    seed=state.config.seed,
-                    condition=state.config.condition_name,
-                    round_idx=state.round_idx,
-                    phase="discussion",
-                    actor_id=pid,
-                    action_type="public_message",
-                    payload=message.model_dump(),
-                )
+            for pid in (alive_ids if only is None else only)
+        }
+
+    def night_views(state: GameState) -> Dict[int, Dict[str, object]]:
+        alive_traitors = sorted(state.traitors & state.alive)
+        alive_ids = sorted(state.alive)
+        player_names = {pid: f"P{pid}" for pid in alive_ids}
+        public_summary = _public_summary(state.public_transcript)
+        traitor_summary = _traitor_summary(state.traitor_private_transcript)
+        return {
+            pid: agents[pid].build_view(
+                round_idx=state.round_idx,
+                alive_ids=alive_ids,
+                player_names=player_names,
+                public_summary=public_summary,
+                private_state=state.agent_states[pid],
+                traitor_ids=alive_traitors,
+                traitor_summary=traitor_summary,
+                rng=state.rng,
+            )
+            for pid in alive_traitors
+        }
+
+    # With model routing on, each agent action's event records the model that produced it.
+    def with_model(state: GameState, pid: int, route: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        if not routing_enabled(state.config):
+            return payload
+        return {**payload, "model": agents[pid].models_used.get(route)}
+
+    def needs_belief_update(state: GameState, pid: int) -> bool:
+        if state.config.condition_name == "no_memory":
+            return False
+        if not state.config.adaptive_rounds:
+            return True
+        shift = state.agent_states[pid].belief_shift
+        return shift is None or shift >= state.config.belief_stability_epsilon
+
+    def belief_call(state: GameState, pid: int, view: Dict[str, object]) -> AgentCall:
+        return AgentCall(agents[pid], "update_beliefs", view, (state.round_idx, "belief_update", pid))
+
+    def belief_prefetch(state: GameState, views: Dict[int, Dict[str, object]]) -> Prefetch:
+        # Sequential discussion rebuilds each view just before use, so round-start
+        # views would be stale.
+        if state.config.discussion_mode == "sequential":
+            return Prefetch([])
+        return Prefetch([belief_call(state, pid, view) for pid, view in views.items() if needs_belief_update(state, pid)])
+
+    def belief_step(state: GameState, pid: int, view: Dict[str, object], skipped: List[int]) -> Steps:
+        private_state = state.agent_states[pid]
+        alive_ids = sorted(state.alive)
+        if not needs_belief_update(state, pid) and state.config.condition_name != "no_memory":
+            skipped.append(pid)
+            # Re-check a stable agent next round instead of freezing its beliefs.
+            private_state.belief_shift = None
+            private_state.suspicion_scores = {
+                other: score for other, score in private_state.suspicion_scores.items() if other in state.alive
+            }
+        elif state.config.condition_name != "no_memory":
+            belief_update, error = yield belief_call(state, pid, view)
+            normalized = {
+                other: belief_update.scores.get(other, 0.5)
+                for other in alive_ids
+                if other != pid
+            }
+            previous = private_state.suspicion_scores
+            shared = [other for other in normalized if other in previous]
+            private_state.belief_shift = (
+                max(abs(normalized[other] - previous[other]) for other in shared) if shared else None
+            )
+            private_state.suspicion_scores = normalized
+            private_state.last_rationale = belief_update.notes
+            logger.log_event(
+                game_id=state.game_id,
+                seed=state.config.seed,
+                condition=state.config.condition_name,
+                round_idx=state.round_idx,
+                phase="belief_update",
+                actor_id=pid,
+                action_type="belief_update",
+                payload=with_model(
+                    state,
+                    pid,
+                    "update_beliefs",
+                    {"scores": belief_update.scores, "notes": belief_update.notes, "error": error},
+                ),
+            )
+
+    def update_consensus(state: GameState, consensus: Tuple[int | None, float]) -> Tuple[int | None, float]:
+        if not state.config.adaptive_rounds or consensus[1] >= state.config.convergence_threshold:
+            return consensus
+        return suspicion_consensus(
+            {other: state.agent_states[other].suspicion_scores for other in sorted(state.alive)},
+            state.alive,
+        )
+
+    def converged(state: GameState, consensus: Tuple[int | None, float]) -> bool:
+        return state.config.adaptive_rounds and consensus[1] >= state.config.convergence_threshold
+
+    def post_message(state: GameState, pid: int, content: str) -> None:
+        message = {"round": state.round_idx, "phase": "discussion", "speaker_id": pid, "content": content}
+        state.public_transcript.append(PublicMessage.model_construct(**message))
+        logger.log_event(
+            game_id=state.game_id,
+            seed=state.config.seed,
+            condition=state.config.condition_name,
+            round_idx=state.round_idx,
+            phase="discussion",
+            actor_id=pid,
+            action_type="public_message",
+            payload=with_model(state, pid, "speak", message),
+        )
+
+    # legacy: every speaker sees the round-start summary, one call at a time.
+    # simultaneous: beliefs first, then each turn's speeches are generated
+    # concurrently from one snapshot of the transcript taken at the start of the turn.
+    # sequential: every belief update and speech sees all messages posted before it.
+    def discussion_node(state: GameState) -> Steps:
+        mode = state.config.discussion_mode
+        if mode not in DISCUSSION_MODES:
+            raise ValueError(f"discussion_mode must be one of {DISCUSSION_MODES}")
+        log.info(f"Round {state.round_idx} - Discussion phase ({len(state.alive)} alive)")
+        alive_ids = sorted(state.alive)
+        views = discussion_views(state)
+        yield belief_prefetch(state, views)
+        skipped_beliefs: List[int] = []
+        skipped_speakers: List[int] = []
+        consensus: Tuple[int | None, float] = (None, 0.0)
+        if mode == "simultaneous":
+            for pid in alive_ids:
+                yield from belief_step(state, pid, views[pid], skipped_beliefs)
+            consensus = update_consensus(state, consensus)
+            speakers = [] if converged(state, consensus) else alive_ids
+            skipped_speakers = [pid for pid in alive_ids if pid not in speakers]
+            for turn in range(state.config.discussion_turns):
+                snapshot = discussion_views(state, speakers)
+                calls = [
+                    AgentCall(agents[pid], "speak", snapshot[pid], (state.round_idx, "speak", turn, pid))
+                    for pid in speakers
+                ]
+                yield Prefetch(calls)
+                for call in calls:
+                    post_message(state, call.agent.id, (yield call))
+        else:
+            for pid in alive_ids:
+                view = views[pid] if mode == "legacy" else discussion_views(state, [pid])[pid]
+                yield from belief_step(state, pid, view, skipped_beliefs)
+                consensus = update_consensus(state, consensus)
+                if converged(state, consensus):
+                    skipped_speakers.append(pid)
+                    continue
+                for _ in range(state.config.discussion_turns):
+                    if mode == "sequential":
+                        view = discussion_views(state, [pid])[pid]
+                    post_message(state, pid, (yield AgentCall(agents[pid], "speak", view)))
+        if skipped_beliefs or skipped_speakers:
+            logger.log_event(
+                game_id=state.game_id,
+                seed=state.config.seed,
+                condition=state.config.condition_name,
+                round_idx=state.round_idx,
+                phase="discussion",
+                actor_id=-1,
+                action_type="skipped_work",
+                payload={
+                    "belief_updates_skipped": skipped_beliefs,
+                    "speakers_skipped": skipped_speakers,
+                    "calls_saved": len(skipped_beliefs) + len(skipped_speakers) * state.config.discussion_turns,
+                    "consensus_target": consensus[0],
+                    "consensus_share": consensus[1],
+                },
+            )
         state.phase = "discussion"
         return state
 
-    def voting_node(state: GameState) -> GameState:
+    def voting_node(state: GameState) -> Steps:
         alive_ids = sorted(state.alive)
         player_names = {pid: f"P{pid}" for pid in alive_ids}
         public_summary = _public_summary(state.public_transcript)
@@ -106,7 +256,7 @@ def build_graph(agents: Dict[int, TraitorsAgent], logger: JsonlLogger):
                 traitor_ids=sorted(state.traitors),
                 rng=state.rng,
             )
-            vote_action, error = agent.vote(view)
+            vote_action, error = yield AgentCall(agent, "vote", view)
             try:
                 validate_vote_action(vote_action, pid, state.alive)
                 target = vote_action.target_id
@@ -122,21 +272,23 @@ def build_graph(agents: Dict[int, TraitorsAgent], logger: JsonlLogger):
                 phase="voting",
                 actor_id=pid,
                 action_type="vote",
-                payload={
-                    "target_id": target,
-                    "rationale": vote_action.rationale,
-                    "error": error,
-                },
+                payload=with_model(
+                    state,
+                    pid,
+                    "vote",
+                    {"target_id": target, "rationale": vote_action.rationale, "error": error},
+                ),
             )
         state.vote_history.append({"round": state.round_idx, "votes": votes})
         state.phase = "voting"
         return state
 
-    def banish_node(state: GameState) -> GameState:
+    def banish_node(state: GameState) -> Steps:
+        rules = create_rules(state.config)
         votes = state.vote_history[-1]["votes"] if state.vote_history else {}
-        eliminated, tie_info = apply_vote(state.alive, votes, state.rng)
-        if eliminated is None and tie_info.get("tied"):
-            tied = sorted(tie_info["tied"])
+        eliminated, tie_info = rules.resolve_banish(state.alive, votes, state.rng)
+        tied = rules.revote_candidates(eliminated, tie_info)
+        if tied:
             revote: Dict[int, int] = {}
             for pid in sorted(state.alive):
                 agent = agents[pid]
@@ -152,7 +304,7 @@ def build_graph(agents: Dict[int, TraitorsAgent], logger: JsonlLogger):
                     allowed_targets=tied,
                     rng=state.rng,
                 )
-                action, error = agent.vote(view)
+                action, error = yield AgentCall(agent, "vote", view)
                 target = action.target_id
                 if target not in tied or target == pid:
                     choices = [cid for cid in tied if cid != pid]
@@ -166,17 +318,16 @@ def build_graph(agents: Dict[int, TraitorsAgent], logger: JsonlLogger):
                     phase="revote",
                     actor_id=pid,
                     action_type="vote",
-                    payload={"target_id": target, "rationale": action.rationale, "error": error},
+                    payload=with_model(
+                        state, pid, "vote", {"target_id": target, "rationale": action.rationale, "error": error}
+                    ),
                 )
-            eliminated, tie_info = apply_vote(state.alive, revote, state.rng)
-            if eliminated is None:
-                eliminated = state.rng.choice(tied)
-                tie_info["random"] = True
+            eliminated, tie_info = rules.resolve_revote(state.alive, revote, tied, state.rng)
         if eliminated is not None:
             state.alive.remove(eliminated)
             state.eliminated_order.append(eliminated)
             role = state.roles[eliminated].value
-            print(f"   ⚖️  Banished: P{eliminated} ({role})")
+            log.info(f"   ⚖️  Banished: P{eliminated} ({role})")
         logger.log_event(
             game_id=state.game_id,
             seed=state.config.seed,
@@ -187,39 +338,28 @@ def build_graph(agents: Dict[int, TraitorsAgent], logger: JsonlLogger):
             action_type="banish_result",
             payload={"eliminated": eliminated, "tie_info": tie_info},
         )
+        if not _winner(state):
+            # Traitor chat only depends on state that is final once the banish resolves.
+            yield Prefetch([traitor_chat_call(state, pid, view) for pid, view in night_views(state).items()])
         state.phase = "post_banish"
         return state
 
-    def traitor_chat_node(state: GameState) -> GameState:
+    def traitor_chat_call(state: GameState, pid: int, view: Dict[str, object]) -> AgentCall:
+        return AgentCall(agents[pid], "traitor_chat", view, (state.round_idx, "traitor_chat", pid))
+
+    def traitor_chat_node(state: GameState) -> Steps:
         if not state.traitors:
             state.phase = "traitor_chat"
             return state
-        alive_traitors = sorted(state.traitors & state.alive)
-        alive_ids = sorted(state.alive)
-        player_names = {pid: f"P{pid}" for pid in alive_ids}
-        public_summary = _public_summary(state.public_transcript)
-        traitor_summary = _traitor_summary(state.traitor_private_transcript)
-        for pid in alive_traitors:
-            agent = agents[pid]
-            private_state = state.agent_states[pid]
-            view = agent.build_view(
-                round_idx=state.round_idx,
-                alive_ids=alive_ids,
-                player_names=player_names,
-                public_summary=public_summary,
-                private_state=private_state,
-                traitor_ids=alive_traitors,
-                traitor_summary=traitor_summary,
-                rng=state.rng,
-            )
-            content = agent.traitor_chat(view)
-            message = PublicMessage(
-                round=state.round_idx,
-                phase="traitor_chat",
-                speaker_id=pid,
-                content=content,
-            )
-            state.traitor_private_transcript.append(message)
+        calls = [traitor_chat_call(state, pid, view) for pid, view in night_views(state).items()]
+        if state.config.night_mode == "consensus":
+            # Every message is written from the same chat snapshot, so they can run at once.
+            yield Prefetch(calls)
+        for call in calls:
+            pid = call.agent.id
+            content = yield call
+            message = {"round": state.round_idx, "phase": "traitor_chat", "speaker_id": pid, "content": content}
+            state.traitor_private_transcript.append(PublicMessage.model_construct(**message))
             logger.log_event(
                 game_id=state.game_id,
                 seed=state.config.seed,
@@ -228,55 +368,131 @@ def build_graph(agents: Dict[int, TraitorsAgent], logger: JsonlLogger):
                 phase="traitor_chat",
                 actor_id=pid,
                 action_type="traitor_chat",
-                payload=message.model_dump(),
+                payload=with_model(state, pid, "traitor_chat", message),
             )
         state.phase = "traitor_chat"
         return state
 
-    def murder_node(state: GameState) -> GameState:
+    def murder_node(state: GameState) -> Steps:
         if not state.traitors:
             state.phase = "post_murder"
             return state
-        alive_traitors = sorted(state.traitors & state.alive)
+        rules = create_rules(state.config)
         alive_ids = sorted(state.alive)
-        player_names = {pid: f"P{pid}" for pid in alive_ids}
-        public_summary = _public_summary(state.public_transcript)
-        traitor_summary = _traitor_summary(state.traitor_private_transcript)
+        votes = state.vote_history[-1]["votes"] if state.vote_history else {}
+        shielded = rules.shielded(state.alive, state.traitors, votes)
+        mode = state.config.night_mode
+        if mode not in NIGHT_MODES:
+            raise ValueError(f"night_mode must be one of {NIGHT_MODES}")
+        views = night_views(state)
         murder_votes: Dict[int, int] = {}
-        for pid in alive_traitors:
-            agent = agents[pid]
-            private_state = state.agent_states[pid]
-            view = agent.build_view(
-                round_idx=state.round_idx,
-                alive_ids=alive_ids,
-                player_names=player_names,
-                public_summary=public_summary,
-                private_state=private_state,
-                traitor_ids=alive_traitors,
-                traitor_summary=traitor_summary,
-                rng=state.rng,
+        consensus = None
+        if mode == "consensus":
+            consensus = murder_consensus(
+                {pid: state.agent_states[pid].suspicion_scores for pid in views},
+                list(views),
+                state.alive - state.traitors - shielded,
             )
-            action, error = agent.choose_murder(view)
+        if consensus is not None:
+            # Every traitor already ranks the same target first: one call decides for all.
+            spokesperson = min(views)
+            view = {**views[spokesperson], "proposed_target": consensus}
+            action, error = yield AgentCall(agents[spokesperson], "choose_joint_murder", view)
             target = action.target_id
-            if target in state.traitors or target not in state.alive or target == pid:
-                candidates = [cid for cid in alive_ids if cid not in state.traitors]
-                target = state.rng.choice(candidates)
-            murder_votes[pid] = target
+            if target in state.traitors or target not in state.alive or target in shielded:
+                target = consensus
+            murder_votes = {pid: target for pid in views}
             logger.log_event(
                 game_id=state.game_id,
                 seed=state.config.seed,
                 condition=state.config.condition_name,
                 round_idx=state.round_idx,
                 phase="murder",
-                actor_id=pid,
+                actor_id=spokesperson,
                 action_type="murder",
-                payload={"target_id": target, "rationale": action.rationale, "error": error},
+                payload=with_model(
+                    state,
+                    spokesperson,
+                    "choose_joint_murder",
+                    {
+                        "target_id": target,
+                        "rationale": action.rationale,
+                        "error": error,
+                        "joint": True,
+                        "traitors": list(views),
+                    },
+                ),
             )
-        eliminated = apply_murder(state.alive, state.traitors, murder_votes, state.rng)
-        if eliminated is not None:
-            state.alive.remove(eliminated)
-            state.eliminated_order.append(eliminated)
-            print(f"   🔪 Murdered: P{eliminated} (faithful)")
+        if consensus is None:
+            for pid, view in views.items():
+                action, error = yield AgentCall(agents[pid], "choose_murder", view)
+                target = action.target_id
+                if target in state.traitors or target not in state.alive or target == pid or target in shielded:
+                    candidates = [cid for cid in alive_ids if cid not in state.traitors and cid not in shielded]
+                    target = state.rng.choice(candidates) if candidates else None
+                murder_votes[pid] = target
+                logger.log_event(
+                    game_id=state.game_id,
+                    seed=state.config.seed,
+                    condition=state.config.condition_name,
+                    round_idx=state.round_idx,
+                    phase="murder",
+                    actor_id=pid,
+                    action_type="murder",
+                    payload=with_model(
+                        state,
+                        pid,
+                        "choose_murder",
+                        {"target_id": target, "rationale": action.rationale, "error": error},
+                    ),
+                )
+        if mode == "consensus":
+            logger.log_event(
+                game_id=state.game_id,
+                seed=state.config.seed,
+                condition=state.config.condition_name,
+                round_idx=state.round_idx,
+                phase="murder",
+                actor_id=-1,
+                action_type="murder_decision",
+                payload={
+                    "path": "individual" if consensus is None else "joint",
+                    "consensus_target": consensus,
+                    "calls": len(views) if consensus is None else 1,
+                    "calls_saved": 0 if consensus is None else len(views) - 1,
+                },
+            )
+        victims = rules.resolve_murder(state.alive, state.traitors, murder_votes, state.rng, shielded)
+        if victims and rules.recruits(state.alive, state.traitors):
+            # The night's first target joins the traitors instead of dying.
+            recruit, victims = victims[0], victims[1:]
+            state.traitors.add(recruit)
+            state.roles[recruit] = Role.traitor
+            agents[recruit].role = Role.traitor.value
+            log.info(f"   🤝 Recruited: P{recruit}")
+            logger.log_event(
+                game_id=state.game_id,
+                seed=state.config.seed,
+                condition=state.config.condition_name,
+                round_idx=state.round_idx,
+                phase="murder",
+                actor_id=recruit,
+                action_type="recruit_result",
+                payload={"recruited": recruit},
+            )
+            if not victims:
+                state.phase = "post_murder"
+                return state
+        for victim in victims:
+            state.alive.remove(victim)
+            state.eliminated_order.append(victim)
+            log.info(f"   🔪 Murdered: P{victim} (faithful)")
+        eliminated = victims[0] if victims else None
+        payload: Dict[str, Any] = {"eliminated": eliminated}
+        if rules.murders_per_night > 1:
+            payload["also_eliminated"] = victims[1:]
+        if rules.shields:
+            payload["shielded"] = sorted(shielded)
         logger.log_event(
             game_id=state.game_id,
             seed=state.config.seed,
@@ -285,15 +501,13 @@ def build_graph(agents: Dict[int, TraitorsAgent], logger: JsonlLogger):
             phase="murder",
             actor_id=eliminated or -1,
             action_type="murder_result",
-            payload={"eliminated": eliminated},
+            payload=payload,
         )
         state.phase = "post_murder"
         return state
 
     def terminal_check_node(state: GameState) -> GameState:
-        winner = check_terminal(state.alive, state.traitors & state.alive)
-        if not winner and state.round_idx >= state.config.max_rounds:
-            winner = "draw"
+        winner = _winner(state)
         if winner:
             state.winner = winner
             logger.log_event(
@@ -308,38 +522,101 @@ def build_graph(agents: Dict[int, TraitorsAgent], logger: JsonlLogger):
             )
         return state
 
-    def route_after_terminal(state: GameState) -> str:
-        if state.winner:
-            return END
-        if state.phase == "post_banish":
-            return "traitor_chat"
-        if state.phase == "post_murder":
-            return "post_murder_update"
-        return "discussion"
-
-    def post_murder_update(state: GameState) -> GameState:
+    def post_murder_update(state: GameState) -> Steps:
         public_summary = _public_summary(state.public_transcript)
         for pid in state.alive:
             agents[pid].update_memory_after_round(state.agent_states[pid], public_summary)
         state.round_idx += 1
+        yield belief_prefetch(state, discussion_views(state))
         return state
 
+    return {
+        "discussion": discussion_node,
+        "voting": voting_node,
+        "banish": banish_node,
+        "terminal_check": terminal_check_node,
+        "traitor_chat": traitor_chat_node,
+        "murder": murder_node,
+        "post_murder_update": post_murder_update,
+    }
+
+
+def _route_after_terminal(state: GameState) -> str:
+    if state.winner:
+        return END
+    if state.phase == "post_banish":
+        return "traitor_chat"
+    if state.phase == "post_murder":
+        return "post_murder_update"
+    return "discussion"
+
+
+def _compile(nodes: Dict[str, Callable]):
     graph = StateGraph(GameState)
-    graph.add_node("discussion", discussion_node)
-    graph.add_node("voting", voting_node)
-    graph.add_node("banish", banish_node)
-    graph.add_node("terminal_check", terminal_check_node)
-    graph.add_node("traitor_chat", traitor_chat_node)
-    graph.add_node("murder", murder_node)
-    graph.add_node("post_murder_update", post_murder_update)
+    for name, node in nodes.items():
+        graph.add_node(name, node)
 
     graph.set_entry_point("discussion")
     graph.add_edge("discussion", "voting")
     graph.add_edge("voting", "banish")
     graph.add_edge("banish", "terminal_check")
-    graph.add_conditional_edges("terminal_check", route_after_terminal)
+    graph.add_conditional_edges("terminal_check", _route_after_terminal)
     graph.add_edge("traitor_chat", "murder")
     graph.add_edge("murder", "terminal_check")
     graph.add_edge("post_murder_update", "discussion")
 
     return graph.compile()
+
+
+def _drive(steps: Steps | GameState, scheduler: InlineScheduler) -> GameState:
+    if not inspect.isgenerator(steps):
+        return steps
+    try:
+        request = next(steps)
+        while True:
+            request = steps.send(scheduler.resolve(request))
+    except StopIteration as stop:
+        return stop.value
+
+
+async def _adrive(steps: Steps | GameState, scheduler: AsyncInlineScheduler) -> GameState:
+    if not inspect.isgenerator(steps):
+        return steps
+    try:
+        request = next(steps)
+        while True:
+            request = steps.send(await scheduler.aresolve(request))
+    except StopIteration as stop:
+        return stop.value
+
+
+def build_graph(agents: Dict[int, TraitorsAgent], logger: JsonlLogger, scheduler: InlineScheduler | None = None):
+    scheduler = scheduler or InlineScheduler()
+
+    def sync_node(name: str, steps_fn: Callable[[GameState], Any]) -> Callable[[GameState], GameState]:
+        def node(state: GameState) -> GameState:
+            with PHASE_SECONDS.time(phase=name):
+                return _drive(steps_fn(state), scheduler)
+
+        return node
+
+    steps = _game_steps(agents, logger)
+    return _compile({name: sync_node(name, fn) for name, fn in steps.items()})
+
+
+def build_async_graph(
+    agents: Dict[int, TraitorsAgent],
+    logger: JsonlLogger,
+    scheduler: AsyncInlineScheduler | None = None,
+):
+    scheduler = scheduler or AsyncInlineScheduler()
+
+    def async_node(name: str, steps_fn: Callable[[GameState], Any]):
+        async def node(state: GameState) -> GameState:
+            with PHASE_SECONDS.time(phase=name):
+                return await _adrive(steps_fn(state), scheduler)
+
+        return node
+
+    steps = _game_steps(agents, logger)
+    return _compile({name: async_node(name, fn) for name, fn in steps.items()})
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import csv
+import itertools
+import logging
+import os
+import re
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional, Set, Union
+
+from pydantic import BaseModel, Field
+
+from .analysis import precision_reached
+from .game_engine import config_hash, generate_game_id
+from .logging_utils import append_table_row
+from .schemas import GameConfig
+
+log = logging.getLogger(__name__)
+
+SUMMARY_FIELDS = [
+    "job_key",
+    "config_hash",
+    "game_id",
+    "seed",
+    "condition",
+    "model_name",
+    "temperature",
+    "n_players",
+    "n_traitors",
+    "winner",
+    "rounds",
+    "traitor_win",
+    "faithful_win",
+]
+
+
+class TableSize(BaseModel):
+    n_players: int
+    n_traitors: int
+
+
+class GridSpec(BaseModel):
+    conditions: List[str] = Field(default_factory=lambda: ["baseline_memory"])
+    models: List[str] = Field(default_factory=lambda: ["gpt-4o-mini"])
+    temperatures: List[float] = Field(default_factory=lambda: [0.3])
+    table_sizes: List[TableSize] = Field(default_factory=lambda: [TableSize(n_players=9, n_traitors=2)])
+    seeds: Union[str, List[int]] = "1..5"
+    base: Dict[str, Any] = Field(default_factory=dict)
+    workers: int = 4
+    requests_per_second: Optional[float] = None
+    target_precision: Optional[float] = None
+    min_games: int = 10
+
+
+def parse_seeds(seed_arg: Union[str, List[int]]) -> List[int]:
+    if isinstance(seed_arg, list):
+        return [int(seed) for seed in seed_arg]
+    if ".." in seed_arg:
+        start, end = seed_arg.split("..")
+        return list(range(int(start), int(end) + 1))
+    return [int(seed_arg)]
+
+
+def load_grid_spec(path: str) -> GridSpec:
+    if path.endswith(".toml"):
+        import tomllib
+
+        with open(path, "rb") as handle:
+            return GridSpec.model_validate(tomllib.load(handle))
+    if path.endswith((".yaml", ".yml")):
+        try:
+            import yaml  # type: ignore
+        except ImportError as exc:
+            raise RuntimeError("YAML grid specs require PyYAML; use a .toml spec instead") from exc
+        with open(path, "r", encoding="utf-8") as handle:
+            return GridSpec.model_validate(yaml.safe_load(handle))
+    raise ValueError("Grid spec must be a .toml, .yaml or .yml file")
+
+
+def expand_grid(spec: GridSpec) -> List[GameConfig]:
+    configs = []
+    # Seeds vary slowest so every cell makes progress together.
+    for seed, condition, model_name, temperature, table in itertools.product(
+        parse_seeds(spec.seeds), spec.conditions, spec.models, spec.temperatures, spec.table_sizes
+    ):
+        configs.append(
+            GameConfig(
+                **{
+                    **spec.base,
+                    "seed": seed,
+                    "condition_name": condition,
+                    "model_name": model_name,
+                    "temperature": temperature,
+                    "n_players": table.n_players,
+                    "n_traitors": table.n_traitors,
+                }
+            )
+        )
+    return configs
+
+
+def job_key(config: GameConfig) -> str:
+    return f"{generate_game_id(config.seed, config.condition_name)}-{config_hash(config)}"
+
+
+def cell_key(config: GameConfig) -> str:
+    return config_hash(config.model_copy(update={"seed": 0}))
+
+
+def partition_dir(outdir: str, config: GameConfig) -> str:
+    model = re.sub(r"[^A-Za-z0-9._-]", "_", config.model_name)
+    return os.path.join(
+        outdir,
+        f"condition={config.condition_name}",
+        f"model={model}",
+        f"temperature={config.temperature}",
+        f"table={config.n_players}x{config.n_traitors}",
+    )
+
+
+def completed_jobs(summary_path: str) -> Dict[str, Dict[str, Any]]:
+    if not os.path.exists(summary_path):
+        return {}
+    with open(summary_path, "r", newline="", encoding="utf-8") as handle:
+        return {row["job_key"]: row for row in csv.DictReader(handle)}
+
+
+class SummaryTable:
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def append(self, row: Dict[str, Any]) -> None:
+        append_table_row(self.path, SUMMARY_FIELDS, row)
+
+
+def run_grid(
+    spec: GridSpec,
+    outdir: str,
+    run_game: Callable[[GameConfig, str], Optional[Dict[str, Any]]],
+) -> str:
+    os.makedirs(outdir, exist_ok=True)
+    summary_path = os.path.join(outdir, "grid_summary.csv")
+    done = completed_jobs(summary_path)
+    configs = expand_grid(spec)
+    cell_rows: Dict[str, List[Dict[str, Any]]] = {}
+    for config in configs:
+        if job_key(config) in done:
+            cell_rows.setdefault(cell_key(config), []).append(done[job_key(config)])
+    queue = [config for config in configs if job_key(config) not in done]
+    log.info(f"Grid: {len(queue)} jobs to run, {len(done)} already complete")
+    table = SummaryTable(summary_path)
+    lock = threading.Lock()
+    converged: Set[str] = set()
+
+    def cell_converged(cell: str) -> bool:
+        if spec.target_precision is None:
+            return False
+        if cell not in converged and precision_reached(cell_rows.get(cell, []), spec.target_precision, spec.min_games):
+            converged.add(cell)
+            log.info(f"Grid: cell {cell} reached target precision after {len(cell_rows[cell])} games")
+        return cell in converged
+
+    def run_job(config: GameConfig) -> None:
+        row = run_game(config, partition_dir(outdir, config))
+        if row is None:
+            # Failed jobs are not recorded, so the next run of the grid retries them.
+            return
+        table.append({**row, "job_key": job_key(config), "config_hash": config_hash(config)})
+        with lock:
+            cell_rows.setdefault(cell_key(config), []).append(row)
+
+    # Jobs are pulled lazily so workers move on to other cells once one converges.
+    pending = iter(queue)
+    skipped = 0
+
+    def next_job() -> Optional[GameConfig]:
+        nonlocal skipped
+        for config in pending:
+            with lock:
+                if not cell_converged(cell_key(config)):
+                    return config
+            skipped += 1
+        return None
+
+    workers = max(1, spec.workers)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        in_flight: Set[Future] = set()
+        for _ in range(workers):
+            config = next_job()
+            if config is None:
+                break
+            in_flight.add(pool.submit(run_job, config))
+        while in_flight:
+            finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in finished:
+                future.result()
+                config = next_job()
+                if config is not None:
+                    in_flight.add(pool.submit(run_job, config))
+    if skipped:
+        log.info(f"Grid: skipped {skipped} jobs in cells that reached target precision")
+    return summary_path
+
+
+__all__ = [
+    "GridSpec",
+    "TableSize",
+    "parse_seeds",
+    "load_grid_spec",
+    "expand_grid",
+    "job_key",
+    "cell_key",
+    "partition_dir",
+    "completed_jobs",
+    "SummaryTable",
+    "run_grid",
+]
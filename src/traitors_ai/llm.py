@@ -0,0 +1,293 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import threading
+import time
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Dict, List, Optional
+
+from langchain_core.messages import AIMessage
+
+from .metrics import (
+    LLM_CALLS,
+    LLM_ERRORS,
+    LLM_IN_FLIGHT,
+    LLM_LATENCY,
+    LLM_RETRIES,
+    LLM_TOKENS,
+    ROUTE_COST,
+    ROUTE_LATENCY,
+)
+from .routing import call_cost
+
+
+class RateLimiter:
+    def __init__(self, requests_per_second: float, burst: int = 1) -> None:
+        if requests_per_second <= 0:
+            raise ValueError("requests_per_second must be positive")
+        self.rate = requests_per_second
+        self.capacity = max(1, burst)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1.0
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def aacquire(self) -> None:
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class RateLimitedLLM:
+    def __init__(self, llm, limiter: RateLimiter) -> None:
+        self.llm = llm
+        self.limiter = limiter
+        self.supports_json_schema = getattr(llm, "supports_json_schema", False)
+
+    def invoke(self, prompt, **kwargs):
+        self.limiter.acquire()
+        return self.llm.invoke(prompt, **kwargs)
+
+    async def ainvoke(self, prompt, **kwargs):
+        await self.limiter.aacquire()
+        return await self.llm.ainvoke(prompt, **kwargs)
+
+
+class LLMCallError(RuntimeError):
+    def __init__(self, message: str, transient: bool) -> None:
+        super().__init__(message)
+        self.transient = transient
+
+
+class LLMTimeoutError(LLMCallError):
+    def __init__(self, message: str) -> None:
+        super().__init__(message, transient=True)
+
+
+class GameTimeoutError(LLMCallError):
+    def __init__(self, message: str) -> None:
+        super().__init__(message, transient=False)
+
+
+_TRANSIENT_STATUS = {408, 409, 425, 429, 500, 502, 503, 504, 529}
+_TRANSIENT_NAMES = ("Timeout", "Connection", "RateLimit", "Overloaded", "ServiceUnavailable", "InternalServer")
+
+
+def is_transient(exc: BaseException) -> bool:
+    if isinstance(exc, LLMCallError):
+        return exc.transient
+    if isinstance(exc, (TimeoutError, ConnectionError, asyncio.TimeoutError)):
+        return True
+    status = getattr(exc, "status_code", None) or getattr(getattr(exc, "response", None), "status_code", None)
+    if status is not None:
+        return status in _TRANSIENT_STATUS
+    return any(name in type(exc).__name__ for name in _TRANSIENT_NAMES)
+
+
+def _call_with_timeout(fn, timeout: Optional[float]):
+    if timeout is None:
+        return fn()
+    # A daemon thread per call, so a hung request can be abandoned without
+    # blocking interpreter exit or starving a shared pool.
+    future: Future = Future()
+
+    def target() -> None:
+        try:
+            future.set_result(fn())
+        except BaseException as exc:  # noqa: BLE001
+            future.set_exception(exc)
+
+    threading.Thread(target=target, name="traitors-llm-call", daemon=True).start()
+    try:
+        return future.result(timeout=timeout)
+    except FutureTimeoutError:
+        raise LLMTimeoutError(f"LLM call timed out after {timeout}s") from None
+
+
+# Wraps one game's client: per-call timeout, bounded retries of transient errors
+# with jittered exponential backoff, and an overall deadline for the game.
+class ResilientLLM:
+    def __init__(
+        self,
+        llm,
+        timeout: Optional[float] = 120.0,
+        retries: int = 2,
+        backoff: float = 1.0,
+        game_timeout: Optional[float] = None,
+    ) -> None:
+        self.llm = llm
+        self.timeout = timeout
+        self.retries = max(0, retries)
+        self.backoff = backoff
+        self.deadline = time.monotonic() + game_timeout if game_timeout else None
+        self.supports_json_schema = getattr(llm, "supports_json_schema", False)
+        self._jitter = random.Random()
+
+    def _remaining(self) -> Optional[float]:
+        if self.deadline is None:
+            return self.timeout
+        remaining = self.deadline - time.monotonic()
+        if remaining <= 0:
+            raise GameTimeoutError("Game exceeded its time budget")
+        return remaining if self.timeout is None else min(self.timeout, remaining)
+
+    def _delay(self, attempt: int) -> float:
+        return self.backoff * (2**attempt) * (0.5 + self._jitter.random())
+
+    def invoke(self, prompt, **kwargs):
+        for attempt in range(self.retries + 1):
+            try:
+                return _call_with_timeout(lambda: self.llm.invoke(prompt, **kwargs), self._remaining())
+            except GameTimeoutError:
+                raise
+            except Exception as exc:  # noqa: BLE001
+                if not is_transient(exc) or attempt == self.retries:
+                    raise
+                LLM_RETRIES.inc()
+                time.sleep(self._delay(attempt))
+
+    async def ainvoke(self, prompt, **kwargs):
+        for attempt in range(self.retries + 1):
+            try:
+                timeout = self._remaining()
+                if hasattr(self.llm, "ainvoke"):
+                    call = self.llm.ainvoke(prompt, **kwargs)
+                else:
+                    call = asyncio.to_thread(self.llm.invoke, prompt, **kwargs)
+                try:
+                    return await asyncio.wait_for(call, timeout)
+                except asyncio.TimeoutError:
+                    raise LLMTimeoutError(f"LLM call timed out after {timeout}s") from None
+            except GameTimeoutError:
+                raise
+            except Exception as exc:  # noqa: BLE001
+                if not is_transient(exc) or attempt == self.retries:
+                    raise
+                LLM_RETRIES.inc()
+                await asyncio.sleep(self._delay(attempt))
+
+
+_ROUTE_TOTALS = {"calls": 0, "errors": 0, "seconds": 0.0, "input_tokens": 0, "output_tokens": 0, "cost_usd": 0.0}
+
+
+# Counts every attempt separately, so wrap it inside ResilientLLM. Besides the
+# process-wide metrics it keeps this game's own totals for the summary record,
+# and per-route totals for calls that name a route and model (see routing.py).
+class InstrumentedLLM:
+    def __init__(self, llm, model_name: str, prices: Optional[Dict[str, List[float]]] = None) -> None:
+        self.llm = llm
+        self.model_name = model_name
+        self.prices = prices or {}
+        self.supports_json_schema = getattr(llm, "supports_json_schema", False)
+        self._usage = {"llm_calls": 0, "llm_errors": 0, "input_tokens": 0, "output_tokens": 0}
+        self._routes: Dict[str, Dict[str, Dict[str, float]]] = {}
+        self._lock = threading.Lock()
+
+    def _count(self, route: Optional[str] = None, model: Optional[str] = None, **amounts: float) -> None:
+        with self._lock:
+            for key, amount in amounts.items():
+                if key in self._usage:
+                    self._usage[key] += amount
+            if route is not None:
+                totals = self._routes.setdefault(route, {}).setdefault(model, dict(_ROUTE_TOTALS))
+                for key, amount in amounts.items():
+                    totals[key.replace("llm_", "")] += amount
+
+    def usage(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._usage)
+
+    def route_usage(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        with self._lock:
+            return {
+                route: {model: dict(totals) for model, totals in models.items()}
+                for route, models in self._routes.items()
+            }
+
+    def _started(self, route: Optional[str], model: str) -> None:
+        LLM_CALLS.inc(model=model)
+        LLM_IN_FLIGHT.inc()
+        self._count(route, model, llm_calls=1)
+
+    def _failed(self, exc: BaseException, route: Optional[str], model: str) -> None:
+        LLM_ERRORS.inc(model=model, transient=str(is_transient(exc)).lower())
+        self._count(route, model, llm_errors=1)
+
+    def _finished(self, route: Optional[str], model: str, seconds: float) -> None:
+        LLM_IN_FLIGHT.dec()
+        if route is not None:
+            ROUTE_LATENCY.observe(seconds, route=route, model=model)
+            self._count(route, model, seconds=seconds)
+
+    def _record_usage(self, response, route: Optional[str], model: str) -> None:
+        usage = getattr(response, "usage_metadata", None) if isinstance(response, AIMessage) else None
+        if usage:
+            input_tokens, output_tokens = usage.get("input_tokens", 0), usage.get("output_tokens", 0)
+            LLM_TOKENS.inc(input_tokens, model=model, kind="input")
+            LLM_TOKENS.inc(output_tokens, model=model, kind="output")
+            self._count(route, model, input_tokens=input_tokens, output_tokens=output_tokens)
+            if route is not None:
+                cost = call_cost(self.prices, model, input_tokens, output_tokens)
+                ROUTE_COST.inc(cost, route=route, model=model)
+                self._count(route, model, cost_usd=cost)
+
+    def invoke(self, prompt, **kwargs):
+        route, model = kwargs.get("route"), kwargs.get("model") or self.model_name
+        self._started(route, model)
+        start = time.perf_counter()
+        try:
+            with LLM_LATENCY.time(model=model):
+                response = self.llm.invoke(prompt, **kwargs)
+        except Exception as exc:
+            self._failed(exc, route, model)
+            raise
+        finally:
+            self._finished(route, model, time.perf_counter() - start)
+        self._record_usage(response, route, model)
+        return response
+
+    async def ainvoke(self, prompt, **kwargs):
+        route, model = kwargs.get("route"), kwargs.get("model") or self.model_name
+        self._started(route, model)
+        start = time.perf_counter()
+        try:
+            with LLM_LATENCY.time(model=model):
+                if hasattr(self.llm, "ainvoke"):
+                    response = await self.llm.ainvoke(prompt, **kwargs)
+                else:
+                    response = await asyncio.to_thread(self.llm.invoke, prompt, **kwargs)
+        except Exception as exc:
+            self._failed(exc, route, model)
+            raise
+        finally:
+            self._finished(route, model, time.perf_counter() - start)
+        self._record_usage(response, route, model)
+        return response
+
+
+__all__ = [
+    "RateLimiter",
+    "RateLimitedLLM",
+    "LLMCallError",
+    "LLMTimeoutError",
+    "GameTimeoutError",
+    "is_transient",
+    "ResilientLLM",
+    "InstrumentedLLM",
+]
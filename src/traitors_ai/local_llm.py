@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+
+class _Request:
+    __slots__ = ("prompt", "json_schema", "future")
+
+    def __init__(self, prompt: str, json_schema: Optional[Dict[str, Any]]) -> None:
+        self.prompt = prompt
+        self.json_schema = json_schema
+        self.future: Future = Future()
+
+
+# Agents call invoke from many threads (pipelined phases, grid workers) or many
+# coroutines (concurrent games). A single worker thread collects whatever arrives
+# within batch_window_ms and sends it as one request, so the server runs one
+# forward pass over the whole batch instead of one per agent.
+class _MicroBatcher:
+    def __init__(self, send, max_batch_size: int, batch_window_ms: float) -> None:
+        self._send = send
+        self.max_batch_size = max(1, max_batch_size)
+        self.batch_window = max(0.0, batch_window_ms) / 1000.0
+        self._queue: "queue.Queue[_Request]" = queue.Queue()
+        self._worker = threading.Thread(target=self._loop, name="traitors-local-llm", daemon=True)
+        self._worker.start()
+
+    def submit(self, prompt: str, json_schema: Optional[Dict[str, Any]]) -> Future:
+        request = _Request(prompt, json_schema)
+        self._queue.put(request)
+        return request.future
+
+    def _collect(self) -> List[_Request]:
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.batch_window
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                batch.append(self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _loop(self) -> None:
+        while True:
+            batch = self._collect()
+            # Requests can only share a forward pass when they share a grammar.
+            groups: Dict[str, List[_Request]] = {}
+            for request in batch:
+                groups.setdefault(json.dumps(request.json_schema, sort_keys=True), []).append(request)
+            for requests in groups.values():
+                try:
+                    texts = self._send([request.prompt for request in requests], requests[0].json_schema)
+                except Exception as exc:  # noqa: BLE001
+                    for request in requests:
+                        request.future.set_exception(exc)
+                    continue
+                for request, text in zip(requests, texts):
+                    request.future.set_result(text)
+
+
+# Any OpenAI-compatible completions server works: llama.cpp server, vLLM, Ollama.
+class LocalLLM:
+    supports_json_schema = True
+
+    def __init__(
+        self,
+        model: str,
+        temperature: float,
+        base_url: str = "http://127.0.0.1:8080/v1",
+        max_tokens: int = 512,
+        max_batch_size: int = 8,
+        batch_window_ms: float = 10.0,
+        timeout: float = 120.0,
+        http_client: Optional[httpx.Client] = None,
+    ) -> None:
+        self.model = model
+        self.temperature = temperature
+        self.max_tokens = max_tokens
+        self._client = http_client or httpx.Client(base_url=base_url, timeout=timeout)
+        self._batcher = _MicroBatcher(self._complete, max_batch_size, batch_window_ms)
+
+    def _complete(self, prompts: List[str], json_schema: Optional[Dict[str, Any]]) -> List[str]:
+        body: Dict[str, Any] = {
+            "model": self.model,
+            "prompt": prompts,
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens,
+        }
+        if json_schema is not None:
+            body["response_format"] = {
+                "type": "json_schema",
+                "json_schema": {"name": json_schema.get("title", "response"), "schema": json_schema},
+            }
+        response = self._client.post("/completions", json=body)
+        response.raise_for_status()
+        choices = sorted(response.json()["choices"], key=lambda choice: choice.get("index", 0))
+        if len(choices) != len(prompts):
+            raise RuntimeError(f"Local server returned {len(choices)} completions for {len(prompts)} prompts")
+        return [choice["text"] for choice in choices]
+
+    def invoke(self, prompt: str, json_schema: Optional[Dict[str, Any]] = None, **kwargs) -> str:
+        return self._batcher.submit(prompt, json_schema).result()
+
+    async def ainvoke(self, prompt: str, json_schema: Optional[Dict[str, Any]] = None, **kwargs) -> str:
+        return await asyncio.wrap_future(self._batcher.submit(prompt, json_schema))
+
+
+# In-process quantized GGUF model on CPU, for boxes without a local server.
+class LlamaCppLLM:
+    supports_json_schema = True
+
+    def __init__(self, model_path: str, temperature: float, max_tokens: int = 512, n_ctx: int = 4096) -> None:
+        try:
+            from llama_cpp import Llama, LlamaGrammar  # type: ignore
+        except ImportError as exc:
+            raise RuntimeError("LOCAL_LLM_MODEL_PATH requires llama-cpp-python (pip install -e \".[local]\")") from exc
+        self._llama = Llama(model_path=model_path, n_ctx=n_ctx, verbose=False)
+        self._grammar_from_schema = LlamaGrammar.from_json_schema
+        self._grammars: Dict[str, Any] = {}
+        self.temperature = temperature
+        self.max_tokens = max_tokens
+        # llama.cpp contexts are not thread-safe.
+        self._lock = threading.Lock()
+
+    def _grammar(self, json_schema: Dict[str, Any]):
+        key = json.dumps(json_schema, sort_keys=True)
+        if key not in self._grammars:
+            self._grammars[key] = self._grammar_from_schema(key)
+        return self._grammars[key]
+
+    def invoke(self, prompt: str, json_schema: Optional[Dict[str, Any]] = None, **kwargs) -> str:
+        grammar = self._grammar(json_schema) if json_schema is not None else None
+        with self._lock:
+            output = self._llama.create_completion(
+                prompt, temperature=self.temperature, max_tokens=self.max_tokens, grammar=grammar
+            )
+        return output["choices"][0]["text"]
+
+    async def ainvoke(self, prompt: str, json_schema: Optional[Dict[str, Any]] = None, **kwargs) -> str:
+        return await asyncio.to_thread(self.invoke, prompt, json_schema)
+
+
+__all__ = ["LocalLLM", "LlamaCppLLM"]
@@ -1,24 +1,160 @@
 from __future__ import annotations
 
+import csv
 import json
 import os
-from typing import Any, Dict, Optional
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
 
-from .schemas import EventLogRow, GameState
+from .schemas import EventLogRow, GameConfig, GameState, GameSummary, PublicMessage, Transcript
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+GAME_SUMMARY_FIELDS = list(GameSummary.model_fields)
+_TABLE_LOCK = threading.Lock()
+
+
+# Event rows are built by the engine from already-validated data, so they are
+# serialised straight from a dict. The output matches EventLogRow.model_dump_json().
+def dumps_event(row: Dict[str, Any]) -> str:
+    if orjson is not None:
+        return orjson.dumps(row, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(row, ensure_ascii=False, separators=(",", ":"))
+
+
+class BeliefDeltaEncoder:
+    def __init__(self, keyframe_interval: int = 5) -> None:
+        self.keyframe_interval = max(1, keyframe_interval)
+        self._previous: Dict[int, Dict[Any, float]] = {}
+        self._since_keyframe: Dict[int, int] = {}
+
+    def encode(self, actor_id: int, payload: Dict[str, Any]) -> Dict[str, Any]:
+        scores = dict(payload.get("scores", {}))
+        previous = self._previous.get(actor_id)
+        count = self._since_keyframe.get(actor_id, 0)
+        self._previous[actor_id] = scores
+        rest = {key: value for key, value in payload.items() if key != "scores"}
+        if previous is None or count + 1 >= self.keyframe_interval:
+            self._since_keyframe[actor_id] = 0
+            return {"scores": scores, "keyframe": True, **rest}
+        self._since_keyframe[actor_id] = count + 1
+        delta = {pid: score for pid, score in scores.items() if previous.get(pid) != score}
+        removed = [pid for pid in previous if pid not in scores]
+        return {"delta": delta, "removed": removed, "keyframe": False, **rest}
+
+
+def decode_belief_updates(events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    latest: Dict[Any, Dict[Any, float]] = {}
+    decoded = []
+    for event in events:
+        if event.get("action_type") != "belief_update":
+            decoded.append(event)
+            continue
+        payload = dict(event.get("payload", {}))
+        actor_id = event.get("actor_id")
+        if "delta" in payload:
+            scores = dict(latest.get(actor_id, {}))
+            for pid in payload.pop("removed", []):
+                scores.pop(str(pid) if str(pid) in scores else pid, None)
+            scores.update(payload.pop("delta"))
+            payload["scores"] = scores
+        latest[actor_id] = dict(payload.get("scores", {}))
+        decoded.append({**event, "payload": payload})
+    return decoded
+
+
+# Appends one row to a CSV table shared by every worker writing to it: threads in
+# this process take a lock, other processes are kept out with flock.
+def append_table_row(path: str, fieldnames: List[str], row: Dict[str, Any]) -> None:
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with _TABLE_LOCK, open(path, "a", newline="", encoding="utf-8") as handle:
+        if fcntl is not None:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+        try:
+            handle.seek(0, os.SEEK_END)
+            writer = csv.DictWriter(handle, fieldnames=fieldnames, extrasaction="ignore")
+            if handle.tell() == 0:
+                writer.writeheader()
+            writer.writerow(row)
+            handle.flush()
+        finally:
+            if fcntl is not None:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+def _table_cell(value: Any) -> Any:
+    return json.dumps(value, separators=(",", ":")) if isinstance(value, list) else value
+
+
+# The first `limit` messages of one kind a game logged, in order; this is where a
+# Transcript's spilled messages are read back from. `offset` is the byte offset
+# where this game's run starts, since a rerun appends to the same file.
+def read_messages(
+    log_path: str, action_type: str, limit: Optional[int] = None, offset: int = 0
+) -> List[PublicMessage]:
+    marker = f'"action_type":"{action_type}"'.encode("utf-8")
+    messages: List[PublicMessage] = []
+    with open(log_path, "rb") as handle:
+        handle.seek(offset)
+        for line in handle:
+            if limit is not None and len(messages) >= limit:
+                break
+            if marker in line:
+                messages.append(PublicMessage.model_construct(**json.loads(line)["payload"]))
+    return messages
+
+
+def read_events(log_path: str, decode_beliefs: bool = True) -> List[Dict[str, Any]]:
+    with open(log_path, "r", encoding="utf-8") as handle:
+        events = [json.loads(line) for line in handle if line.strip()]
+    return decode_belief_updates(events) if decode_beliefs else events
 
 
 class JsonlLogger:
-    def __init__(self, outdir: str, game_id: str) -> None:
+    def __init__(
+        self,
+        outdir: str,
+        game_id: str,
+        belief_log_mode: str = "full",
+        belief_keyframe_interval: int = 5,
+    ) -> None:
         self.outdir = outdir
         self.game_id = game_id
         os.makedirs(outdir, exist_ok=True)
         self.log_path = os.path.join(outdir, f"{game_id}.jsonl")
+        self.start_offset = os.path.getsize(self.log_path) if os.path.exists(self.log_path) else 0
         self._file = open(self.log_path, "a", encoding="utf-8")
+        if belief_log_mode not in {"full", "delta"}:
+            raise ValueError("belief_log_mode must be 'full' or 'delta'")
+        self._belief_encoder = BeliefDeltaEncoder(belief_keyframe_interval) if belief_log_mode == "delta" else None
+        # Timestamps are the wall clock at open plus monotonic elapsed time, so
+        # they never go backwards within a game.
+        self._opened_utc = datetime.now(timezone.utc)
+        self._opened_monotonic = time.monotonic()
+        self._banished: Dict[int, Optional[int]] = {}
 
-    def log(self, row: EventLogRow) -> None:
-        self._file.write(row.model_dump_json() + "\n")
+    def _timestamp(self) -> str:
+        return (self._opened_utc + timedelta(seconds=time.monotonic() - self._opened_monotonic)).isoformat()
+
+    def _write(self, line: str) -> None:
+        self._file.write(line + "\n")
         self._file.flush()
 
+    def log(self, row: EventLogRow) -> None:
+        self._write(row.model_dump_json())
+
     def log_event(
         self,
         *,
@@ -31,50 +167,86 @@ class JsonlLogger:
         action_type: str,
         payload: Dict[str, Any],
     ) -> None:
-        row = EventLogRow(
-            game_id=game_id,
-            seed=seed,
-            condition=condition,
-            round=round_idx,
-            phase=phase,
-            actor_id=actor_id,
-            action_type=action_type,
-            payload=payload,
-        )
-        self.log(row)
+        if self._belief_encoder is not None and action_type == "belief_update":
+            payload = self._belief_encoder.encode(actor_id, payload)
+        elif action_type == "banish_result":
+            self._banished[round_idx] = payload.get("eliminated")
+        row = {
+            "game_id": game_id,
+            "seed": seed,
+            "condition": condition,
+            "round": round_idx,
+            "phase": phase,
+            "actor_id": actor_id,
+            "action_type": action_type,
+            "payload": payload,
+            "timestamp_utc": self._timestamp(),
+        }
+        self._write(dumps_event(row))
 
-    def write_summary(self, state: GameState | Dict[str, Any], extra: Optional[Dict[str, Any]] = None) -> str:
+    def summary_record(self, state: GameState | Dict[str, Any], usage: Optional[Dict[str, int]] = None) -> GameSummary:
         # Handle both GameState objects and dicts (LangGraph returns dicts)
-        if isinstance(state, dict):
-            game_id = state["game_id"]
-            config = state["config"]
-            winner = state.get("winner")
-            round_idx = state["round_idx"]
-            eliminated_order = state.get("eliminated_order", [])
-            config_dict = config.model_dump() if hasattr(config, 'model_dump') else config
-        else:
-            game_id = state.game_id
-            config_dict = state.config.model_dump()
-            winner = state.winner
-            round_idx = state.round_idx
-            eliminated_order = state.eliminated_order
-            config = state.config
-        
-        summary_path = os.path.join(self.outdir, f"{game_id}_summary.json")
+        fields = state if isinstance(state, dict) else dict(state)
+        config = fields["config"]
+        if isinstance(config, dict):
+            config = GameConfig.model_validate(config)
+        roles = {int(pid): getattr(role, "value", role) for pid, role in fields["roles"].items()}
+        eliminated_order = list(fields.get("eliminated_order") or [])
+        banish_correct = []
+        for round_idx in range(1, fields["round_idx"] + 1):
+            banished = self._banished.get(round_idx)
+            banish_correct.append(None if banished is None else roles[banished] == "traitor")
+        decided = [correct for correct in banish_correct if correct is not None]
+        winner = fields.get("winner")
+        return GameSummary(
+            game_id=fields["game_id"],
+            seed=config.seed,
+            condition=config.condition_name,
+            model_name=config.model_name,
+            temperature=config.temperature,
+            n_players=config.n_players,
+            n_traitors=config.n_traitors,
+            rules=config.rules,
+            winner=winner,
+            rounds=fields["round_idx"],
+            traitor_win=winner == "traitors",
+            faithful_win=winner == "faithful",
+            eliminated_order=eliminated_order,
+            eliminated_roles=[roles[pid] for pid in eliminated_order],
+            banish_correct=banish_correct,
+            banish_accuracy=sum(decided) / len(decided) if decided else None,
+            wall_seconds=round(time.monotonic() - self._opened_monotonic, 3),
+            **(usage or {}),
+        )
+
+    def write_summary(
+        self,
+        state: GameState | Dict[str, Any],
+        extra: Optional[Dict[str, Any]] = None,
+        usage: Optional[Dict[str, int]] = None,
+        table_path: Optional[str] = None,
+    ) -> str:
+        record = self.summary_record(state, usage)
+        config = state["config"] if isinstance(state, dict) else state.config
+        summary_path = os.path.join(self.outdir, f"{record.game_id}_summary.json")
         summary = {
-            "game_id": game_id,
-            "seed": config.seed if hasattr(config, 'seed') else config_dict['seed'],
-            "condition": config.condition_name if hasattr(config, 'condition_name') else config_dict['condition_name'],
-            "winner": winner,
-            "rounds": round_idx,
-            "eliminated_order": eliminated_order,
-            "config": config_dict,
+            **record.model_dump(),
+            "config": config.model_dump() if hasattr(config, "model_dump") else config,
         }
         if extra:
             summary.update(extra)
         with open(summary_path, "w", encoding="utf-8") as handle:
             json.dump(summary, handle, indent=2)
+        if table_path:
+            row = {key: _table_cell(value) for key, value in record.model_dump().items()}
+            append_table_row(table_path, GAME_SUMMARY_FIELDS, row)
         return summary_path
 
+    def transcript(self, action_type: str, maxlen: Optional[int]) -> Transcript:
+        return Transcript(
+            maxlen=maxlen,
+            load_spilled=lambda limit: read_messages(self.log_path, action_type, limit, self.start_offset),
+        )
+
     def close(self) -> None:
         self._file.close()
@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+LabelValues = Tuple[str, ...]
+
+_LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+
+def _format_labels(names: Sequence[str], values: LabelValues, extra: str = "") -> str:
+    pairs = [f'{name}="{value}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help = help_text
+        self.label_names = tuple(labels)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, object]) -> LabelValues:
+        return tuple(str(labels.get(name, "")) for name in self.label_names)
+
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = ()) -> None:
+        super().__init__(name, help_text, labels)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: object) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: object) -> float:
+        with self._lock:
+            if labels:
+                return self._values.get(self._key(labels), 0.0)
+            return sum(self._values.values())
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return super().render() + [
+            f"{self.name}{_format_labels(self.label_names, key)} {value:g}" for key, value in items
+        ]
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def dec(self, amount: float = 1.0, **labels: object) -> None:
+        self.inc(-amount, **labels)
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self, name: str, help_text: str, labels: Sequence[str] = (), buckets: Sequence[float] = _LATENCY_BUCKETS
+    ) -> None:
+        super().__init__(name, help_text, labels)
+        self.buckets = tuple(sorted(buckets))
+        self._counts: Dict[LabelValues, List[int]] = {}
+        self._sums: Dict[LabelValues, float] = {}
+
+    def observe(self, value: float, **labels: object) -> None:
+        key = self._key(labels)
+        with self._lock:
+            counts = self._counts.setdefault(key, [0] * (len(self.buckets) + 1))
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[index] += 1
+            counts[-1] += 1
+            self._sums[key] = self._sums.get(key, 0.0) + value
+
+    @contextmanager
+    def time(self, **labels: object) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels: object) -> int:
+        with self._lock:
+            return self._counts.get(self._key(labels), [0])[-1]
+
+    def render(self) -> List[str]:
+        lines = super().render()
+        with self._lock:
+            items = sorted((key, list(counts), self._sums[key]) for key, counts in self._counts.items())
+        for key, counts, total in items:
+            for bound, count in zip([f"{bound:g}" for bound in self.buckets] + ["+Inf"], counts):
+                le = 'le="' + bound + '"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.label_names, key, le)} {count}")
+            lines.append(f"{self.name}_sum{_format_labels(self.label_names, key)} {total:g}")
+            lines.append(f"{self.name}_count{_format_labels(self.label_names, key)} {counts[-1]}")
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self, name: str, help_text: str, labels: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, help_text, labels))  # type: ignore[return-value]
+
+    def gauge(self, name: str, help_text: str, labels: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, help_text, labels))  # type: ignore[return-value]
+
+    def histogram(
+        self, name: str, help_text: str, labels: Sequence[str] = (), buckets: Sequence[float] = _LATENCY_BUCKETS
+    ) -> Histogram:
+        return self._register(Histogram(name, help_text, labels, buckets))  # type: ignore[return-value]
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = [self._metrics[name] for name in sorted(self._metrics)]
+        return "\n".join(line for metric in metrics for line in metric.render()) + "\n"
+
+    def write(self, path: str) -> None:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            handle.write(self.render())
+        os.replace(tmp_path, path)
+
+
+REGISTRY = MetricsRegistry()
+
+LLM_CALLS = REGISTRY.counter("traitors_llm_calls_total", "LLM calls attempted", ["model"])
+LLM_ERRORS = REGISTRY.counter("traitors_llm_errors_total", "LLM calls that raised", ["model", "transient"])
+LLM_RETRIES = REGISTRY.counter("traitors_llm_retries_total", "LLM calls retried after a transient error")
+LLM_IN_FLIGHT = REGISTRY.gauge("traitors_llm_calls_in_flight", "LLM calls currently waiting on the provider")
+LLM_LATENCY = REGISTRY.histogram("traitors_llm_latency_seconds", "LLM call latency", ["model"])
+LLM_TOKENS = REGISTRY.counter("traitors_llm_tokens_total", "Tokens reported by the provider", ["model", "kind"])
+GAMES_COMPLETED = REGISTRY.counter("traitors_games_completed_total", "Games finished", ["winner"])
+GAMES_FAILED = REGISTRY.counter("traitors_games_failed_total", "Games abandoned after an error")
+PHASE_SECONDS = REGISTRY.histogram("traitors_phase_seconds", "Wall time per graph node", ["phase"])
+ROUTE_LATENCY = REGISTRY.histogram(
+    "traitors_route_latency_seconds", "LLM call latency per agent method", ["route", "model"]
+)
+ROUTE_COST = REGISTRY.counter("traitors_route_cost_usd_total", "Estimated LLM spend in USD", ["route", "model"])
+
+
+def _duration(seconds: float) -> str:
+    seconds = int(seconds)
+    if seconds >= 3600:
+        return f"{seconds // 3600}h{seconds % 3600 // 60:02d}m"
+    return f"{seconds // 60}m{seconds % 60:02d}s"
+
+
+# One status line for a batch: rewritten in place on a TTY, printed every
+# `interval` seconds otherwise. Also refreshes the metrics file on each tick.
+class ProgressDisplay:
+    def __init__(
+        self,
+        total: int,
+        metrics_path: Optional[str] = None,
+        interval: float = 2.0,
+        stream=None,
+        enabled: bool = True,
+    ) -> None:
+        self.total = total
+        self.enabled = enabled
+        self.metrics_path = metrics_path
+        self.interval = interval
+        self.stream = stream or sys.stderr
+        self.tty = hasattr(self.stream, "isatty") and self.stream.isatty()
+        self._start = time.monotonic()
+        self._base_done = GAMES_COMPLETED.value() + GAMES_FAILED.value()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._loop, name="traitors-progress", daemon=True)
+
+    def status(self) -> str:
+        done = GAMES_COMPLETED.value() + GAMES_FAILED.value() - self._base_done
+        elapsed = max(time.monotonic() - self._start, 1e-9)
+        rate = done / elapsed * 60
+        calls = LLM_CALLS.value()
+        errors = LLM_ERRORS.value()
+        eta = _duration((self.total - done) / (done / elapsed)) if done else "?"
+        return (
+            f"games {int(done)}/{self.total} | {rate:.1f} games/min | "
+            f"in flight {int(LLM_IN_FLIGHT.value())} | calls {int(calls)} | "
+            f"errors {errors / calls if calls else 0.0:.1%} | failed {int(GAMES_FAILED.value())} | ETA {eta}"
+        )
+
+    def _tick(self) -> None:
+        if self.metrics_path:
+            REGISTRY.write(self.metrics_path)
+        if not self.enabled:
+            return
+        line = self.status()
+        if self.tty:
+            self.stream.write("\r\033[K" + line)
+        else:
+            self.stream.write(line + "\n")
+        self.stream.flush()
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._tick()
+
+    def __enter__(self) -> "ProgressDisplay":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stop.set()
+        self._thread.join()
+        self._tick()
+        if self.enabled and self.tty:
+            self.stream.write("\n")
+            self.stream.flush()
+
+
+__all__ = [
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsRegistry",
+    "REGISTRY",
+    "ProgressDisplay",
+]
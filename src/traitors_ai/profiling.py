@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import asyncio
+import cProfile
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+from langgraph.graph import END, StateGraph
+
+from .schemas import GameState, PublicMessage
+
+_ALIVE = re.compile(r"^Alive players: (.*)$", re.MULTILINE)
+_PLAYER = re.compile(r"P(\d+)")
+
+# Threads that only ever wait on a provider or run bookkeeping; never sampled.
+_IGNORED_THREADS = ("traitors-llm-call", "traitors-local-llm", "traitors-progress", "traitors-profiler")
+# A sample whose innermost Python frame sits in one of these is blocked, not running.
+_WAIT_MODULES = ("threading.py", "queue.py", "selectors.py")
+
+
+# Answers instantly with well-formed, deterministic responses, so a profiled game
+# spends no time waiting on a provider and every sample is game-side work.
+class StandInLLM:
+    supports_json_schema = True
+    serves_any_model = True
+
+    def __init__(self, seed: int = 0) -> None:
+        self.seed = seed
+
+    def invoke(self, prompt: str, json_schema: Optional[Dict[str, Any]] = None, **kwargs) -> str:
+        rng = random.Random(f"{self.seed}:{prompt}")
+        match = _ALIVE.search(prompt)
+        alive = [int(pid) for pid in _PLAYER.findall(match.group(1))] if match else []
+        title = (json_schema or {}).get("title", "")
+        if title == "BeliefUpdate" or "suspicion scores" in prompt:
+            return json.dumps({"scores": {str(pid): round(rng.random(), 2) for pid in alive}, "notes": "stand-in"})
+        if title in {"VoteAction", "MurderAction"} or "banish vote" in prompt or "to murder" in prompt:
+            return json.dumps({"target_id": rng.choice(alive) if alive else 1, "rationale": "stand-in"})
+        return f"Stand-in message {rng.randrange(1000)}."
+
+    async def ainvoke(self, prompt: str, json_schema: Optional[Dict[str, Any]] = None, **kwargs) -> str:
+        return self.invoke(prompt, json_schema)
+
+
+class _WaitMarkedLLM:
+    def __init__(self, llm, waiting: Set[int]) -> None:
+        self.llm = llm
+        self._waiting = waiting
+        self.supports_json_schema = getattr(llm, "supports_json_schema", False)
+
+    def invoke(self, prompt, **kwargs):
+        ident = threading.get_ident()
+        self._waiting.add(ident)
+        try:
+            return self.llm.invoke(prompt, **kwargs)
+        finally:
+            self._waiting.discard(ident)
+
+    async def ainvoke(self, prompt, **kwargs):
+        if hasattr(self.llm, "ainvoke"):
+            return await self.llm.ainvoke(prompt, **kwargs)
+        return await asyncio.to_thread(self.invoke, prompt, **kwargs)
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})".replace(";", ",")
+
+
+# Per-game profile of everything except LLM waits: cProfile on the calling thread,
+# a wall-clock sampler over every game thread (collapsed stacks for flamegraph.pl
+# or speedscope) and tracemalloc for allocations.
+class GameProfiler:
+    def __init__(self, interval: float = 0.005, top_n: int = 25, trace_frames: int = 10) -> None:
+        self.interval = interval
+        self.top_n = top_n
+        self.trace_frames = trace_frames
+        self.samples: Counter = Counter()
+        self.dropped = 0
+        self._waiting: Set[int] = set()
+        self._profile = cProfile.Profile()
+        self._snapshot = None
+        self._peak = 0
+        self._stop = threading.Event()
+
+    def wrap(self, llm):
+        return _WaitMarkedLLM(llm, self._waiting)
+
+    def _sample(self, own_ident: int) -> None:
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():
+            name = names.get(ident, "thread")
+            if ident == own_ident or name.startswith(_IGNORED_THREADS):
+                continue
+            if ident in self._waiting or os.path.basename(frame.f_code.co_filename) in _WAIT_MODULES:
+                self.dropped += 1
+                continue
+            stack: List[str] = []
+            while frame is not None:
+                stack.append(_frame_label(frame))
+                frame = frame.f_back
+            self.samples[";".join([name] + stack[::-1])] += 1
+
+    def _loop(self) -> None:
+        own_ident = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            self._sample(own_ident)
+
+    @contextmanager
+    def profile(self) -> Iterator["GameProfiler"]:
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start(self.trace_frames)
+        tracemalloc.reset_peak()
+        sampler = threading.Thread(target=self._loop, name="traitors-profiler", daemon=True)
+        sampler.start()
+        self._profile.enable()
+        try:
+            yield self
+        finally:
+            self._profile.disable()
+            self._stop.set()
+            sampler.join()
+            self._snapshot = tracemalloc.take_snapshot()
+            self._peak = tracemalloc.get_traced_memory()[1]
+            if started_tracing:
+                tracemalloc.stop()
+
+    def allocation_report(self) -> str:
+        if self._snapshot is None:
+            return ""
+        snapshot = self._snapshot.filter_traces(
+            [
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, __file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+            ]
+        )
+        stats = snapshot.statistics("lineno")
+        lines = [
+            f"Peak traced memory: {self._peak / 1024:.1f} KiB",
+            f"Live at end: {sum(stat.size for stat in stats) / 1024:.1f} KiB in {len(stats)} sites",
+            "",
+            f"Top {self.top_n} allocation sites by live size:",
+        ]
+        for stat in stats[: self.top_n]:
+            frame = stat.traceback[0]
+            lines.append(f"{stat.size / 1024:10.1f} KiB {stat.count:8d} blocks  {frame.filename}:{frame.lineno}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, prefix: str) -> Dict[str, str]:
+        directory = os.path.dirname(prefix)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        paths = {
+            "prof": f"{prefix}.prof",
+            "collapsed": f"{prefix}.collapsed",
+            "allocations": f"{prefix}_alloc.txt",
+        }
+        self._profile.dump_stats(paths["prof"])
+        with open(paths["collapsed"], "w", encoding="utf-8") as handle:
+            for stack, count in sorted(self.samples.items()):
+                handle.write(f"{stack} {count}\n")
+        with open(paths["allocations"], "w", encoding="utf-8") as handle:
+            handle.write(self.allocation_report())
+        return paths
+
+
+# Fills a fresh state with the history a game would have carried into round_idx.
+def add_history(state: GameState, round_idx: int) -> GameState:
+    config = state.config
+    traitors = sorted(state.traitors)
+    for past in range(1, round_idx):
+        for _ in range(config.discussion_turns):
+            for pid in range(1, config.n_players + 1):
+                state.public_transcript.append(
+                    PublicMessage(round=past, phase="discussion", speaker_id=pid, content="x" * config.message_char_limit)
+                )
+        for pid in traitors:
+            state.traitor_private_transcript.append(
+                PublicMessage(round=past, phase="traitor_chat", speaker_id=pid, content="x" * config.message_char_limit)
+            )
+        state.vote_history.append({"round": past, "votes": {pid: 1 for pid in range(1, config.n_players + 1)}})
+    state.round_idx = round_idx
+    return state
+
+
+# Graph bookkeeping per node step, in seconds, with no LLM or game logic in the nodes.
+def step_overhead(state: GameState, steps: int = 20, repeats: int = 10) -> float:
+    graph = StateGraph(GameState)
+    names = [f"step_{index}" for index in range(steps)]
+    for name in names:
+        graph.add_node(name, lambda state: state)
+    graph.set_entry_point(names[0])
+    for current, following in zip(names, names[1:]):
+        graph.add_edge(current, following)
+    graph.add_edge(names[-1], END)
+    compiled = graph.compile()
+    compiled.invoke(state)
+    start = time.perf_counter()
+    for _ in range(repeats):
+        compiled.invoke(state)
+    return (time.perf_counter() - start) / (repeats * steps)
+
+
+__all__ = ["StandInLLM", "GameProfiler", "add_history", "step_overhead"]
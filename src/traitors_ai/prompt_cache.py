@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+from typing import Any, Dict, List, Optional
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_prompt(prompt: str) -> str:
+    return _WHITESPACE.sub(" ", prompt).strip()
+
+
+def cache_key(model_name: str, prompt: str, schema: Optional[str] = None) -> str:
+    material = json.dumps([model_name, normalize_prompt(prompt), schema], sort_keys=True)
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class PromptCache:
+    def __init__(self, path: str) -> None:
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, response TEXT NOT NULL)")
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT response FROM responses WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def put(self, key: str, response: str) -> None:
+        with self._lock:
+            self._conn.execute("INSERT OR IGNORE INTO responses (key, response) VALUES (?, ?)", (key, response))
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_CACHES: Dict[str, PromptCache] = {}
+_CACHES_LOCK = threading.Lock()
+
+
+def open_prompt_cache(path: str) -> PromptCache:
+    with _CACHES_LOCK:
+        if path not in _CACHES:
+            _CACHES[path] = PromptCache(path)
+        return _CACHES[path]
+
+
+# Per-game view of the shared cache, so each game reports its own hit rate and
+# which calls were served from the cache.
+class CacheSession:
+    def __init__(self, cache: PromptCache, model_name: str) -> None:
+        self.cache = cache
+        self.model_name = model_name
+        self.hits = 0
+        self.misses = 0
+        self.hit_calls: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def lookup(
+        self, agent_id: int, prompt: str, schema: Optional[str] = None, model: Optional[str] = None
+    ) -> Optional[str]:
+        key = cache_key(model or self.model_name, prompt, schema)
+        response = self.cache.get(key)
+        with self._lock:
+            if response is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self.hit_calls.append({"agent": agent_id, "key": key[:12]})
+        return response
+
+    def store(self, prompt: str, schema: Optional[str], response: str, model: Optional[str] = None) -> None:
+        self.cache.put(cache_key(model or self.model_name, prompt, schema), response)
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "hit_calls": list(self.hit_calls),
+        }
+
+
+__all__ = ["normalize_prompt", "cache_key", "PromptCache", "open_prompt_cache", "CacheSession"]
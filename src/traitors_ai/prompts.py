@@ -141,3 +141,30 @@ def murder_prompt(
         + "\nFormat instructions:\n"
         + format_instructions
     )
+
+
+def joint_murder_prompt(
+    persona_card: str,
+    role: str,
+    round_idx: int,
+    alive_players: List[str],
+    public_summary: str,
+    memory_summary: str,
+    top_suspicions: str,
+    traitor_ids: List[int],
+    traitor_summary: str,
+    proposed_target: int,
+    format_instructions: str,
+) -> str:
+    return (
+        f"You decide for all traitors {traitor_ids} which faithful player to murder (alive, non-traitor).\n"
+        f"Every traitor currently sees P{proposed_target} as the biggest threat. "
+        f"Confirm P{proposed_target} or name another faithful player.\n"
+        "Output MUST be valid JSON only.\n\n"
+        f"Persona card:\n{persona_card}\n\n"
+        + _base_context(role, round_idx, alive_players, public_summary, memory_summary, top_suspicions)
+        + f"\nKnown traitors: {traitor_ids}\n"
+        + f"Private traitor chat summary: {traitor_summary}\n"
+        + "\nFormat instructions:\n"
+        + format_instructions
+    )
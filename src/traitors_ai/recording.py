@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from collections import defaultdict, deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from langchain_core.messages import AIMessage
+
+
+def prompt_digest(prompt: str) -> str:
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+
+
+def transcript_path(log_dir: str, game_id: str) -> str:
+    return os.path.join(log_dir, f"{game_id}_llm.jsonl")
+
+
+class ReplayMismatchError(KeyError):
+    pass
+
+
+class RecordingLLM:
+    def __init__(self, llm, path: str) -> None:
+        self.llm = llm
+        self.path = path
+        self.supports_json_schema = getattr(llm, "supports_json_schema", False)
+        self._seq = 0
+        self._lock = threading.Lock()
+        # A re-recorded game replaces its old transcript; replay would serve stale responses first.
+        self._file = open(path, "w", encoding="utf-8")
+
+    def invoke(self, prompt, **kwargs):
+        response = self.llm.invoke(prompt, **kwargs)
+        self._record(prompt, response)
+        return response
+
+    async def ainvoke(self, prompt, **kwargs):
+        response = await self.llm.ainvoke(prompt, **kwargs)
+        self._record(prompt, response)
+        return response
+
+    def _record(self, prompt: str, response) -> None:
+        text = response.content if isinstance(response, AIMessage) else str(response)
+        with self._lock:
+            record = {"seq": self._seq, "prompt_sha256": prompt_digest(prompt), "prompt": prompt, "response": text}
+            self._file.write(json.dumps(record) + "\n")
+            self._file.flush()
+            self._seq += 1
+
+    def close(self) -> None:
+        self._file.close()
+
+
+# Responses are matched by prompt hash, first-in first-out per prompt, so replay
+# does not depend on the order concurrent calls happened to finish in.
+class ReplayLLM:
+    serves_any_model = True
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._responses: Dict[str, Deque[str]] = defaultdict(deque)
+        self._lock = threading.Lock()
+        with open(path, "r", encoding="utf-8") as handle:
+            for line in handle:
+                if line.strip():
+                    record = json.loads(line)
+                    self._responses[record["prompt_sha256"]].append(record["response"])
+
+    def invoke(self, prompt, **kwargs) -> str:
+        digest = prompt_digest(prompt)
+        with self._lock:
+            queue = self._responses.get(digest)
+            if not queue:
+                raise ReplayMismatchError(f"No recorded response for prompt {digest[:12]} in {self.path}")
+            return queue.popleft()
+
+    async def ainvoke(self, prompt, **kwargs) -> str:
+        return self.invoke(prompt, **kwargs)
+
+    def unused(self) -> int:
+        return sum(len(queue) for queue in self._responses.values())
+
+
+def _comparable(event: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: value for key, value in event.items() if key not in {"timestamp_utc", "game_id"}}
+
+
+def compare_event_logs(expected_path: str, actual_path: str) -> Optional[Tuple[int, Any, Any]]:
+    def load(path: str) -> List[Dict[str, Any]]:
+        with open(path, "r", encoding="utf-8") as handle:
+            return [_comparable(json.loads(line)) for line in handle if line.strip()]
+
+    expected, actual = load(expected_path), load(actual_path)
+    for index, (left, right) in enumerate(zip(expected, actual)):
+        if left != right:
+            return index, left, right
+    if len(expected) != len(actual):
+        index = min(len(expected), len(actual))
+        return (
+            index,
+            expected[index] if index < len(expected) else None,
+            actual[index] if index < len(actual) else None,
+        )
+    return None
+
+
+__all__ = [
+    "prompt_digest",
+    "transcript_path",
+    "ReplayMismatchError",
+    "RecordingLLM",
+    "ReplayLLM",
+    "compare_event_logs",
+]
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import copy
+from typing import Any, Dict, List, Optional
+
+from .logging_utils import decode_belief_updates
+
+
+def initial_replay_state(n_players: Optional[int] = None) -> Dict[str, Any]:
+    players = list(range(1, n_players + 1)) if n_players else []
+    return {
+        "event_index": -1,
+        "round": 0,
+        "phase": "start",
+        "roles": {},
+        "alive": players,
+        "eliminations": [],
+        "vote_round": None,
+        "vote_tallies": {},
+        "suspicions": {},
+    }
+
+
+def apply_event(state: Dict[str, Any], event: Dict[str, Any], index: int) -> None:
+    action_type = event.get("action_type")
+    payload = event.get("payload", {}) or {}
+    state["event_index"] = index
+    state["round"] = event.get("round", state["round"])
+    state["phase"] = event.get("phase", state["phase"])
+    if action_type == "assign_roles":
+        state["roles"] = {str(pid): role for pid, role in payload.get("roles", {}).items()}
+        state["alive"] = sorted(int(pid) for pid in state["roles"])
+    elif action_type == "vote":
+        vote_round = f"{state['round']}:{state['phase']}"
+        if state["vote_round"] != vote_round:
+            state["vote_round"] = vote_round
+            state["vote_tallies"] = {}
+        target = str(payload.get("target_id"))
+        state["vote_tallies"][target] = state["vote_tallies"].get(target, 0) + 1
+    elif action_type in {"banish_result", "murder_result"}:
+        for eliminated in [payload.get("eliminated"), *payload.get("also_eliminated", [])]:
+            if eliminated is not None and eliminated in state["alive"]:
+                state["alive"].remove(eliminated)
+                state["eliminations"].append(
+                    {
+                        "player_id": eliminated,
+                        "round": state["round"],
+                        "cause": "banished" if action_type == "banish_result" else "murdered",
+                    }
+                )
+    elif action_type == "recruit_result":
+        state["roles"] = {**state["roles"], str(payload.get("recruited")): "traitor"}
+    elif action_type == "belief_update":
+        scores = payload.get("scores", {})
+        state["suspicions"][str(event.get("actor_id"))] = {str(pid): score for pid, score in scores.items()}
+
+
+def build_snapshots(
+    events: List[Dict[str, Any]],
+    every: int = 50,
+    n_players: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    state = initial_replay_state(n_players)
+    snapshots = [copy.deepcopy(state)]
+    last_round = state["round"]
+    for index, event in enumerate(decode_belief_updates(events)):
+        new_round = event.get("round", last_round) != last_round
+        if new_round and snapshots[-1]["event_index"] != index - 1:
+            # Snapshot the state as it stood when the previous round closed.
+            snapshots.append(copy.deepcopy(state))
+        apply_event(state, event, index)
+        last_round = state["round"]
+        if every > 0 and (index + 1) % every == 0:
+            snapshots.append(copy.deepcopy(state))
+    if snapshots[-1]["event_index"] != state["event_index"]:
+        snapshots.append(copy.deepcopy(state))
+    return snapshots
+
+
+__all__ = ["initial_replay_state", "apply_event", "build_snapshots"]
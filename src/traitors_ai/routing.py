@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict, List, Optional
+
+# Agent methods that can be sent to their own model.
+ROUTES = ("update_beliefs", "speak", "vote", "traitor_chat", "choose_murder", "choose_joint_murder")
+
+
+def routing_enabled(config) -> bool:
+    return bool(config.model_routes or config.escalation_model)
+
+
+def route_models(config) -> List[str]:
+    unknown = sorted(set(config.model_routes) - set(ROUTES))
+    if unknown:
+        raise ValueError(f"model_routes keys must be among {ROUTES}, got {unknown}")
+    models = {config.model_name, config.escalation_model or config.model_name, *config.model_routes.values()}
+    return sorted(models)
+
+
+# After escalate_after failed parses within one call, the remaining attempts go
+# to the escalation model (the default model unless one is set).
+def route_model(config, route: str, failures: int) -> str:
+    if failures >= config.escalate_after:
+        return config.escalation_model or config.model_name
+    return config.model_routes.get(route, config.model_name)
+
+
+def call_cost(prices: Dict[str, List[float]], model: str, input_tokens: int, output_tokens: int) -> float:
+    input_price, output_price = prices.get(model, (0.0, 0.0))
+    return (input_tokens * input_price + output_tokens * output_price) / 1_000_000
+
+
+# Sits under the instrumentation and retry wrappers and sends each call to the
+# client for the `model` keyword the agent passed, so one game can use several models.
+class ModelRouter:
+    def __init__(self, clients: Dict[str, Any], default_model: str) -> None:
+        self.clients = clients
+        self.default_model = default_model
+        self.supports_json_schema = all(getattr(client, "supports_json_schema", False) for client in clients.values())
+
+    def _client(self, kwargs: Dict[str, Any]):
+        kwargs.pop("route", None)
+        model: Optional[str] = kwargs.pop("model", None)
+        return self.clients[model or self.default_model]
+
+    def invoke(self, prompt, **kwargs):
+        return self._client(kwargs).invoke(prompt, **kwargs)
+
+    async def ainvoke(self, prompt, **kwargs):
+        client = self._client(kwargs)
+        if hasattr(client, "ainvoke"):
+            return await client.ainvoke(prompt, **kwargs)
+        return await asyncio.to_thread(client.invoke, prompt, **kwargs)
+
+
+__all__ = ["ROUTES", "routing_enabled", "route_models", "route_model", "call_cost", "ModelRouter"]
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import random
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from .game_engine import apply_murder, resolve_counts
+
+try:
+    import numpy as np  # type: ignore
+except ImportError:  # pragma: no cover - optional batch path
+    np = None
+
+TIE_BREAK_RULES = {"revote_once_then_random", "random", "no_banish"}
+
+
+# Votes are compact arrays: votes[i] is the target of player i + 1 and 0 means
+# no vote. Counts come back indexed by player id, with index 0 unused.
+def tally(votes: Sequence[int], n_players: int, weights: Optional[Sequence[float]] = None) -> List[float]:
+    counts: List[float] = [0] * (n_players + 1)
+    for voter, target in enumerate(votes):
+        if target:
+            counts[target] += weights[voter] if weights is not None else 1
+    return counts
+
+
+def batch_tally(vote_matrix, n_players: int, weights: Optional[Sequence[float]] = None):
+    # One row per simulated game; uses numpy when it is installed.
+    if np is None:
+        return [tally(row, n_players, weights) for row in vote_matrix]
+    votes = np.asarray(vote_matrix, dtype=np.int64)
+    values = np.broadcast_to(
+        np.ones(votes.shape[1]) if weights is None else np.asarray(weights, dtype=float), votes.shape
+    )
+    counts = np.zeros((votes.shape[0], n_players + 1))
+    rows = np.broadcast_to(np.arange(votes.shape[0])[:, None], votes.shape)
+    np.add.at(counts, (rows, votes), values)
+    counts[:, 0] = 0.0
+    return counts
+
+
+def votes_array(votes: Dict[int, int], n_players: int) -> List[int]:
+    array = [0] * n_players
+    for voter, target in votes.items():
+        array[voter - 1] = target
+    return array
+
+
+# The default rule set is the original game: plurality banish with one revote on
+# a tie, a single plurality murder per night. Variants override single steps and
+# consume the shared RNG exactly like the original wherever they behave the same.
+class RuleSet:
+    name = "plurality"
+
+    def __init__(
+        self,
+        n_players: int,
+        n_traitors: int,
+        tie_break_rule: str = "revote_once_then_random",
+        vote_weights: Optional[Dict[int, float]] = None,
+        shields: int = 0,
+        recruitment: bool = False,
+        murders_per_night: int = 1,
+    ) -> None:
+        if tie_break_rule not in TIE_BREAK_RULES:
+            raise ValueError(f"tie_break_rule must be one of {sorted(TIE_BREAK_RULES)}")
+        self.n_players = n_players
+        self.n_traitors = n_traitors
+        self.tie_break_rule = tie_break_rule
+        self.vote_weights = {int(pid): float(weight) for pid, weight in (vote_weights or {}).items()}
+        self.weights = (
+            [self.vote_weights.get(pid, 1.0) for pid in range(1, n_players + 1)] if self.vote_weights else None
+        )
+        self.shields = shields
+        self.recruitment = recruitment
+        self.murders_per_night = max(1, murders_per_night)
+
+    # Counts keyed by the alive players, in the same order apply_vote builds them;
+    # weighted votes are only counted here.
+    def count_votes(self, alive: Set[int], votes: Dict[int, int]) -> Dict[int, float]:
+        valid = {voter: target for voter, target in votes.items() if target in alive}
+        counts = tally(votes_array(valid, self.n_players), self.n_players, self.weights)
+        return {pid: counts[pid] for pid in alive}
+
+    def resolve_banish(
+        self, alive: Set[int], votes: Dict[int, int], rng: random.Random
+    ) -> Tuple[Optional[int], Dict[str, Any]]:
+        eliminated, info = resolve_counts(alive, self.count_votes(alive, votes), rng)
+        if eliminated is None and info["tied"] and self.tie_break_rule == "random":
+            return rng.choice(sorted(info["tied"])), {**info, "random": True}
+        return eliminated, info
+
+    def revote_candidates(self, eliminated: Optional[int], info: Dict[str, Any]) -> List[int]:
+        if eliminated is None and info.get("tied") and self.tie_break_rule == "revote_once_then_random":
+            return sorted(info["tied"])
+        return []
+
+    def resolve_revote(
+        self, alive: Set[int], votes: Dict[int, int], candidates: List[int], rng: random.Random
+    ) -> Tuple[Optional[int], Dict[str, Any]]:
+        eliminated, info = resolve_counts(alive, self.count_votes(alive, votes), rng)
+        if eliminated is None:
+            eliminated = rng.choice(candidates)
+            info["random"] = True
+        return eliminated, info
+
+    def shielded(self, alive: Set[int], traitors: Set[int], votes: Dict[int, int]) -> Set[int]:
+        # Shields go to the faithful who drew the fewest banish votes this round.
+        if not self.shields:
+            return set()
+        received = {pid: 0 for pid in alive - traitors}
+        for target in votes.values():
+            if target in received:
+                received[target] += 1
+        ordered = sorted(received, key=lambda pid: (received[pid], pid))
+        return set(ordered[: self.shields])
+
+    def recruits(self, alive: Set[int], traitors: Set[int]) -> bool:
+        living = len(traitors & alive)
+        return self.recruitment and 0 < living < self.n_traitors
+
+    def resolve_murder(
+        self,
+        alive: Set[int],
+        traitors: Set[int],
+        murder_votes: Dict[int, int],
+        rng: random.Random,
+        shielded: Set[int] = frozenset(),
+    ) -> List[int]:
+        pool = alive - shielded
+        votes = dict(murder_votes)
+        victims: List[int] = []
+        for _ in range(self.murders_per_night):
+            victim = apply_murder(pool, traitors, votes, rng)
+            if victim is None:
+                break
+            victims.append(victim)
+            pool = pool - {victim}
+            votes = {pid: target for pid, target in votes.items() if target != victim}
+        return victims
+
+
+class RunoffRuleSet(RuleSet):
+    name = "runoff"
+
+    def resolve_banish(
+        self, alive: Set[int], votes: Dict[int, int], rng: random.Random
+    ) -> Tuple[Optional[int], Dict[str, Any]]:
+        eliminated, info = resolve_counts(alive, self.count_votes(alive, votes), rng)
+        counts = info["counts"]
+        cast = sum(counts.values())
+        leader = max(counts, key=lambda pid: (counts[pid], -pid)) if counts else None
+        if leader is not None and cast and counts[leader] * 2 > cast:
+            return leader, {**info, "tied": [], "runoff": []}
+        ranked = sorted((pid for pid in counts if counts[pid] > 0), key=lambda pid: (-counts[pid], pid))
+        if len(ranked) < 2:
+            return eliminated, {**info, "runoff": []}
+        cutoff = counts[ranked[1]]
+        finalists = sorted(pid for pid in ranked if counts[pid] >= cutoff)
+        return None, {**info, "runoff": finalists}
+
+    def revote_candidates(self, eliminated: Optional[int], info: Dict[str, Any]) -> List[int]:
+        if eliminated is None and info.get("runoff"):
+            return list(info["runoff"])
+        return super().revote_candidates(eliminated, info)
+
+    def resolve_revote(
+        self, alive: Set[int], votes: Dict[int, int], candidates: List[int], rng: random.Random
+    ) -> Tuple[Optional[int], Dict[str, Any]]:
+        finalists = set(candidates)
+        eliminated, info = resolve_counts(finalists, self.count_votes(finalists, votes), rng)
+        # Without any valid revote resolve_counts has already drawn at random.
+        if eliminated is None and info["tied"]:
+            eliminated = rng.choice(sorted(info["tied"]))
+            info["random"] = True
+        return eliminated, info
+
+
+RULE_SETS = {
+    "plurality": RuleSet,
+    "runoff": RunoffRuleSet,
+}
+
+
+def create_rules(config) -> RuleSet:
+    if config.rules not in RULE_SETS:
+        raise ValueError(f"rules must be one of {sorted(RULE_SETS)}")
+    options = dict(config.rule_options)
+    return RULE_SETS[config.rules](
+        n_players=config.n_players,
+        n_traitors=config.n_traitors,
+        tie_break_rule=config.tie_break_rule,
+        vote_weights=options.pop("vote_weights", None),
+        shields=int(options.pop("shields", 0)),
+        recruitment=bool(options.pop("recruitment", False)),
+        murders_per_night=int(options.pop("murders_per_night", 1)),
+        **options,
+    )
+
+
+__all__ = [
+    "TIE_BREAK_RULES",
+    "tally",
+    "batch_tally",
+    "votes_array",
+    "RuleSet",
+    "RunoffRuleSet",
+    "RULE_SETS",
+    "create_rules",
+]
@@ -1,28 +1,71 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import logging
 import os
 import random
-from typing import List, Optional
+import sys
+import threading
+import traceback
+from contextlib import nullcontext
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
 
 import typer
 
 from .agent import TraitorsAgent
-from .config import create_llm, load_env
-from .game_engine import assign_roles, generate_game_id
-from .graph import build_graph
-from .logging_utils import JsonlLogger
+from .analysis import precision_reached, win_rate_interval
+from .config import get_shared_llm, load_env
+from .game_engine import assign_roles, config_hash, generate_game_id
+from .graph import build_async_graph, build_graph
+from .golden import check_golden, load_manifest, record_golden
+from .grid import SUMMARY_FIELDS, GridSpec, completed_jobs, expand_grid, job_key, load_grid_spec, parse_seeds, run_grid
+from .llm import InstrumentedLLM, RateLimitedLLM, RateLimiter, ResilientLLM, is_transient
+from .logging_utils import JsonlLogger, append_table_row
+from .metrics import GAMES_COMPLETED, GAMES_FAILED, ProgressDisplay
 from .personas import assign_personas
+from .profiling import GameProfiler, StandInLLM, add_history, step_overhead
+from .prompt_cache import CacheSession, open_prompt_cache
+from .recording import RecordingLLM, ReplayLLM, compare_event_logs, transcript_path
+from .routing import ROUTES, ModelRouter, route_models, routing_enabled
+from .scheduler import create_async_scheduler, create_scheduler
 from .schemas import AgentPrivateState, GameConfig, GameState
+from .suspicion import load_log_dir, suspicion_report, write_tables
 
 app = typer.Typer(add_completion=False)
+log = logging.getLogger("traitors_ai")
 
+_BATCH_FIELDS = ["game_id", "seed", "condition", "winner", "rounds", "traitor_win", "faithful_win"]
+_DEAD_LETTER = "dead_letter.jsonl"
+_GAMES_TABLE = "games.csv"
+_DEAD_LETTER_LOCK = threading.Lock()
 
-def _parse_seeds(seed_arg: str) -> List[int]:
-    if ".." in seed_arg:
-        start, end = seed_arg.split("..")
-        return list(range(int(start), int(end) + 1))
-    return [int(seed_arg)]
+
+def _configure_output(verbose: bool) -> None:
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    log.handlers = [handler]
+    log.setLevel(logging.INFO if verbose else logging.WARNING)
+    log.propagate = False
+
+
+def _parse_routes(routes: List[str]) -> Dict[str, str]:
+    parsed = dict(item.split("=", 1) for item in routes)
+    unknown = sorted(set(parsed) - set(ROUTES))
+    if unknown:
+        raise typer.BadParameter(
+            f"methods must be among {', '.join(ROUTES)}, got {', '.join(unknown)}", param_hint="--route"
+        )
+    return parsed
+
+
+def _parse_prices(prices: List[str]) -> Dict[str, List[float]]:
+    parsed = {}
+    for item in prices:
+        model, _, values = item.partition("=")
+        parsed[model] = [float(value) for value in values.split(",")]
+    return parsed
 
 
 def _init_game_state(config: GameConfig) -> GameState:
@@ -54,10 +97,11 @@ def _init_game_state(config: GameConfig) -> GameState:
     )
 
 
-def _build_agents(config: GameConfig, state: GameState) -> dict[int, TraitorsAgent]:
+def _build_agents(config: GameConfig, state: GameState, llm=None, prompt_cache=None) -> dict[int, TraitorsAgent]:
     rng = random.Random(config.seed)
     personas = assign_personas(config.n_players, rng)
-    llm = create_llm(config.model_name, config.temperature)
+    if llm is None:
+        llm = get_shared_llm(config.model_name, config.temperature)
     agents = {}
     for pid in range(1, config.n_players + 1):
         agents[pid] = TraitorsAgent(
@@ -66,54 +110,363 @@ def _build_agents(config: GameConfig, state: GameState) -> dict[int, TraitorsAge
             role=state.roles[pid].value,
             llm_client=llm,
             config=config,
+            prompt_cache=prompt_cache,
         )
     return agents
 
 
-def _run_single_game(config: GameConfig, outdir: str) -> GameState:
+def _prepare_game(
+    config: GameConfig,
+    outdir: str,
+    llm=None,
+    record: bool = False,
+    profiler: Optional[GameProfiler] = None,
+    limiter: Optional[RateLimiter] = None,
+):
+    if record and config.prompt_cache:
+        # Cache hits never reach the recorder, so the recording could not be replayed.
+        raise ValueError("Recording and the prompt cache cannot be combined")
     state = _init_game_state(config)
-    print(f"\n🎮 Starting game: {state.game_id}")
-    print(f"   Players: {config.n_players} ({config.n_traitors} traitors)")
-    print(f"   Seed: {config.seed}, Condition: {config.condition_name}\n")
+    log.info(f"\n🎮 Starting game: {state.game_id}")
+    log.info(f"   Players: {config.n_players} ({config.n_traitors} traitors)")
+    log.info(f"   Seed: {config.seed}, Condition: {config.condition_name}\n")
     log_dir = os.path.join(outdir, "logs")
-    logger = JsonlLogger(log_dir, state.game_id)
-    agents = _build_agents(config, state)
-    graph = build_graph(agents, logger)
-    final_state = graph.invoke(state)
-    logger.write_summary(final_state)
-    logger.close()
+    if record and os.path.exists(os.path.join(log_dir, f"{state.game_id}.jsonl")):
+        # The event log of a recording must match its fresh transcript for replay.
+        os.remove(os.path.join(log_dir, f"{state.game_id}.jsonl"))
+    logger = JsonlLogger(
+        log_dir,
+        state.game_id,
+        belief_log_mode=config.belief_log_mode,
+        belief_keyframe_interval=config.belief_keyframe_interval,
+    )
+    logger.log_event(
+        game_id=state.game_id,
+        seed=config.seed,
+        condition=config.condition_name,
+        round_idx=0,
+        phase="setup",
+        actor_id=-1,
+        action_type="assign_roles",
+        payload={"roles": {pid: role.value for pid, role in state.roles.items()}},
+    )
+    # Older messages stay in the event log instead of memory.
+    state.public_transcript = logger.transcript("public_message", config.transcript_window)
+    state.traitor_private_transcript = logger.transcript("traitor_chat", config.transcript_window)
+    if llm is None:
+        llm = get_shared_llm(config.model_name, config.temperature)
+    if routing_enabled(config):
+        # Stand-in and replay clients answer for every model; real ones serve only their own.
+        llm = ModelRouter(
+            {
+                model: llm
+                if model == config.model_name or getattr(llm, "serves_any_model", False)
+                else get_shared_llm(model, config.temperature)
+                for model in route_models(config)
+            },
+            config.model_name,
+        )
+    if limiter is not None:
+        # Outside the router, so calls to every routed model share the limit.
+        llm = RateLimitedLLM(llm, limiter)
+    instrumented = InstrumentedLLM(llm, config.model_name, config.model_prices)
+    llm = ResilientLLM(instrumented, config.llm_timeout, config.llm_retries, game_timeout=config.game_timeout)
+    recorder = None
+    if record:
+        recorder = llm = RecordingLLM(llm, transcript_path(log_dir, state.game_id))
+    if profiler is not None:
+        llm = profiler.wrap(llm)
+    cache = None
+    if config.prompt_cache:
+        # Cached responses are only a faithful stand-in for deterministic sampling.
+        if config.temperature == 0:
+            cache = CacheSession(open_prompt_cache(config.prompt_cache), config.model_name)
+        else:
+            log.warning(f"   Prompt cache disabled: temperature is {config.temperature}, not 0")
+    agents = _build_agents(config, state, llm, cache)
+    return state, logger, agents, recorder, cache, instrumented
+
+
+def _finish_game(
+    final_state: GameState | Dict[str, Any],
+    logger: JsonlLogger,
+    cache: Optional[CacheSession] = None,
+    instrumented: Optional[InstrumentedLLM] = None,
+    summary_table: Optional[str] = None,
+) -> GameState:
     # Handle dict return from LangGraph
     winner = final_state["winner"] if isinstance(final_state, dict) else final_state.winner
     round_idx = final_state["round_idx"] if isinstance(final_state, dict) else final_state.round_idx
-    print(f"\n✅ Game complete! Winner: {winner} after {round_idx} rounds")
-    print(f"   Logs: {log_dir}/{state.game_id}.jsonl\n")
+    config = final_state["config"] if isinstance(final_state, dict) else final_state.config
+    extra = None
+    if cache is not None:
+        stats = cache.stats()
+        logger.log_event(
+            game_id=logger.game_id,
+            seed=config.seed,
+            condition=config.condition_name,
+            round_idx=round_idx,
+            phase="end",
+            actor_id=-1,
+            action_type="cache_stats",
+            payload=stats,
+        )
+        extra = {"prompt_cache": {key: stats[key] for key in ("hits", "misses", "hit_rate")}}
+        log.info(f"   Prompt cache: {stats['hits']} hits, {stats['misses']} misses ({stats['hit_rate']:.0%})")
+    if instrumented is not None and instrumented.route_usage():
+        extra = {**(extra or {}), "routes": instrumented.route_usage()}
+    usage = instrumented.usage() if instrumented is not None else None
+    logger.write_summary(final_state, extra, usage, summary_table)
+    logger.close()
+    GAMES_COMPLETED.inc(winner=winner)
+    log.info(f"\n✅ Game complete! Winner: {winner} after {round_idx} rounds")
+    log.info(f"   Logs: {logger.log_path}\n")
     return final_state
 
 
+def _run_single_game(
+    config: GameConfig,
+    outdir: str,
+    llm=None,
+    record: bool = False,
+    profile: bool = False,
+    summary_table: Optional[str] = None,
+    limiter: Optional[RateLimiter] = None,
+) -> GameState:
+    profiler = GameProfiler() if profile else None
+    state, logger, agents, recorder, cache, instrumented = _prepare_game(
+        config, outdir, llm, record, profiler, limiter
+    )
+    scheduler = create_scheduler(config)
+    graph = build_graph(agents, logger, scheduler)
+    try:
+        with profiler.profile() if profiler is not None else nullcontext():
+            final_state = graph.invoke(state)
+    except BaseException:
+        logger.close()
+        raise
+    finally:
+        scheduler.shutdown()
+        if recorder is not None:
+            recorder.close()
+    if profiler is not None:
+        paths = profiler.write(os.path.splitext(logger.log_path)[0])
+        log.info(f"   Profile: {', '.join(paths.values())}")
+    return _finish_game(final_state, logger, cache, instrumented, summary_table or os.path.join(outdir, _GAMES_TABLE))
+
+
+async def _run_single_game_async(config: GameConfig, outdir: str, llm=None, record: bool = False) -> GameState:
+    state, logger, agents, recorder, cache, instrumented = _prepare_game(config, outdir, llm, record)
+    scheduler = create_async_scheduler(config)
+    graph = build_async_graph(agents, logger, scheduler)
+    try:
+        final_state = await graph.ainvoke(state)
+    except BaseException:
+        logger.close()
+        raise
+    finally:
+        await scheduler.ashutdown()
+        if recorder is not None:
+            recorder.close()
+    return _finish_game(final_state, logger, cache, instrumented, os.path.join(outdir, _GAMES_TABLE))
+
+
+async def _run_games_async(
+    configs: List[GameConfig],
+    outdir: str,
+    concurrency: int,
+    record: bool,
+    stop: Callable[[List[Dict[str, Any]]], bool],
+    stand_in_llm: bool = False,
+) -> List[Dict[str, Any]]:
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    rows: List[Dict[str, Any]] = []
+
+    async def run(config: GameConfig) -> None:
+        async with semaphore:
+            if stop(rows):
+                return
+            # Every game shares one client per (model, temperature), and with it one HTTP connection pool.
+            if stand_in_llm:
+                llm = StandInLLM(config.seed)
+            else:
+                llm = get_shared_llm(config.model_name, config.temperature)
+            try:
+                final_state = await _run_single_game_async(config, outdir, llm, record)
+            except Exception as exc:  # noqa: BLE001
+                _dead_letter(outdir, config, outdir, exc)
+                return
+            rows.append(_game_row(config, final_state))
+
+    await asyncio.gather(*(run(config) for config in configs))
+    return sorted(rows, key=lambda row: row["seed"])
+
+
+def _dead_letter(dead_letter_dir: str, config: GameConfig, game_outdir: str, exc: BaseException) -> None:
+    entry = {
+        "game_id": generate_game_id(config.seed, config.condition_name),
+        # Grid cells share seeds and conditions, so the game id alone is not unique.
+        "job_key": job_key(config),
+        "seed": config.seed,
+        "condition": config.condition_name,
+        "outdir": game_outdir,
+        "error_type": type(exc).__name__,
+        "error": str(exc),
+        "transient": is_transient(exc),
+        "traceback": traceback.format_exception(exc)[-3:],
+        "failed_at": datetime.now(timezone.utc).isoformat(),
+        "config": config.model_dump(),
+    }
+    GAMES_FAILED.inc()
+    log.warning(f"\n❌ Game {entry['game_id']} failed: {entry['error_type']}: {entry['error']}")
+    os.makedirs(dead_letter_dir, exist_ok=True)
+    with _DEAD_LETTER_LOCK:
+        with open(os.path.join(dead_letter_dir, _DEAD_LETTER), "a", encoding="utf-8") as handle:
+            handle.write(json.dumps(entry) + "\n")
+
+
+def _read_dead_letters(dead_letter_dir: str) -> List[Dict[str, Any]]:
+    path = os.path.join(dead_letter_dir, _DEAD_LETTER)
+    if not os.path.exists(path):
+        return []
+    with open(path, "r", encoding="utf-8") as handle:
+        return [json.loads(line) for line in handle if line.strip()]
+
+
+def _run_game_or_dead_letter(
+    config: GameConfig,
+    outdir: str,
+    llm=None,
+    record: bool = False,
+    dead_letter_dir: Optional[str] = None,
+    profile: bool = False,
+    limiter: Optional[RateLimiter] = None,
+) -> Optional[Dict[str, Any]]:
+    table = os.path.join(dead_letter_dir or outdir, _GAMES_TABLE)
+    try:
+        return _game_row(config, _run_single_game(config, outdir, llm, record, profile, table, limiter))
+    except Exception as exc:  # noqa: BLE001
+        _dead_letter(dead_letter_dir or outdir, config, outdir, exc)
+        return None
+
+
+def _write_batch_summary(summary_path: str, rows: List[Dict[str, Any]], append: bool = False) -> None:
+    rows = [{key: row[key] for key in _BATCH_FIELDS} for row in rows]
+    if append and os.path.exists(summary_path):
+        import csv
+
+        with open(summary_path, "a", newline="", encoding="utf-8") as handle:
+            csv.DictWriter(handle, fieldnames=_BATCH_FIELDS).writerows(rows)
+        return
+    try:
+        import pandas as pd  # type: ignore
+
+        df = pd.DataFrame(rows, columns=_BATCH_FIELDS)
+        df.to_csv(summary_path, index=False)
+    except Exception:
+        import csv
+
+        with open(summary_path, "w", newline="", encoding="utf-8") as handle:
+            writer = csv.DictWriter(handle, fieldnames=_BATCH_FIELDS)
+            writer.writeheader()
+            writer.writerows(rows)
+
+
+def _game_row(config: GameConfig, final_state: GameState | Dict[str, Any]) -> Dict[str, Any]:
+    # Handle dict return from LangGraph
+    game_id = final_state["game_id"] if isinstance(final_state, dict) else final_state.game_id
+    winner = final_state["winner"] if isinstance(final_state, dict) else final_state.winner
+    round_idx = final_state["round_idx"] if isinstance(final_state, dict) else final_state.round_idx
+    return {
+        "game_id": game_id,
+        "seed": config.seed,
+        "condition": config.condition_name,
+        "model_name": config.model_name,
+        "temperature": config.temperature,
+        "n_players": config.n_players,
+        "n_traitors": config.n_traitors,
+        "winner": winner,
+        "rounds": round_idx,
+        "traitor_win": winner == "traitors",
+        "faithful_win": winner == "faithful",
+    }
+
+
 @app.command("run-one")
 def run_one(
     seed: int = typer.Option(1, help="Random seed"),
     condition: str = typer.Option("baseline_memory", help="Condition name"),
     model_name: str = typer.Option("gpt-4o-mini", help="Model name"),
+    route: List[str] = typer.Option(
+        [], help="Send one agent method to another model, METHOD=MODEL (e.g. vote=gpt-4o-mini); repeatable"
+    ),
+    escalation_model: Optional[str] = typer.Option(
+        None, help="Model that retries a call after a parse failure (default: --model-name)"
+    ),
+    model_price: List[str] = typer.Option(
+        [], help="USD per million input and output tokens, MODEL=INPUT,OUTPUT; repeatable"
+    ),
     temperature: float = typer.Option(0.3, help="Temperature"),
     n_players: int = typer.Option(9, help="Number of players"),
     n_traitors: int = typer.Option(2, help="Number of traitors"),
     discussion_turns: int = typer.Option(1, help="Discussion turns per round"),
+    discussion_mode: str = typer.Option(
+        "legacy", help="legacy, simultaneous (concurrent speeches per turn) or sequential (each speaker sees the last)"
+    ),
+    night_mode: str = typer.Option(
+        "legacy", help="legacy or consensus (concurrent traitor chat, one murder call when traitors agree)"
+    ),
+    rules: str = typer.Option("plurality", help="Rule set: plurality or runoff"),
+    tie_break_rule: str = typer.Option(
+        "revote_once_then_random", help="Banish tie-break: revote_once_then_random, random or no_banish"
+    ),
     max_rounds: int = typer.Option(30, help="Maximum rounds"),
     outdir: str = typer.Option("results", help="Output directory"),
+    pipeline: bool = typer.Option(False, help="Start independent next-phase LLM calls early"),
+    adaptive_rounds: bool = typer.Option(False, help="Cut discussion short once suspicions converge"),
+    convergence_threshold: float = typer.Option(0.75, help="Share of players agreeing on a top suspect"),
+    belief_log_mode: str = typer.Option("full", help="Belief logging: full or delta"),
+    record: bool = typer.Option(False, help="Record every prompt/response pair next to the log"),
+    prompt_cache: Optional[str] = typer.Option(
+        None, help="SQLite file that caches responses across games (temperature 0 only)"
+    ),
+    llm_timeout: Optional[float] = typer.Option(120.0, help="Seconds before one LLM call is abandoned"),
+    llm_retries: int = typer.Option(2, help="Retries for timeouts, rate limits and server errors"),
+    game_timeout: Optional[float] = typer.Option(None, help="Seconds before a whole game is abandoned"),
+    profile: bool = typer.Option(False, help="Write cProfile, collapsed-stack and allocation reports next to each log"),
+    stand_in_llm: bool = typer.Option(False, help="Answer every call instantly with a deterministic stand-in model"),
 ) -> None:
     load_env()
+    _configure_output(verbose=True)
+    if record and prompt_cache:
+        raise typer.BadParameter("a recording would miss the calls the cache answers", param_hint="--prompt-cache")
     config = GameConfig(
         seed=seed,
         condition_name=condition,
         model_name=model_name,
+        model_routes=_parse_routes(route),
+        escalation_model=escalation_model,
+        model_prices=_parse_prices(model_price),
         temperature=temperature,
         n_players=n_players,
         n_traitors=n_traitors,
         discussion_turns=discussion_turns,
+        discussion_mode=discussion_mode,
+        night_mode=night_mode,
+        rules=rules,
+        tie_break_rule=tie_break_rule,
         max_rounds=max_rounds,
+        pipeline=pipeline,
+        adaptive_rounds=adaptive_rounds,
+        convergence_threshold=convergence_threshold,
+        belief_log_mode=belief_log_mode,
+        prompt_cache=prompt_cache,
+        llm_timeout=llm_timeout,
+        llm_retries=llm_retries,
+        game_timeout=game_timeout,
     )
-    state = _run_single_game(config, outdir)
+    llm = StandInLLM(seed) if stand_in_llm else None
+    state = _run_single_game(config, outdir, llm, record=record, profile=profile)
     # Handle dict return from LangGraph
     game_id = state["game_id"] if isinstance(state, dict) else state.game_id
     winner = state["winner"] if isinstance(state, dict) else state.winner
@@ -130,54 +483,288 @@ def run_batch(
     seeds: str = typer.Option("1..5", help="Seed range like 1..100"),
     condition: str = typer.Option("baseline_memory", help="Condition name"),
     model_name: str = typer.Option("gpt-4o-mini", help="Model name"),
+    route: List[str] = typer.Option(
+        [], help="Send one agent method to another model, METHOD=MODEL (e.g. vote=gpt-4o-mini); repeatable"
+    ),
+    escalation_model: Optional[str] = typer.Option(
+        None, help="Model that retries a call after a parse failure (default: --model-name)"
+    ),
+    model_price: List[str] = typer.Option(
+        [], help="USD per million input and output tokens, MODEL=INPUT,OUTPUT; repeatable"
+    ),
     temperature: float = typer.Option(0.3, help="Temperature"),
     n_players: int = typer.Option(9, help="Number of players"),
     n_traitors: int = typer.Option(2, help="Number of traitors"),
     discussion_turns: int = typer.Option(1, help="Discussion turns per round"),
+    discussion_mode: str = typer.Option(
+        "legacy", help="legacy, simultaneous (concurrent speeches per turn) or sequential (each speaker sees the last)"
+    ),
+    night_mode: str = typer.Option(
+        "legacy", help="legacy or consensus (concurrent traitor chat, one murder call when traitors agree)"
+    ),
+    rules: str = typer.Option("plurality", help="Rule set: plurality or runoff"),
+    tie_break_rule: str = typer.Option(
+        "revote_once_then_random", help="Banish tie-break: revote_once_then_random, random or no_banish"
+    ),
     max_rounds: int = typer.Option(30, help="Maximum rounds"),
     outdir: str = typer.Option("results", help="Output directory"),
+    pipeline: bool = typer.Option(False, help="Start independent next-phase LLM calls early"),
+    adaptive_rounds: bool = typer.Option(False, help="Cut discussion short once suspicions converge"),
+    convergence_threshold: float = typer.Option(0.75, help="Share of players agreeing on a top suspect"),
+    belief_log_mode: str = typer.Option("full", help="Belief logging: full or delta"),
+    record: bool = typer.Option(False, help="Record every prompt/response pair next to the log"),
+    prompt_cache: Optional[str] = typer.Option(
+        None, help="SQLite file that caches responses across games (temperature 0 only)"
+    ),
+    llm_timeout: Optional[float] = typer.Option(120.0, help="Seconds before one LLM call is abandoned"),
+    llm_retries: int = typer.Option(2, help="Retries for timeouts, rate limits and server errors"),
+    game_timeout: Optional[float] = typer.Option(None, help="Seconds before a whole game is abandoned"),
+    profile: bool = typer.Option(False, help="Write cProfile, collapsed-stack and allocation reports next to each log"),
+    stand_in_llm: bool = typer.Option(False, help="Answer every call instantly with a deterministic stand-in model"),
+    target_precision: Optional[float] = typer.Option(
+        None, help="Stop once the traitor win-rate 95% CI half-width is at most this"
+    ),
+    min_games: int = typer.Option(10, help="Minimum games before the precision check applies"),
+    concurrent_games: int = typer.Option(
+        1, help="Run this many games at once on one asyncio event loop (1 runs games one by one)"
+    ),
+    progress: bool = typer.Option(True, help="Show one progress line instead of per-event output"),
+    metrics_file: Optional[str] = typer.Option(None, help="Prometheus text metrics file (default OUTDIR/metrics.prom)"),
 ) -> None:
     load_env()
+    _configure_output(verbose=not progress)
+    if profile and concurrent_games > 1:
+        raise typer.BadParameter("--profile needs games to run one at a time", param_hint="--concurrent-games")
+    if record and prompt_cache:
+        raise typer.BadParameter("a recording would miss the calls the cache answers", param_hint="--prompt-cache")
     os.makedirs(outdir, exist_ok=True)
-    rows = []
-    for seed in _parse_seeds(seeds):
-        config = GameConfig(
+    configs = [
+        GameConfig(
             seed=seed,
             condition_name=condition,
             model_name=model_name,
+            model_routes=_parse_routes(route),
+            escalation_model=escalation_model,
+            model_prices=_parse_prices(model_price),
             temperature=temperature,
             n_players=n_players,
             n_traitors=n_traitors,
             discussion_turns=discussion_turns,
+            discussion_mode=discussion_mode,
+            night_mode=night_mode,
+            rules=rules,
+            tie_break_rule=tie_break_rule,
             max_rounds=max_rounds,
+            pipeline=pipeline,
+            adaptive_rounds=adaptive_rounds,
+            convergence_threshold=convergence_threshold,
+            belief_log_mode=belief_log_mode,
+            prompt_cache=prompt_cache,
+            llm_timeout=llm_timeout,
+            llm_retries=llm_retries,
+            game_timeout=game_timeout,
         )
-        state = _run_single_game(config, outdir)
-        rows.append(
-            {
-                "game_id": state.game_id,
-                "seed": seed,
-                "condition": condition,
-                "winner": state.winner,
-                "rounds": state.round_idx,
-                "traitor_win": state.winner == "traitors",
-                "faithful_win": state.winner == "faithful",
-            }
+        for seed in parse_seeds(seeds)
+    ]
+
+    def stop(rows: List[Dict[str, Any]]) -> bool:
+        return target_precision is not None and precision_reached(rows, target_precision, min_games)
+
+    failed_before = len(_read_dead_letters(outdir))
+    metrics_path = metrics_file or os.path.join(outdir, "metrics.prom")
+    with ProgressDisplay(len(configs), metrics_path, enabled=progress):
+        if concurrent_games > 1:
+            results = asyncio.run(
+                _run_games_async(configs, outdir, concurrent_games, record, stop, stand_in_llm)
+            )
+        else:
+            results = []
+            for config in configs:
+                llm = StandInLLM(config.seed) if stand_in_llm else None
+                row = _run_game_or_dead_letter(config, outdir, llm, record=record, profile=profile)
+                if row is not None:
+                    results.append(row)
+                if stop(results):
+                    break
+    if stop(results):
+        interval = win_rate_interval(results)
+        typer.echo(
+            f"Target precision reached after {len(results)} games: traitor win rate "
+            f"{interval['traitor_win_rate']:.2f} [{interval['low']:.2f}, {interval['high']:.2f}]"
         )
     summary_path = os.path.join(outdir, "summary.csv")
-    try:
-        import pandas as pd  # type: ignore
+    _write_batch_summary(summary_path, results)
+    failed = len(_read_dead_letters(outdir)) - failed_before
+    if failed:
+        typer.echo(f"{failed} games failed; see {os.path.join(outdir, _DEAD_LETTER)} and run retry-failed")
+    typer.echo(f"Wrote {summary_path}")
 
-        df = pd.DataFrame(rows)
-        df.to_csv(summary_path, index=False)
-    except Exception:
-        import csv
 
-        with open(summary_path, "w", newline="", encoding="utf-8") as handle:
-            writer = csv.DictWriter(handle, fieldnames=list(rows[0].keys()))
-            writer.writeheader()
-            writer.writerows(rows)
+@app.command("replay")
+def replay(
+    game_id: str = typer.Argument(..., help="Game id of a run recorded with --record"),
+    logdir: str = typer.Option("results/logs", help="Directory holding the recorded game"),
+    outdir: str = typer.Option("results/replay", help="Output directory for the replayed game"),
+) -> None:
+    _configure_output(verbose=True)
+    with open(os.path.join(logdir, f"{game_id}_summary.json"), "r", encoding="utf-8") as handle:
+        config = GameConfig.model_validate(json.load(handle)["config"])
+    llm = ReplayLLM(transcript_path(logdir, game_id))
+    replay_log = os.path.join(outdir, "logs", f"{game_id}.jsonl")
+    if os.path.exists(replay_log):
+        os.remove(replay_log)
+    _run_single_game(config, outdir, llm)
+    mismatch = compare_event_logs(os.path.join(logdir, f"{game_id}.jsonl"), replay_log)
+    typer.echo(json.dumps({
+        "game_id": game_id,
+        "identical": mismatch is None,
+        "first_mismatch": None if mismatch is None else mismatch[0],
+        "unused_responses": llm.unused(),
+    }))
+    if mismatch is not None:
+        raise typer.Exit(code=1)
+
+
+@app.command("golden-record")
+def golden_record(
+    corpus: str = typer.Argument("tests/golden", help="Directory holding the golden games"),
+    seeds: Optional[str] = typer.Option(None, help="Record fresh games for these seeds instead of the corpus's configs"),
+    n_players: int = typer.Option(5, help="Number of players for --seeds"),
+    n_traitors: int = typer.Option(1, help="Number of traitors for --seeds"),
+    max_rounds: int = typer.Option(4, help="Maximum rounds for --seeds"),
+) -> None:
+    if seeds is not None:
+        configs = [
+            GameConfig(seed=seed, n_players=n_players, n_traitors=n_traitors, max_rounds=max_rounds)
+            for seed in parse_seeds(seeds)
+        ]
+    else:
+        configs = [GameConfig.model_validate(case["config"]) for case in load_manifest(corpus)["cases"]]
+    typer.echo(f"Wrote {record_golden(configs, corpus)}")
+
+
+@app.command("golden-check")
+def golden_check(
+    corpus: str = typer.Argument("tests/golden", help="Directory holding the golden games"),
+    outdir: str = typer.Option("results/golden", help="Output directory for the replayed games"),
+    set_: List[str] = typer.Option([], "--set", help="Config override KEY=VALUE (JSON value), e.g. pipeline=true"),
+    async_graph: bool = typer.Option(False, help="Replay through the async graph"),
+    max_slowdown: float = typer.Option(2.0, help="Allowed runtime as a multiple of the stored baseline"),
+    slack: float = typer.Option(0.5, help="Extra seconds allowed on top of the scaled baseline"),
+) -> None:
+    overrides: Dict[str, Any] = {}
+    for item in set_:
+        key, _, value = item.partition("=")
+        try:
+            overrides[key] = json.loads(value)
+        except json.JSONDecodeError:
+            overrides[key] = value
+    results = check_golden(corpus, outdir, overrides, max_slowdown, slack, use_async=async_graph)
+    for result in results:
+        typer.echo(json.dumps(result))
+    if not all(result["passed"] for result in results):
+        raise typer.Exit(code=1)
+
+
+@app.command("retry-failed")
+def retry_failed(
+    outdir: str = typer.Option("results", help="Output directory holding dead_letter.jsonl"),
+    transient_only: bool = typer.Option(False, help="Only retry games that failed with transient errors"),
+) -> None:
+    load_env()
+    _configure_output(verbose=True)
+    latest: Dict[str, Dict[str, Any]] = {}
+    for entry in _read_dead_letters(outdir):
+        latest[entry.get("job_key", entry["game_id"])] = entry
+    retry = [entry for entry in latest.values() if entry["transient"] or not transient_only]
+    keep = [entry for entry in latest.values() if entry not in retry]
+    rows = []
+    recovered = 0
+    for entry in retry:
+        config = GameConfig.model_validate(entry["config"])
+        partial_log = os.path.join(entry["outdir"], "logs", f"{entry['game_id']}.jsonl")
+        if os.path.exists(partial_log):
+            os.remove(partial_log)
+        try:
+            final_state = _run_single_game(config, entry["outdir"], summary_table=os.path.join(outdir, _GAMES_TABLE))
+            row = _game_row(config, final_state)
+            recovered += 1
+            # Grid games live in partition directories; their rows go back into the
+            # grid summary so the next run-grid counts them as done.
+            if os.path.abspath(entry["outdir"]) != os.path.abspath(outdir):
+                grid_row = {**row, "job_key": job_key(config), "config_hash": config_hash(config)}
+                append_table_row(os.path.join(outdir, "grid_summary.csv"), SUMMARY_FIELDS, grid_row)
+            else:
+                rows.append(row)
+        except Exception as exc:  # noqa: BLE001
+            log.warning(f"\n❌ Game {entry['game_id']} failed again: {type(exc).__name__}: {exc}")
+            keep.append({**entry, "error_type": type(exc).__name__, "error": str(exc), "transient": is_transient(exc)})
+    with open(os.path.join(outdir, _DEAD_LETTER), "w", encoding="utf-8") as handle:
+        for entry in keep:
+            handle.write(json.dumps(entry) + "\n")
+    if rows:
+        _write_batch_summary(os.path.join(outdir, "summary.csv"), rows, append=True)
+    typer.echo(json.dumps({"retried": len(retry), "recovered": recovered, "still_failed": len(keep)}))
+
+
+@app.command("analyze-beliefs")
+def analyze_beliefs(
+    logdir: str = typer.Option("results/logs", help="Directory searched recursively for game logs"),
+    outdir: str = typer.Option("results/analysis", help="Where the metric tables are written"),
+    convergence_threshold: float = typer.Option(0.75, help="Share of players agreeing on a top suspect"),
+) -> None:
+    tensor = load_log_dir(logdir)
+    paths = write_tables(suspicion_report(tensor, convergence_threshold), outdir)
+    typer.echo(json.dumps({"games": len(tensor.game_ids), "tables": paths}))
+
+
+@app.command("bench-steps")
+def bench_steps(
+    rounds: str = typer.Option("1,30", help="Comma-separated rounds whose history the state carries"),
+    n_players: int = typer.Option(9, help="Number of players"),
+    discussion_turns: int = typer.Option(1, help="Discussion turns per round"),
+    steps: int = typer.Option(20, help="Graph steps per pass"),
+    repeats: int = typer.Option(10, help="Passes to average over"),
+) -> None:
+    config = GameConfig(seed=1, n_players=n_players, discussion_turns=discussion_turns)
+    for round_idx in [int(value) for value in rounds.split(",")]:
+        state = add_history(_init_game_state(config), round_idx)
+        seconds = step_overhead(state, steps, repeats)
+        typer.echo(json.dumps({
+            "round": round_idx,
+            "public_messages": len(state.public_transcript),
+            "us_per_step": round(seconds * 1e6, 1),
+        }))
+
+
+@app.command("run-grid")
+def run_grid_command(
+    spec_path: str = typer.Argument(..., help="Grid spec (.toml, .yaml or .yml)"),
+    outdir: str = typer.Option("results/grid", help="Output directory"),
+    workers: Optional[int] = typer.Option(None, help="Override the spec's worker count"),
+    progress: bool = typer.Option(True, help="Show one progress line instead of per-event output"),
+    metrics_file: Optional[str] = typer.Option(None, help="Prometheus text metrics file (default OUTDIR/metrics.prom)"),
+) -> None:
+    load_env()
+    _configure_output(verbose=not progress)
+    spec = load_grid_spec(spec_path)
+    if workers is not None:
+        spec = spec.model_copy(update={"workers": workers})
+    total = len(expand_grid(spec)) - len(completed_jobs(os.path.join(outdir, "grid_summary.csv")))
+    with ProgressDisplay(total, metrics_file or os.path.join(outdir, "metrics.prom"), enabled=progress):
+        summary_path = run_grid(spec, outdir, _grid_game_runner(spec, outdir))
     typer.echo(f"Wrote {summary_path}")
 
 
+def _grid_game_runner(spec: GridSpec, outdir: str):
+    limiter = RateLimiter(spec.requests_per_second, burst=spec.workers) if spec.requests_per_second else None
+
+    # Workers share the process-wide clients and one rate limiter across every model a game routes to.
+    def run_game(config: GameConfig, game_outdir: str) -> Optional[Dict[str, Any]]:
+        return _run_game_or_dead_letter(config, game_outdir, dead_letter_dir=outdir, limiter=limiter)
+
+    return run_game
+
+
 if __name__ == "__main__":
     app()
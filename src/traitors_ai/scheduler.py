@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Hashable, List, NamedTuple, Optional
+
+
+class AgentCall(NamedTuple):
+    agent: Any
+    method: str
+    view: Dict[str, object]
+    key: Optional[Hashable] = None
+
+    def run(self) -> Any:
+        return getattr(self.agent, self.method)(self.view)
+
+    async def arun(self) -> Any:
+        return await getattr(self.agent, "a" + self.method)(self.view)
+
+
+class Prefetch(NamedTuple):
+    calls: List[AgentCall]
+
+
+# Graph nodes yield AgentCall and Prefetch requests and a scheduler decides when
+# the underlying LLM calls actually run. Results are always handed back to the
+# node in the order it asked for them.
+class InlineScheduler:
+    def prefetch(self, call: AgentCall) -> None:
+        return None
+
+    def take(self, call: AgentCall) -> Any:
+        return call.run()
+
+    def resolve(self, request: AgentCall | Prefetch) -> Any:
+        if isinstance(request, Prefetch):
+            for call in request.calls:
+                self.prefetch(call)
+            return None
+        if request.key is None:
+            return request.run()
+        return self.take(request)
+
+    def shutdown(self) -> None:
+        return None
+
+
+# Keys are (round_idx, phase, player_id). Nodes prefetch calls whose inputs are
+# already final and later take them in their usual order, so results are
+# committed in the same deterministic order as the inline scheduler.
+class PhaseScheduler(InlineScheduler):
+    def __init__(self, max_workers: int = 8) -> None:
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="traitors-llm")
+        self._pending: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def prefetch(self, call: AgentCall) -> None:
+        with self._lock:
+            if call.key not in self._pending:
+                self._pending[call.key] = self._executor.submit(call.run)
+
+    def take(self, call: AgentCall) -> Any:
+        with self._lock:
+            future = self._pending.pop(call.key, None)
+        if future is None:
+            return call.run()
+        return future.result()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            for future in self._pending.values():
+                future.cancel()
+            self._pending.clear()
+        self._executor.shutdown(wait=True)
+
+
+class AsyncInlineScheduler:
+    def prefetch(self, call: AgentCall) -> None:
+        return None
+
+    async def take(self, call: AgentCall) -> Any:
+        return await call.arun()
+
+    async def aresolve(self, request: AgentCall | Prefetch) -> Any:
+        if isinstance(request, Prefetch):
+            for call in request.calls:
+                self.prefetch(call)
+            return None
+        if request.key is None:
+            return await request.arun()
+        return await self.take(request)
+
+    async def ashutdown(self) -> None:
+        return None
+
+
+class AsyncPhaseScheduler(AsyncInlineScheduler):
+    def __init__(self) -> None:
+        self._pending: Dict[Hashable, asyncio.Future] = {}
+
+    def prefetch(self, call: AgentCall) -> None:
+        if call.key not in self._pending:
+            self._pending[call.key] = asyncio.ensure_future(call.arun())
+
+    async def take(self, call: AgentCall) -> Any:
+        task = self._pending.pop(call.key, None)
+        if task is None:
+            return await call.arun()
+        return await task
+
+    async def ashutdown(self) -> None:
+        for task in self._pending.values():
+            task.cancel()
+        await asyncio.gather(*self._pending.values(), return_exceptions=True)
+        self._pending.clear()
+
+
+def create_scheduler(config) -> InlineScheduler:
+    if config.pipeline or config.discussion_mode == "simultaneous" or config.night_mode == "consensus":
+        return PhaseScheduler(max_workers=max(1, config.n_players))
+    return InlineScheduler()
+
+
+def create_async_scheduler(config) -> AsyncInlineScheduler:
+    if config.pipeline or config.discussion_mode == "simultaneous" or config.night_mode == "consensus":
+        return AsyncPhaseScheduler()
+    return AsyncInlineScheduler()
+
+
+__all__ = [
+    "AgentCall",
+    "Prefetch",
+    "InlineScheduler",
+    "PhaseScheduler",
+    "AsyncInlineScheduler",
+    "AsyncPhaseScheduler",
+    "create_scheduler",
+    "create_async_scheduler",
+]
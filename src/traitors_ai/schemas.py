@@ -1,11 +1,16 @@
 from __future__ import annotations
 
 import random
+from collections import deque
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, GetCoreSchemaHandler, field_validator, model_validator
+from pydantic_core import core_schema
+
+# Prompts summarise the last this-many messages of each transcript.
+TRANSCRIPT_TAIL = 6
 
 
 class GameConfig(BaseModel):
@@ -13,12 +18,39 @@ class GameConfig(BaseModel):
     n_traitors: int = 2
     max_rounds: int = 30
     discussion_turns: int = 1
+    discussion_mode: str = "legacy"
+    night_mode: str = "legacy"
     message_char_limit: int = 400
     seed: int
     model_name: str = "gpt-4o-mini"
+    model_routes: Dict[str, str] = Field(default_factory=dict)
+    escalation_model: Optional[str] = None
+    escalate_after: int = 1
+    model_prices: Dict[str, List[float]] = Field(default_factory=dict)
     temperature: float = 0.3
     condition_name: str = "baseline_memory"
     tie_break_rule: str = "revote_once_then_random"
+    rules: str = "plurality"
+    rule_options: Dict[str, Any] = Field(default_factory=dict)
+    pipeline: bool = False
+    adaptive_rounds: bool = False
+    convergence_threshold: float = 0.75
+    belief_stability_epsilon: float = 0.05
+    belief_log_mode: str = "full"
+    belief_keyframe_interval: int = 5
+    transcript_window: Optional[int] = 64
+    prompt_cache: Optional[str] = None
+    llm_timeout: Optional[float] = 120.0
+    llm_retries: int = 2
+    game_timeout: Optional[float] = None
+
+    @field_validator("transcript_window")
+    @classmethod
+    def validate_transcript_window(cls, value: Optional[int]) -> Optional[int]:
+        # A smaller window would send every prompt's summary back to the log file.
+        if value is not None and value < TRANSCRIPT_TAIL:
+            raise ValueError(f"transcript_window must be at least {TRANSCRIPT_TAIL}")
+        return value
 
 
 class Role(str, Enum):
@@ -66,6 +98,7 @@ class AgentPrivateState(BaseModel):
     suspicion_scores: Dict[int, float] = Field(default_factory=dict)
     alliances: List[int] = Field(default_factory=list)
     last_rationale: Optional[str] = None
+    belief_shift: Optional[float] = None
 
     @field_validator("suspicion_scores")
     @classmethod
@@ -86,6 +119,72 @@ class BeliefUpdate(BaseModel):
         return value
 
 
+# LangGraph rebuilds GameState from its channels before every node, and pydantic
+# would copy and re-check each growing history list every time. A SharedList is
+# accepted as is, so every step holds the same list and costs the same in round 30
+# as in round 1.
+class SharedList(list):
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
+        return core_schema.no_info_plain_validator_function(
+            lambda value: value if isinstance(value, cls) else cls(value),
+            serialization=core_schema.plain_serializer_function_ser_schema(list),
+        )
+
+
+# Prompts only read the tail of a transcript, so a game keeps the last `maxlen`
+# messages in memory and leaves older ones in its event log, where load_spilled
+# reads back the first n on demand. Without a loader nothing is dropped. Shared by
+# reference in GameState like SharedList.
+class Transcript:
+    def __init__(
+        self,
+        messages: Iterable[Any] = (),
+        maxlen: Optional[int] = None,
+        load_spilled: Optional[Callable[[int], List[Any]]] = None,
+    ) -> None:
+        self.maxlen = maxlen if load_spilled is not None else None
+        self._load_spilled = load_spilled
+        self._recent: deque = deque()
+        self.spilled = 0
+        for message in messages:
+            self.append(message)
+
+    def append(self, message: Any) -> None:
+        self._recent.append(message)
+        if self.maxlen is not None and len(self._recent) > self.maxlen:
+            self._recent.popleft()
+            self.spilled += 1
+
+    def history(self) -> List[Any]:
+        older = self._load_spilled(self.spilled) if self.spilled else []
+        return older + list(self._recent)
+
+    def __len__(self) -> int:
+        return self.spilled + len(self._recent)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.history())
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1 and start >= self.spilled:
+                return list(self._recent)[start - self.spilled : stop - self.spilled]
+            return self.history()[index]
+        position = index + len(self) if index < 0 else index
+        if position >= self.spilled:
+            return self._recent[position - self.spilled]
+        return self.history()[index]
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
+        return core_schema.no_info_plain_validator_function(
+            lambda value: value if isinstance(value, cls) else cls(value),
+            serialization=core_schema.plain_serializer_function_ser_schema(lambda value: value.history()),
+        )
+
+
 class GameState(BaseModel):
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
@@ -96,15 +195,41 @@ class GameState(BaseModel):
     alive: Set[int]
     roles: Dict[int, Role]
     traitors: Set[int]
-    public_transcript: List[PublicMessage]
-    vote_history: List[Dict[str, Any]]
-    traitor_private_transcript: List[PublicMessage]
+    public_transcript: Transcript
+    vote_history: SharedList[Dict[str, Any]]
+    traitor_private_transcript: Transcript
     agent_states: Dict[int, AgentPrivateState]
     rng: random.Random
     eliminated_order: List[int] = Field(default_factory=list)
     winner: Optional[str] = None
 
 
+# One row per finished game with a fixed set of columns, so a whole corpus can be
+# aggregated from the shared games table without opening any event logs.
+class GameSummary(BaseModel):
+    game_id: str
+    seed: int
+    condition: str
+    model_name: str
+    temperature: float
+    n_players: int
+    n_traitors: int
+    rules: str
+    winner: Optional[str]
+    rounds: int
+    traitor_win: bool
+    faithful_win: bool
+    eliminated_order: List[int]
+    eliminated_roles: List[str]
+    banish_correct: List[Optional[bool]]
+    banish_accuracy: Optional[float]
+    llm_calls: int = 0
+    llm_errors: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    wall_seconds: float
+
+
 def validate_vote_action(vote: VoteAction, voter_id: int, alive: Set[int]) -> None:
     if voter_id == vote.target_id:
         raise ValueError("Voter cannot vote for self")
@@ -121,6 +246,9 @@ __all__ = [
     "EventLogRow",
     "AgentPrivateState",
     "BeliefUpdate",
+    "SharedList",
+    "Transcript",
     "GameState",
+    "GameSummary",
     "validate_vote_action",
 ]
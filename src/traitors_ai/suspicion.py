@@ -0,0 +1,316 @@
+from __future__ import annotations
+
+import csv
+import glob
+import json
+import os
+from typing import Any, Dict, Iterable, List
+
+from .logging_utils import decode_belief_updates
+
+try:
+    import numpy as np  # type: ignore
+except ImportError:  # pragma: no cover - optional analysis dependency
+    np = None
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+Table = Dict[str, Any]
+
+# Only these rows matter here; other lines are skipped before they are parsed.
+_ACTIONS = ("assign_roles", "belief_update", "public_message", "banish_result", "murder_result", "recruit_result")
+_MARKERS = tuple(f'"action_type":"{action}"' for action in _ACTIONS) + tuple(
+    f'"action_type": "{action}"' for action in _ACTIONS
+)
+_NEVER = 1 << 30
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise RuntimeError('Suspicion analytics require numpy (pip install -e ".[analysis]")')
+
+
+def _game_events(log_path: str) -> List[Dict[str, Any]]:
+    loads = orjson.loads if orjson is not None else json.loads
+    with open(log_path, "r", encoding="utf-8") as handle:
+        events = [loads(line) for line in handle if any(marker in line for marker in _MARKERS)]
+    return decode_belief_updates(events)
+
+
+class _Game:
+    def __init__(self, events: List[Dict[str, Any]]) -> None:
+        self.game_id = events[0]["game_id"] if events else ""
+        self.roles: Dict[int, str] = {}
+        self.recruited: Dict[int, int] = {}
+        self.eliminated: Dict[int, int] = {}
+        self.beliefs: List[tuple] = []
+        self.speeches: List[tuple] = []
+        self.rounds = 0
+        for event in events:
+            action, round_idx, payload = event["action_type"], int(event["round"]), event["payload"]
+            self.rounds = max(self.rounds, round_idx)
+            if action == "assign_roles":
+                self.roles = {int(pid): role for pid, role in payload["roles"].items()}
+            elif action == "belief_update":
+                # Scores are logged as the model returned them, so drop self-scores and
+                # keys that are not players at this table.
+                observer = int(event["actor_id"])
+                for target, score in payload.get("scores", {}).items():
+                    target = int(target) if str(target).isdigit() else 0
+                    if target != observer and target in self.roles:
+                        self.beliefs.append((round_idx, observer, target, float(score)))
+            elif action == "public_message":
+                self.speeches.append((round_idx, int(payload["speaker_id"])))
+            elif action == "recruit_result":
+                self.recruited[int(payload["recruited"])] = round_idx
+            elif payload.get("eliminated") is not None:
+                for pid in [payload["eliminated"], *payload.get("also_eliminated", [])]:
+                    self.eliminated[int(pid)] = round_idx
+
+
+# Suspicion scores of a corpus as dense arrays indexed [game, round, observer, target],
+# with rounds and players zero-based (round 1 and player P1 are index 0). Missing
+# scores are NaN; an observer skipped by adaptive rounds keeps its last scores.
+class SuspicionTensor:
+    def __init__(self, games: List[_Game]) -> None:
+        _require_numpy()
+        n_games = len(games)
+        n_rounds = max([game.rounds for game in games] + [1])
+        n_players = max([max(game.roles, default=0) for game in games] + [1])
+        self.game_ids = [game.game_id for game in games]
+        self.scores = np.full((n_games, n_rounds, n_players, n_players), np.nan, dtype=np.float32)
+        self.spoke = np.zeros((n_games, n_rounds, n_players), dtype=np.int16)
+        traitor_from = np.full((n_games, n_players), _NEVER, dtype=np.int32)
+        eliminated_in = np.full((n_games, n_players), _NEVER, dtype=np.int32)
+        present = np.zeros((n_games, n_players), dtype=bool)
+        for index, game in enumerate(games):
+            for pid, role in game.roles.items():
+                present[index, pid - 1] = True
+                if role == "traitor":
+                    traitor_from[index, pid - 1] = 0
+            for pid, round_idx in game.recruited.items():
+                traitor_from[index, pid - 1] = round_idx
+            for pid, round_idx in game.eliminated.items():
+                eliminated_in[index, pid - 1] = round_idx
+            if game.beliefs:
+                rounds, observers, targets, values = np.array(game.beliefs, dtype=np.float64).T
+                self.scores[index, rounds.astype(int) - 1, observers.astype(int) - 1, targets.astype(int) - 1] = values
+            if game.speeches:
+                rounds, speakers = np.array(game.speeches, dtype=np.int64).T
+                np.add.at(self.spoke, (index, rounds - 1, speakers - 1), 1)
+        self.rounds_played = np.array([game.rounds for game in games], dtype=np.int32)
+        round_numbers = np.arange(1, n_rounds + 1)[None, :, None]
+        # Beliefs are updated at the start of a round, after the last round's eliminations.
+        self.alive = (
+            present[:, None, :]
+            & (eliminated_in[:, None, :] >= round_numbers)
+            & (round_numbers <= self.rounds_played[:, None, None])
+        )
+        self.traitor = traitor_from[:, None, :] < round_numbers
+        self._forward_fill()
+
+    def _forward_fill(self) -> None:
+        pair_alive = self.alive[:, :, :, None] & self.alive[:, :, None, :]
+        n_rounds = self.scores.shape[1]
+        seen = np.where(~np.isnan(self.scores), np.arange(n_rounds)[None, :, None, None], -1)
+        last = np.maximum.accumulate(seen, axis=1)
+        filled = np.take_along_axis(self.scores, np.clip(last, 0, None), axis=1)
+        filled[last < 0] = np.nan
+        self.scores = np.where(pair_alive, filled, np.nan).astype(np.float32)
+
+    @property
+    def shape(self):
+        return self.scores.shape
+
+    def faithful_observers(self):
+        return self.alive & ~self.traitor
+
+
+def load_suspicion_tensor(log_paths: Iterable[str]) -> SuspicionTensor:
+    _require_numpy()
+    return SuspicionTensor([_Game(_game_events(path)) for path in log_paths])
+
+
+def load_log_dir(logdir: str) -> SuspicionTensor:
+    paths = [
+        path
+        for path in sorted(glob.glob(os.path.join(logdir, "**", "*.jsonl"), recursive=True))
+        if not path.endswith(("_llm.jsonl", "dead_letter.jsonl"))
+    ]
+    return load_suspicion_tensor(paths)
+
+
+def _index_columns(tensor: SuspicionTensor, mask, names: List[str]) -> Table:
+    indices = np.nonzero(mask)
+    table: Table = {"game_id": np.asarray(tensor.game_ids, dtype=object)[indices[0]]}
+    for name, values in zip(names, indices[1:]):
+        table[name] = values + 1
+    return table
+
+
+# Mann-Whitney AUC of faithful observers' scores, traitors against faithful targets,
+# pooled over observers per game and round. Ties count half.
+def suspicion_auc(tensor: SuspicionTensor, chunk_elements: int = 20_000_000) -> Table:
+    n_games, n_rounds, n_players, _ = tensor.shape
+    wins = np.zeros((n_games, n_rounds))
+    pairs = np.zeros((n_games, n_rounds))
+    observers = tensor.faithful_observers()
+    step = max(1, chunk_elements // max(1, n_rounds * n_players**3))
+    for start in range(0, n_games, step):
+        chunk = slice(start, start + step)
+        scores = tensor.scores[chunk]
+        valid = ~np.isnan(scores) & observers[chunk][:, :, :, None]
+        traitor = tensor.traitor[chunk][:, :, None, :]
+        positive = valid & traitor
+        negative = valid & ~traitor
+        diff = scores[..., :, None] - scores[..., None, :]
+        both = positive[..., :, None] & negative[..., None, :]
+        score = np.where(diff > 0, 1.0, np.where(diff == 0, 0.5, 0.0))
+        wins[chunk] = np.where(both, score, 0.0).sum(axis=(2, 3, 4))
+        pairs[chunk] = both.sum(axis=(2, 3, 4))
+    mask = pairs > 0
+    table = _index_columns(tensor, mask, ["round"])
+    table["auc"] = wins[mask] / pairs[mask]
+    table["pairs"] = pairs[mask].astype(np.int64)
+    return table
+
+
+# Per round: spread of scores across observers (mean over targets of the standard
+# deviation) and the share of observers whose unique top suspect is the most common
+# one. A game converges in the first round that share reaches the threshold.
+def belief_convergence(tensor: SuspicionTensor, threshold: float = 0.75) -> Dict[str, Table]:
+    scores = tensor.scores
+    valid = ~np.isnan(scores)
+    counts = valid.sum(axis=2)
+    zeroed = np.where(valid, scores, 0.0)
+    mean = zeroed.sum(axis=2) / np.maximum(counts, 1)
+    variance = (np.where(valid, scores - mean[:, :, None, :], 0.0) ** 2).sum(axis=2) / np.maximum(counts, 1)
+    target_ok = counts >= 2
+    dispersion = np.where(target_ok, np.sqrt(variance), 0.0).sum(axis=2) / np.maximum(target_ok.sum(axis=2), 1)
+
+    masked = np.where(valid, scores, -np.inf)
+    best = masked.max(axis=3, keepdims=True)
+    has_scores = valid.any(axis=3)
+    unique_top = has_scores & ((masked == best).sum(axis=3) == 1)
+    top = masked.argmax(axis=3)
+    votes = np.zeros(scores.shape[:3], dtype=np.int32)
+    games, rounds, _ = np.nonzero(unique_top)
+    np.add.at(votes, (games, rounds, top[unique_top]), 1)
+    observers = has_scores.sum(axis=2)
+    agreement = np.where(observers > 0, votes.max(axis=2) / np.maximum(observers, 1), 0.0)
+
+    mask = observers > 0
+    rounds_table = _index_columns(tensor, mask, ["round"])
+    rounds_table["dispersion"] = dispersion[mask]
+    rounds_table["top_agreement"] = agreement[mask]
+    rounds_table["top_suspect"] = votes.argmax(axis=2)[mask] + 1
+    rounds_table["top_suspect_is_traitor"] = np.take_along_axis(
+        tensor.traitor, votes.argmax(axis=2)[:, :, None], axis=2
+    )[:, :, 0][mask]
+
+    reached = (agreement >= threshold) & mask
+    first = np.where(reached.any(axis=1), reached.argmax(axis=1) + 1, -1)
+    games_table: Table = {
+        "game_id": np.asarray(tensor.game_ids, dtype=object),
+        "rounds": tensor.rounds_played,
+        "convergence_round": first,
+        "converged": first > 0,
+    }
+    return {"rounds": rounds_table, "games": games_table}
+
+
+# How far other observers move toward a speaker's position after the speaker talks:
+# the speaker's centred scores in round r dotted with each listener's score change
+# from r to r + 1 over targets other than the two of them, averaged over listeners.
+def speaker_influence(tensor: SuspicionTensor) -> Table:
+    scores = tensor.scores
+    if scores.shape[1] < 2:
+        return {"game_id": np.array([], dtype=object), "round": np.array([]), "speaker": np.array([])}
+    current, following = scores[:, :-1], scores[:, 1:]
+    n_players = scores.shape[-1]
+    valid = ~np.isnan(current)
+    counts = valid.sum(axis=3, keepdims=True)
+    centred = np.where(valid, current - np.where(valid, current, 0.0).sum(axis=3, keepdims=True) / np.maximum(counts, 1), 0.0)
+    shift_valid = ~np.isnan(current) & ~np.isnan(following)
+    shift = np.where(shift_valid, following - current, 0.0)
+
+    # Indexed [game, round, speaker, listener]. Self-scores are dropped on load, so the sums
+    # over targets already leave out both the speaker and the listener.
+    alignment = np.einsum("grst,grlt->grsl", centred, shift, optimize=True)
+    weights = np.einsum("grst,grlt->grsl", valid.astype(np.int32), shift_valid.astype(np.int32), optimize=True)
+    listener_ok = (weights > 0) & ~np.eye(n_players, dtype=bool)[None, None]
+    per_listener = np.where(listener_ok, alignment / np.maximum(weights, 1), 0.0)
+    listeners = listener_ok.sum(axis=3)
+
+    spoke = tensor.spoke[:, :-1] > 0
+    mask = spoke & (listeners > 0)
+    table = _index_columns(tensor, mask, ["round", "speaker"])
+    table["influence"] = per_listener.sum(axis=3)[mask] / listeners[mask]
+    table["listeners"] = listeners[mask]
+    table["speaker_is_traitor"] = tensor.traitor[:, :-1][mask]
+    return table
+
+
+# For each living traitor and round: the gap between how suspicious faithful
+# observers find them and how suspicious those observers find faithful players, and
+# the share of faithful observers who rate the traitor below their faithful average.
+def deception_success(tensor: SuspicionTensor) -> Table:
+    scores = tensor.scores
+    observers = tensor.faithful_observers()[:, :, :, None]
+    valid = ~np.isnan(scores) & observers
+    traitor = tensor.traitor[:, :, None, :]
+    faithful_targets = valid & ~traitor
+    faithful_counts = faithful_targets.sum(axis=3)
+    faithful_mean = np.where(faithful_targets, scores, 0.0).sum(axis=3) / np.maximum(faithful_counts, 1)
+    judged = valid & traitor & (faithful_counts > 0)[:, :, :, None]
+    gap = np.where(judged, scores - faithful_mean[:, :, :, None], 0.0)
+    judges = judged.sum(axis=2)
+    deceived = (judged & (gap < 0)).sum(axis=2)
+
+    mask = tensor.traitor & tensor.alive & (judges > 0)
+    table = _index_columns(tensor, mask, ["round", "traitor"])
+    table["suspicion_gap"] = gap.sum(axis=2)[mask] / judges[mask]
+    table["deceived_share"] = deceived[mask] / judges[mask]
+    table["observers"] = judges[mask]
+    return table
+
+
+def suspicion_report(tensor: SuspicionTensor, threshold: float = 0.75) -> Dict[str, Table]:
+    convergence = belief_convergence(tensor, threshold)
+    return {
+        "auc": suspicion_auc(tensor),
+        "convergence_rounds": convergence["rounds"],
+        "convergence_games": convergence["games"],
+        "speaker_influence": speaker_influence(tensor),
+        "deception": deception_success(tensor),
+    }
+
+
+def write_tables(tables: Dict[str, Table], outdir: str) -> List[str]:
+    os.makedirs(outdir, exist_ok=True)
+    paths = []
+    for name, table in tables.items():
+        path = os.path.join(outdir, f"{name}.csv")
+        columns = list(table)
+        with open(path, "w", newline="", encoding="utf-8") as handle:
+            writer = csv.writer(handle)
+            writer.writerow(columns)
+            writer.writerows(zip(*(np.asarray(table[column]).tolist() for column in columns)))
+        paths.append(path)
+    return paths
+
+
+__all__ = [
+    "SuspicionTensor",
+    "load_suspicion_tensor",
+    "load_log_dir",
+    "suspicion_auc",
+    "belief_convergence",
+    "speaker_influence",
+    "deception_success",
+    "suspicion_report",
+    "write_tables",
+]
@@ -0,0 +1,32 @@
+import random
+import tempfile
+
+import pytest
+
+from traitors_ai.agent import TraitorsAgent
+from traitors_ai.graph import build_graph
+from traitors_ai.logging_utils import JsonlLogger, read_events
+from traitors_ai.personas import assign_personas
+from traitors_ai.runner import _init_game_state
+from traitors_ai.scheduler import create_scheduler
+
+
+# Plays one game through the graph with every agent on `llm` and returns its logged
+# events. Each call logs to its own directory, so a test can play several games.
+@pytest.fixture
+def play_game(tmp_path):
+    def play(config, llm):
+        state = _init_game_state(config)
+        personas = assign_personas(config.n_players, random.Random(config.seed))
+        agents = {
+            pid: TraitorsAgent(pid, personas[pid - 1], state.roles[pid].value, llm, config)
+            for pid in range(1, config.n_players + 1)
+        }
+        logger = JsonlLogger(tempfile.mkdtemp(dir=tmp_path), state.game_id)
+        scheduler = create_scheduler(config)
+        build_graph(agents, logger, scheduler).invoke(state)
+        scheduler.shutdown()
+        logger.close()
+        return read_events(logger.log_path)
+
+    return play
@@ -0,0 +1,30 @@
+from traitors_ai.analysis import summarize_murder_decisions, summarize_skipped_work
+
+
+def _event(round_idx, action_type, payload):
+    return {"round": round_idx, "action_type": action_type, "payload": payload}
+
+
+def test_summarize_skipped_work_totals_rounds_and_calls():
+    events = [
+        _event(1, "public_message", {"speaker_id": 1}),
+        _event(1, "skipped_work", {"belief_updates_skipped": [], "speakers_skipped": [4, 5], "calls_saved": 4}),
+        _event(2, "skipped_work", {"belief_updates_skipped": [1, 2, 3], "speakers_skipped": [5], "calls_saved": 5}),
+        _event(2, "skipped_work", {"belief_updates_skipped": [4], "speakers_skipped": [], "calls_saved": 1}),
+    ]
+    assert summarize_skipped_work(events) == {
+        "rounds_with_skips": 2,
+        "belief_updates_skipped": 4,
+        "speakers_skipped": 3,
+        "calls_saved": 10,
+    }
+    assert summarize_skipped_work([])["calls_saved"] == 0
+
+
+def test_summarize_murder_decisions_counts_joint_nights():
+    events = [
+        _event(1, "murder_decision", {"path": "individual", "consensus_target": None, "calls": 3, "calls_saved": 0}),
+        _event(2, "murder", {"target_id": 4}),
+        _event(2, "murder_decision", {"path": "joint", "consensus_target": 4, "calls": 1, "calls_saved": 2}),
+    ]
+    assert summarize_murder_decisions(events) == {"nights": 2, "joint_nights": 1, "murder_calls": 4, "calls_saved": 2}
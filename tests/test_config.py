@@ -0,0 +1,12 @@
+from traitors_ai.config import get_shared_llm
+
+
+def test_shared_llm_is_reused_per_model_and_temperature(monkeypatch):
+    monkeypatch.setenv("LLM_PROVIDER", "openai")
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    first = get_shared_llm("gpt-4o-mini", 0.3)
+    assert get_shared_llm("gpt-4o-mini", 0.3) is first
+    other = get_shared_llm("gpt-4o-mini", 0.0)
+    assert other is not first
+    assert other.root_client._client is first.root_client._client
+    assert other.root_async_client._client is first.root_async_client._client
@@ -0,0 +1,95 @@
+import json
+import threading
+
+import pytest
+
+from traitors_ai.schemas import GameConfig
+
+
+class ScriptedLLM:
+    def __init__(self):
+        self.speak_prompts = []
+        self._lock = threading.Lock()
+
+    def invoke(self, prompt, **kwargs):
+        if "suspicion scores" in prompt:
+            return json.dumps({"scores": {}, "notes": ""})
+        if "banish vote" in prompt or "to murder" in prompt:
+            return json.dumps({"target_id": 1, "rationale": ""})
+        if "public discussion message" in prompt:
+            with self._lock:
+                self.speak_prompts.append(prompt)
+                return f"message {len(self.speak_prompts)}"
+        return "ok"
+
+
+class AgreeingLLM(ScriptedLLM):
+    def invoke(self, prompt, **kwargs):
+        if "suspicion scores" in prompt:
+            return json.dumps({"scores": {"6": 0.9}, "notes": ""})
+        return super().invoke(prompt, **kwargs)
+
+
+def _speak_summaries(mode, play_game):
+    config = GameConfig(seed=1, n_players=5, n_traitors=1, max_rounds=1, discussion_mode=mode)
+    llm = ScriptedLLM()
+    play_game(config, llm)
+    return [line for prompt in llm.speak_prompts for line in prompt.splitlines() if "transcript summary" in line]
+
+
+@pytest.mark.parametrize("mode", ["legacy", "simultaneous"])
+def test_speakers_share_round_start_snapshot(play_game, mode):
+    summaries = _speak_summaries(mode, play_game)
+    assert len(summaries) == 5
+    assert all("No public messages yet." in line for line in summaries)
+
+
+def test_sequential_speakers_see_earlier_messages(play_game):
+    summaries = _speak_summaries("sequential", play_game)
+    assert "No public messages yet." in summaries[0]
+    assert summaries[-1].count("message") == 4
+
+
+def test_agreeing_traitors_make_one_murder_call(play_game):
+    # Seed 1 makes P2 and P5 the traitors; every belief update ranks P6 first.
+    config = GameConfig(seed=1, n_players=6, n_traitors=2, max_rounds=2, night_mode="consensus")
+    events = [event for event in play_game(config, AgreeingLLM()) if event["round"] == 1]
+    murders = [event for event in events if event["action_type"] == "murder"]
+    decision = next(event for event in events if event["action_type"] == "murder_decision")
+    result = next(event for event in events if event["action_type"] == "murder_result")
+    assert len([event for event in events if event["action_type"] == "traitor_chat"]) == 2
+    assert len(murders) == 1 and murders[0]["payload"]["joint"]
+    assert decision["payload"]["path"] == "joint" and decision["payload"]["calls_saved"] == 1
+    assert result["payload"]["eliminated"] == 6
+
+
+def test_recruit_night_still_carries_out_remaining_murders(play_game):
+    config = GameConfig(
+        seed=2, n_players=7, n_traitors=2, max_rounds=2, rule_options={"recruitment": True, "murders_per_night": 2}
+    )
+    events = play_game(config, ScriptedLLM())
+    results = {event["action_type"]: event["payload"] for event in events if event["round"] == 1}
+    recruit = results["recruit_result"]["recruited"]
+    murdered = results["murder_result"]["eliminated"]
+    assert murdered is not None and murdered != recruit
+
+
+class CountingAgreeingLLM(AgreeingLLM):
+    calls = 0
+
+    def invoke(self, prompt, **kwargs):
+        self.calls += 1
+        return super().invoke(prompt, **kwargs)
+
+
+def test_adaptive_rounds_skip_work_once_beliefs_converge(play_game):
+    config = GameConfig(seed=2, n_players=8, n_traitors=2, max_rounds=3)
+    full, adaptive = CountingAgreeingLLM(), CountingAgreeingLLM()
+    play_game(config, full)
+    events = play_game(config.model_copy(update={"adaptive_rounds": True}), adaptive)
+    skipped = [event["payload"] for event in events if event["action_type"] == "skipped_work"]
+    # Everyone agrees on P6 from round 1, so late speakers are skipped and stable
+    # beliefs are not re-queried in later rounds.
+    assert skipped and skipped[0]["consensus_target"] == 6 and skipped[0]["speakers_skipped"]
+    assert any(payload["belief_updates_skipped"] for payload in skipped)
+    assert sum(payload["calls_saved"] for payload in skipped) == full.calls - adaptive.calls > 0
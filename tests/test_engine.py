@@ -1,6 +1,6 @@
 import random
 
-from traitors_ai.game_engine import apply_murder, assign_roles, check_terminal
+from traitors_ai.game_engine import apply_murder, assign_roles, check_terminal, murder_consensus, suspicion_consensus
 
 
 def test_assign_roles_counts():
@@ -26,3 +26,22 @@ def test_terminal_conditions():
     assert check_terminal({1, 2}, set()) == "faithful"
     assert check_terminal({1, 2}, {1}) == "traitors"
     assert check_terminal({1, 2, 3}, {1}) is None
+
+
+def test_suspicion_consensus_ignores_ties_and_dead_targets():
+    suspicion = {
+        1: {2: 0.9, 3: 0.1, 4: 0.95},
+        2: {1: 0.2, 3: 0.4, 4: 0.4},
+        3: {1: 0.1, 2: 0.8, 4: 0.3},
+    }
+    target, share = suspicion_consensus(suspicion, alive={1, 2, 3})
+    assert target == 2
+    assert share == 2 / 3
+
+
+def test_murder_consensus_needs_every_traitor_to_agree():
+    suspicion = {1: {3: 0.9, 4: 0.2, 2: 0.99}, 2: {3: 0.7, 4: 0.6}}
+    assert murder_consensus(suspicion, [1, 2], candidates={3, 4}) == 3
+    assert murder_consensus(suspicion, [1, 2], candidates={4}) == 4
+    suspicion[2] = {3: 0.6, 4: 0.6}
+    assert murder_consensus(suspicion, [1, 2], candidates={3, 4}) is None
@@ -0,0 +1,24 @@
+import os
+
+import pytest
+
+from traitors_ai.golden import check_golden
+
+CORPUS = os.path.join(os.path.dirname(__file__), "golden")
+
+
+# Engine changes that should not alter behaviour must replay the corpus exactly;
+# after an intended change, re-record it with `golden-record`.
+@pytest.mark.parametrize(
+    "overrides, use_async",
+    [({}, False), ({"pipeline": True}, False), ({"transcript_window": 6}, False), ({}, True)],
+)
+def test_golden_games_replay_identically(tmp_path, overrides, use_async):
+    results = check_golden(CORPUS, str(tmp_path), overrides, max_slowdown=5.0, slack=2.0, use_async=use_async)
+    assert len(results) == 3
+    assert all(result["passed"] for result in results), results
+
+
+def test_behaviour_change_is_caught(tmp_path):
+    results = check_golden(CORPUS, str(tmp_path), {"discussion_mode": "simultaneous"})
+    assert not any(result["passed"] for result in results)
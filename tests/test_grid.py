@@ -0,0 +1,58 @@
+import json
+
+from traitors_ai.grid import GridSpec, expand_grid, job_key
+
+
+def test_expand_grid_covers_every_cell_with_unique_job_keys():
+    spec = GridSpec(
+        conditions=["baseline_memory", "no_memory"],
+        models=["gpt-4o-mini"],
+        temperatures=[0.0, 0.5],
+        table_sizes=[{"n_players": 6, "n_traitors": 1}],
+        seeds="1..3",
+        base={"max_rounds": 10},
+    )
+    configs = expand_grid(spec)
+    assert len(configs) == 12
+    assert all(config.max_rounds == 10 and config.n_players == 6 for config in configs)
+    assert len({job_key(config) for config in configs}) == 12
+
+
+def test_precision_reached_needs_min_games_and_narrow_interval():
+    from traitors_ai.analysis import precision_reached, wilson_interval
+
+    rows = [{"winner": "traitors"}] * 40
+    assert not precision_reached(rows[:5], target_half_width=0.5, min_games=10)
+    assert precision_reached(rows, target_half_width=0.05, min_games=10)
+    low, high = wilson_interval(5, 10)
+    assert low < 0.5 < high
+
+
+class BrokenLLM:
+    def invoke(self, prompt, **kwargs):
+        raise ValueError("bad request")
+
+
+def test_retry_failed_keeps_grid_cells_that_share_a_seed_apart(tmp_path, monkeypatch):
+    from traitors_ai import runner
+    from traitors_ai.grid import completed_jobs, partition_dir
+    from traitors_ai.llm import LLMTimeoutError
+    from traitors_ai.profiling import StandInLLM
+    from traitors_ai.schemas import GameConfig
+
+    configs = [GameConfig(seed=1, n_players=n_players, n_traitors=1, max_rounds=2) for n_players in (4, 5)]
+    for config in configs:
+        runner._dead_letter(str(tmp_path), config, partition_dir(str(tmp_path), config), LLMTimeoutError("slow"))
+
+    # Both cells fail again and both stay in the dead letter file.
+    monkeypatch.setattr(runner, "get_shared_llm", lambda model_name, temperature: BrokenLLM())
+    runner.retry_failed(outdir=str(tmp_path), transient_only=False)
+    lines = (tmp_path / "dead_letter.jsonl").read_text().splitlines()
+    assert sorted(json.loads(line)["job_key"] for line in lines) == sorted(job_key(config) for config in configs)
+
+    monkeypatch.setattr(runner, "get_shared_llm", lambda model_name, temperature: StandInLLM(1))
+    runner.retry_failed(outdir=str(tmp_path), transient_only=False)
+    done = completed_jobs(str(tmp_path / "grid_summary.csv"))
+    assert all(job_key(config) in done for config in configs)
+    assert not (tmp_path / "summary.csv").exists()
+    assert (tmp_path / "dead_letter.jsonl").read_text() == ""
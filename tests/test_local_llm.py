@@ -0,0 +1,35 @@
+import json
+import threading
+
+import httpx
+
+from traitors_ai.local_llm import LocalLLM
+from traitors_ai.schemas import VoteAction
+
+
+def test_concurrent_requests_share_one_batch():
+    bodies = []
+
+    def handler(request):
+        body = json.loads(request.content)
+        bodies.append(body)
+        choices = [{"index": i, "text": f"out:{prompt}"} for i, prompt in reversed(list(enumerate(body["prompt"])))]
+        return httpx.Response(200, json={"choices": choices})
+
+    client = httpx.Client(base_url="http://local/v1", transport=httpx.MockTransport(handler))
+    llm = LocalLLM("tiny", 0.0, max_batch_size=4, batch_window_ms=200, http_client=client)
+    schema = VoteAction.model_json_schema()
+    results = {}
+
+    def call(i):
+        results[i] = llm.invoke(f"p{i}", json_schema=schema)
+
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == {i: f"out:p{i}" for i in range(4)}
+    assert len(bodies) == 1
+    assert bodies[0]["response_format"]["json_schema"]["schema"] == schema
@@ -0,0 +1,127 @@
+import json
+import threading
+
+import pytest
+
+from traitors_ai import logging_utils
+from traitors_ai.analysis import load_game_summaries
+from traitors_ai.logging_utils import JsonlLogger, read_events
+from traitors_ai.profiling import StandInLLM
+from traitors_ai.runner import _init_game_state, _run_single_game
+from traitors_ai.schemas import EventLogRow, GameConfig
+
+
+def test_delta_belief_log_round_trips(tmp_path):
+    logger = JsonlLogger(str(tmp_path), "g", belief_log_mode="delta", belief_keyframe_interval=3)
+    history = [
+        {2: 0.5, 3: 0.5, 4: 0.5},
+        {2: 0.7, 3: 0.5, 4: 0.5},
+        {2: 0.7, 3: 0.1},
+        {2: 0.9, 3: 0.1},
+    ]
+    for round_idx, scores in enumerate(history, start=1):
+        logger.log_event(
+            game_id="g",
+            seed=1,
+            condition="baseline_memory",
+            round_idx=round_idx,
+            phase="belief_update",
+            actor_id=1,
+            action_type="belief_update",
+            payload={"scores": scores, "notes": "", "error": None},
+        )
+    logger.close()
+
+    raw = read_events(logger.log_path, decode_beliefs=False)
+    assert [e["payload"]["keyframe"] for e in raw] == [True, False, False, True]
+    assert raw[1]["payload"]["delta"] == {"2": 0.7}
+    decoded = read_events(logger.log_path)
+    assert [e["payload"]["scores"] for e in decoded] == [json.loads(json.dumps(s)) for s in history]
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_fast_event_rows_match_pydantic_serialisation(tmp_path, monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(logging_utils, "orjson", None)
+    logger = JsonlLogger(str(tmp_path), "g")
+    payload = {"scores": {2: 0.25, 3: 1.0}, "content": "naïve – ok", "error": None}
+    logger.log_event(
+        game_id="g",
+        seed=1,
+        condition="baseline_memory",
+        round_idx=1,
+        phase="discussion",
+        actor_id=1,
+        action_type="public_message",
+        payload=payload,
+    )
+    logger.close()
+
+    with open(logger.log_path, "r", encoding="utf-8") as handle:
+        line = handle.readline().rstrip("\n")
+    row = EventLogRow.model_validate_json(line)
+    assert line == row.model_dump_json()
+
+
+def test_summary_record_is_appended_to_shared_table(tmp_path):
+    config = GameConfig(seed=4, n_players=5, n_traitors=1)
+    state = _init_game_state(config)
+    traitor = next(iter(state.traitors))
+    faithful = next(pid for pid in sorted(state.alive) if pid != traitor)
+    logger = JsonlLogger(str(tmp_path / "logs"), state.game_id)
+    for round_idx, eliminated in ((1, faithful), (2, None), (3, traitor)):
+        logger.log_event(
+            game_id=state.game_id,
+            seed=4,
+            condition="baseline_memory",
+            round_idx=round_idx,
+            phase="banish",
+            actor_id=eliminated or -1,
+            action_type="banish_result",
+            payload={"eliminated": eliminated, "tie_info": {}},
+        )
+    state.round_idx = 3
+    state.eliminated_order = [faithful, traitor]
+    state.winner = "faithful"
+    table = str(tmp_path / "games.csv")
+    usage = {"llm_calls": 12, "llm_errors": 1, "input_tokens": 300, "output_tokens": 40}
+    threads = [
+        threading.Thread(target=logger.write_summary, args=(state, None, usage, table)) for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    logger.close()
+
+    rows = load_game_summaries(table)
+    assert len(rows) == 4
+    assert rows[0]["eliminated_roles"] == ["faithful", "traitor"]
+    assert rows[0]["banish_correct"] == [False, None, True]
+    assert rows[0]["banish_accuracy"] == 0.5
+    assert rows[0]["llm_calls"] == 12 and rows[0]["faithful_win"] is True
+
+
+def test_bounded_transcript_spills_to_log_without_changing_the_game(tmp_path):
+    events = {}
+    for window in (None, 6):
+        config = GameConfig(seed=5, n_players=6, n_traitors=1, discussion_turns=2, transcript_window=window)
+        if window is not None:
+            # An earlier, different run of the same game id stays at the top of the log.
+            _run_single_game(config, str(tmp_path / str(window)), StandInLLM(config.seed + 100))
+        final_state = _run_single_game(config, str(tmp_path / str(window)), StandInLLM(config.seed))
+        transcript = final_state["public_transcript"]
+        log_path = tmp_path / str(window) / "logs" / f"{final_state['game_id']}.jsonl"
+        events[window] = [{**event, "timestamp_utc": None} for event in read_events(str(log_path))]
+    rerun = events[6][len(events[6]) - len(events[None]) :]
+    assert rerun == events[None]
+    assert transcript.spilled > 0 and len(transcript._recent) == 6
+    logged = [event["payload"] for event in rerun if event["action_type"] == "public_message"]
+    assert [message.model_dump() for message in transcript.history()] == logged
+    assert transcript[-2:] == transcript.history()[-2:]
+    assert transcript[0].model_dump() == logged[0]
+
+
+def test_transcript_window_must_cover_prompt_summaries():
+    with pytest.raises(ValueError):
+        GameConfig(seed=1, transcript_window=5)
@@ -0,0 +1,19 @@
+from traitors_ai.metrics import MetricsRegistry
+
+
+def test_registry_renders_prometheus_text():
+    registry = MetricsRegistry()
+    calls = registry.counter("calls_total", "Calls", ["model"])
+    latency = registry.histogram("latency_seconds", "Latency", buckets=(0.5, 1.0))
+    calls.inc(model="a")
+    calls.inc(2, model="a")
+    latency.observe(0.7)
+    latency.observe(3.0)
+
+    text = registry.render()
+    assert 'calls_total{model="a"} 3' in text
+    assert "# TYPE latency_seconds histogram" in text
+    assert 'latency_seconds_bucket{le="0.5"} 0' in text
+    assert 'latency_seconds_bucket{le="1"} 1' in text
+    assert 'latency_seconds_bucket{le="+Inf"} 2' in text
+    assert "latency_seconds_count 2" in text
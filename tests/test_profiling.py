@@ -0,0 +1,34 @@
+import json
+import os
+import threading
+
+from traitors_ai.profiling import GameProfiler, StandInLLM
+from traitors_ai.runner import _run_single_game
+from traitors_ai.schemas import BeliefUpdate, GameConfig, VoteAction
+
+
+def test_stand_in_llm_answers_each_schema():
+    llm = StandInLLM(seed=1)
+    prompt = "Alive players: P1, P2, P3\n"
+    scores = json.loads(llm.invoke(prompt, json_schema=BeliefUpdate.model_json_schema()))["scores"]
+    assert set(scores) == {"1", "2", "3"}
+    vote = json.loads(llm.invoke(prompt, json_schema=VoteAction.model_json_schema()))
+    assert vote["target_id"] in {1, 2, 3}
+    assert llm.invoke(prompt) == StandInLLM(seed=1).invoke(prompt)
+
+
+def test_profiled_game_writes_reports_next_to_log(tmp_path):
+    config = GameConfig(seed=2, n_players=5, n_traitors=1, max_rounds=2)
+    _run_single_game(config, str(tmp_path), StandInLLM(config.seed), profile=True)
+    logs = os.listdir(tmp_path / "logs")
+    stem = next(name[: -len(".jsonl")] for name in logs if name.endswith(".jsonl"))
+    assert {f"{stem}.prof", f"{stem}.collapsed", f"{stem}_alloc.txt"} <= set(logs)
+    report = (tmp_path / "logs" / f"{stem}_alloc.txt").read_text()
+    assert report.startswith("Peak traced memory")
+
+
+def test_sampler_skips_threads_waiting_on_the_llm():
+    profiler = GameProfiler()
+    profiler._waiting.add(threading.get_ident())
+    profiler._sample(own_ident=-1)
+    assert not any(stack.startswith("MainThread") for stack in profiler.samples)
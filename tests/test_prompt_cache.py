@@ -0,0 +1,17 @@
+from traitors_ai.prompt_cache import CacheSession, PromptCache, cache_key
+
+
+def test_cache_normalises_whitespace_and_counts_hits(tmp_path):
+    assert cache_key("m", "Round: 1\n  Alive players: P1") == cache_key("m", "Round: 1 Alive players: P1 ")
+    assert cache_key("m", "prompt") != cache_key("other", "prompt")
+    assert cache_key("m", "prompt", "VoteAction") != cache_key("m", "prompt", "MurderAction")
+
+    cache = PromptCache(str(tmp_path / "cache.sqlite"))
+    first = CacheSession(cache, "m")
+    assert first.lookup(1, "prompt") is None
+    first.store("prompt", None, "answer")
+    second = CacheSession(cache, "m")
+    assert second.lookup(2, "prompt\n") == "answer"
+    assert second.stats()["hits"] == 1
+    assert second.stats()["hit_calls"][0]["agent"] == 2
+    assert first.stats()["hit_rate"] == 0.0
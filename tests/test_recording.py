@@ -0,0 +1,53 @@
+import pytest
+
+from traitors_ai.recording import RecordingLLM, ReplayLLM, ReplayMismatchError
+
+
+class EchoLLM:
+    def __init__(self):
+        self.calls = 0
+
+    def invoke(self, prompt):
+        self.calls += 1
+        return f"{prompt}-{self.calls}"
+
+
+def test_replay_serves_recorded_responses_in_order(tmp_path):
+    path = str(tmp_path / "g_llm.jsonl")
+    recorder = RecordingLLM(EchoLLM(), path)
+    assert [recorder.invoke("a"), recorder.invoke("b"), recorder.invoke("a")] == ["a-1", "b-2", "a-3"]
+    recorder.close()
+
+    replay = ReplayLLM(path)
+    assert [replay.invoke("a"), replay.invoke("a"), replay.invoke("b")] == ["a-1", "a-3", "b-2"]
+    assert replay.unused() == 0
+    with pytest.raises(ReplayMismatchError):
+        replay.invoke("c")
+
+
+def test_recording_rejects_the_prompt_cache(tmp_path):
+    from traitors_ai.profiling import StandInLLM
+    from traitors_ai.runner import _run_single_game
+    from traitors_ai.schemas import GameConfig
+
+    config = GameConfig(seed=1, n_players=4, n_traitors=1, temperature=0, prompt_cache=str(tmp_path / "cache.sqlite"))
+    with pytest.raises(ValueError, match="prompt cache"):
+        _run_single_game(config, str(tmp_path), StandInLLM(1), record=True)
+
+
+def test_recording_a_game_again_replaces_the_old_recording(tmp_path):
+    from traitors_ai.profiling import StandInLLM
+    from traitors_ai.recording import compare_event_logs, transcript_path
+    from traitors_ai.runner import _run_single_game
+    from traitors_ai.schemas import GameConfig
+
+    config = GameConfig(seed=1, n_players=5, n_traitors=1, max_rounds=2)
+    _run_single_game(config, str(tmp_path / "run"), StandInLLM(7), record=True)
+    game_id = _run_single_game(config, str(tmp_path / "run"), StandInLLM(1), record=True)["game_id"]
+    log_dir = tmp_path / "run" / "logs"
+
+    replay = ReplayLLM(transcript_path(str(log_dir), game_id))
+    _run_single_game(config, str(tmp_path / "replay"), replay)
+    replayed = tmp_path / "replay" / "logs" / f"{game_id}.jsonl"
+    assert compare_event_logs(str(log_dir / f"{game_id}.jsonl"), str(replayed)) is None
+    assert replay.unused() == 0
@@ -0,0 +1,30 @@
+import copy
+
+from traitors_ai.replay import apply_event, build_snapshots
+
+
+def _event(round_idx, phase, actor_id, action_type, payload):
+    return {"round": round_idx, "phase": phase, "actor_id": actor_id, "action_type": action_type, "payload": payload}
+
+
+def test_snapshot_plus_delta_matches_full_replay():
+    events = [
+        _event(0, "setup", -1, "assign_roles", {"roles": {"1": "traitor", "2": "faithful", "3": "faithful", "4": "faithful"}}),
+        _event(1, "belief_update", 2, "belief_update", {"scores": {"1": 0.8, "3": 0.2}}),
+        _event(1, "voting", 2, "vote", {"target_id": 1}),
+        _event(1, "voting", 3, "vote", {"target_id": 1}),
+        _event(1, "banish", 1, "banish_result", {"eliminated": 1}),
+        _event(2, "voting", 2, "vote", {"target_id": 3}),
+    ]
+    snapshots = build_snapshots(events, every=2)
+    final = snapshots[-1]
+    assert final["alive"] == [2, 3, 4]
+    assert final["eliminations"] == [{"player_id": 1, "round": 1, "cause": "banished"}]
+    assert final["vote_tallies"] == {"3": 1}
+    assert final["suspicions"] == {"2": {"1": 0.8, "3": 0.2}}
+
+    for snapshot in snapshots:
+        state = copy.deepcopy(snapshot)
+        for index in range(state["event_index"] + 1, len(events)):
+            apply_event(state, events[index], index)
+        assert state == final
@@ -0,0 +1,38 @@
+import time
+
+import pytest
+
+from traitors_ai.llm import LLMCallError, LLMTimeoutError, ResilientLLM, is_transient
+
+
+class ScriptedLLM:
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    def invoke(self, prompt, **kwargs):
+        self.calls += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        if outcome == "hang":
+            time.sleep(5)
+        return outcome
+
+
+def test_retries_transient_errors_only():
+    flaky = ScriptedLLM([LLMCallError("503", transient=True), "ok"])
+    assert ResilientLLM(flaky, retries=2, backoff=0).invoke("p") == "ok"
+    assert flaky.calls == 2
+
+    broken = ScriptedLLM([ValueError("bad request"), "ok"])
+    with pytest.raises(ValueError):
+        ResilientLLM(broken, retries=2, backoff=0).invoke("p")
+    assert broken.calls == 1
+
+
+def test_hung_call_times_out():
+    llm = ResilientLLM(ScriptedLLM(["hang"]), timeout=0.1, retries=0)
+    with pytest.raises(LLMTimeoutError) as info:
+        llm.invoke("p")
+    assert is_transient(info.value)
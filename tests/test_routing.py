@@ -0,0 +1,78 @@
+import json
+
+import pytest
+from langchain_core.messages import AIMessage
+
+from traitors_ai.llm import InstrumentedLLM
+from traitors_ai.logging_utils import read_events
+from traitors_ai.profiling import StandInLLM
+from traitors_ai.routing import ModelRouter, route_models
+from traitors_ai.runner import _run_single_game
+from traitors_ai.schemas import GameConfig
+
+
+class ModelLLM:
+    def __init__(self, name, valid_json=True):
+        self.name = name
+        self.valid_json = valid_json
+
+    def invoke(self, prompt, **kwargs):
+        usage = {"input_tokens": 1000, "output_tokens": 500, "total_tokens": 1500}
+        if "suspicion scores" in prompt:
+            text = json.dumps({"scores": {}, "notes": ""})
+        elif "banish vote" in prompt or "to murder" in prompt:
+            text = json.dumps({"target_id": 1, "rationale": self.name}) if self.valid_json else "not json"
+        else:
+            text = f"{self.name} speaking"
+        return AIMessage(content=text, usage_metadata=usage)
+
+
+def test_routes_escalate_after_parse_failure(play_game):
+    config = GameConfig(
+        seed=1,
+        n_players=5,
+        n_traitors=1,
+        max_rounds=1,
+        model_name="strong",
+        model_routes={"vote": "cheap", "speak": "cheap"},
+        model_prices={"cheap": [1.0, 2.0]},
+    )
+    router = ModelRouter({"cheap": ModelLLM("cheap", valid_json=False), "strong": ModelLLM("strong")}, "strong")
+    llm = InstrumentedLLM(router, config.model_name, config.model_prices)
+    events = play_game(config, llm)
+
+    speeches = [event["payload"] for event in events if event["action_type"] == "public_message"]
+    votes = [event["payload"] for event in events if event["round"] == 1 and event["phase"] == "voting"]
+    assert {payload["model"] for payload in speeches} == {"cheap"}
+    assert {(payload["model"], payload["rationale"]) for payload in votes} == {("strong", "strong")}
+    usage = llm.route_usage()
+    assert usage["vote"]["cheap"]["calls"] == usage["vote"]["strong"]["calls"] == 5
+    assert usage["speak"]["cheap"]["cost_usd"] == pytest.approx(5 * 2000 / 1_000_000)
+    assert usage["update_beliefs"]["strong"]["cost_usd"] == 0.0
+    with pytest.raises(ValueError):
+        route_models(config.model_copy(update={"model_routes": {"banish": "cheap"}}))
+
+
+class CountingLimiter:
+    def __init__(self):
+        self.calls = 0
+
+    def acquire(self):
+        self.calls += 1
+
+
+class CountingLLM(StandInLLM):
+    calls = 0
+
+    def invoke(self, prompt, **kwargs):
+        self.calls += 1
+        return super().invoke(prompt, **kwargs)
+
+
+def test_rate_limit_covers_routed_models(tmp_path):
+    config = GameConfig(seed=1, n_players=5, n_traitors=1, max_rounds=1, model_routes={"vote": "cheap"})
+    limiter, llm = CountingLimiter(), CountingLLM(1)
+    game_id = _run_single_game(config, str(tmp_path), llm, limiter=limiter)["game_id"]
+    events = read_events(str(tmp_path / "logs" / f"{game_id}.jsonl"))
+    assert "cheap" in {event["payload"].get("model") for event in events}
+    assert limiter.calls == llm.calls > 0
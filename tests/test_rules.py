@@ -0,0 +1,55 @@
+import random
+
+from traitors_ai.game_engine import apply_vote
+from traitors_ai.rules import RuleSet, RunoffRuleSet, batch_tally, tally, votes_array
+
+
+def test_plurality_rules_match_engine_and_rng():
+    votes = {1: 2, 2: 3, 3: 2, 4: 3}
+    rng_a, rng_b = random.Random(5), random.Random(5)
+    rules = RuleSet(n_players=4, n_traitors=1)
+    assert rules.resolve_banish({1, 2, 3, 4}, votes, rng_a) == apply_vote({1, 2, 3, 4}, votes, rng_b)
+    assert rng_a.random() == rng_b.random()
+    assert rules.revote_candidates(None, {"tied": [3, 2]}) == [2, 3]
+    assert RuleSet(4, 1, tie_break_rule="no_banish").revote_candidates(None, {"tied": [2, 3]}) == []
+
+
+def test_runoff_and_night_variants():
+    rules = RunoffRuleSet(n_players=5, n_traitors=1)
+    eliminated, info = rules.resolve_banish({1, 2, 3, 4, 5}, {1: 2, 2: 3, 3: 2, 4: 3, 5: 4}, random.Random(1))
+    assert eliminated is None and info["runoff"] == [2, 3]
+    assert rules.resolve_banish({1, 2, 3}, {1: 2, 2: 3, 3: 2}, random.Random(1))[0] == 2
+
+    night = RuleSet(n_players=6, n_traitors=2, shields=1, recruitment=True, murders_per_night=2)
+    shielded = night.shielded({1, 2, 3, 4, 5, 6}, {5, 6}, {1: 2, 2: 3, 3: 2, 4: 3, 5: 2, 6: 3})
+    assert shielded == {1}
+    assert night.shielded({1, 2, 3, 4, 5, 6}, {1, 5}, {1: 2, 2: 3, 3: 2, 4: 3, 5: 2, 6: 3}) == {4}
+    victims = night.resolve_murder({1, 2, 3, 4, 5, 6}, {5, 6}, {5: 1, 6: 2}, random.Random(1), shielded)
+    assert len(victims) == 2 and 1 not in victims and victims[0] == 2
+    assert night.recruits({1, 2, 3, 5}, {5, 6}) and not night.recruits({1, 2, 3, 5, 6}, {5, 6})
+
+
+def test_batch_tally_matches_scalar_tally():
+    rows = [votes_array({1: 2, 2: 3, 3: 2}, 3), [3, 1, 0]]
+    weights = [2.0, 1.0, 0.5]
+    expected = [tally(row, 3, weights) for row in rows]
+    assert [list(row) for row in batch_tally(rows, 3, weights)] == expected
+
+
+def test_rule_sets_count_compact_votes_like_the_engine():
+    votes = {1: 2, 2: 3, 3: 2, 4: 9, 5: 3}
+    rules = RuleSet(n_players=5, n_traitors=1)
+    banished = rules.resolve_banish({1, 2, 3, 5}, votes, random.Random(3))
+    assert banished == apply_vote({1, 2, 3, 5}, votes, random.Random(3))
+    assert banished[1]["counts"] == {1: 0, 2: 2, 3: 2, 5: 0}
+
+    weighted = RuleSet(n_players=5, n_traitors=1, vote_weights={1: 2.0, 5: 0.5})
+    eliminated, info = weighted.resolve_banish({1, 2, 3, 5}, votes, random.Random(3))
+    assert eliminated == 2 and info["counts"] == {1: 0, 2: 3.0, 3: 1.5, 5: 0}
+
+
+def test_runoff_revote_without_valid_votes_draws_once():
+    rng, expected = random.Random(7), random.Random(7)
+    eliminated, info = RunoffRuleSet(5, 1).resolve_revote({1, 2, 3, 4, 5}, {}, [2, 3], rng)
+    assert eliminated == expected.choice([2, 3]) and info["random"]
+    assert rng.random() == expected.random()
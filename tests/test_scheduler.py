@@ -0,0 +1,47 @@
+import asyncio
+
+from traitors_ai.scheduler import AgentCall, AsyncPhaseScheduler, InlineScheduler, PhaseScheduler, Prefetch
+
+
+class Doubler:
+    def __init__(self):
+        self.calls = []
+
+    def work(self, view):
+        self.calls.append(view)
+        return view * 2
+
+    async def awork(self, view):
+        return self.work(view)
+
+
+def test_phase_scheduler_takes_prefetched_result():
+    agent = Doubler()
+    scheduler = PhaseScheduler(max_workers=2)
+    scheduler.resolve(Prefetch([AgentCall(agent, "work", 5, (1, "traitor_chat", 3))]))
+    assert scheduler.resolve(AgentCall(agent, "work", 5, (1, "traitor_chat", 3))) == 10
+    assert scheduler.resolve(AgentCall(agent, "work", 7, (1, "traitor_chat", 4))) == 14
+    scheduler.shutdown()
+    assert sorted(agent.calls) == [5, 7]
+
+
+def test_inline_scheduler_ignores_prefetch():
+    agent = Doubler()
+    scheduler = InlineScheduler()
+    scheduler.resolve(Prefetch([AgentCall(agent, "work", 1, (1, "belief_update", 1))]))
+    assert agent.calls == []
+    assert scheduler.resolve(AgentCall(agent, "work", 3)) == 6
+
+
+def test_async_phase_scheduler_takes_prefetched_result():
+    agent = Doubler()
+
+    async def main():
+        scheduler = AsyncPhaseScheduler()
+        await scheduler.aresolve(Prefetch([AgentCall(agent, "work", 2, (1, "belief_update", 1))]))
+        result = await scheduler.aresolve(AgentCall(agent, "work", 2, (1, "belief_update", 1)))
+        await scheduler.ashutdown()
+        return result
+
+    assert asyncio.run(main()) == 4
+    assert agent.calls == [2]
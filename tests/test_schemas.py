@@ -1,9 +1,19 @@
 import pytest
 
-from traitors_ai.schemas import VoteAction, validate_vote_action
+from traitors_ai.profiling import add_history
+from traitors_ai.runner import _init_game_state
+from traitors_ai.schemas import GameConfig, GameState, SharedList, VoteAction, validate_vote_action
 
 
 def test_vote_action_no_self_vote():
     vote = VoteAction(target_id=1, rationale="test")
     with pytest.raises(ValueError):
         validate_vote_action(vote, voter_id=1, alive={1, 2, 3})
+
+
+def test_game_state_keeps_histories_by_reference():
+    state = add_history(_init_game_state(GameConfig(seed=1)), 3)
+    rebuilt = GameState(**dict(state))
+    assert rebuilt.public_transcript is state.public_transcript
+    assert rebuilt.vote_history is state.vote_history
+    assert isinstance(GameState(**{**dict(state), "vote_history": []}).vote_history, SharedList)
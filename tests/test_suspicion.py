@@ -0,0 +1,92 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from traitors_ai.logging_utils import JsonlLogger
+from traitors_ai.suspicion import load_log_dir, suspicion_report
+
+
+def _write_game(logdir, game_id, rounds):
+    logger = JsonlLogger(str(logdir), game_id)
+
+    def event(round_idx, phase, actor_id, action_type, payload):
+        logger.log_event(
+            game_id=game_id,
+            seed=1,
+            condition="baseline_memory",
+            round_idx=round_idx,
+            phase=phase,
+            actor_id=actor_id,
+            action_type=action_type,
+            payload=payload,
+        )
+
+    event(0, "setup", -1, "assign_roles", {"roles": {1: "traitor", 2: "faithful", 3: "faithful", 4: "faithful"}})
+    for round_idx, beliefs in enumerate(rounds, start=1):
+        for observer, scores in beliefs.items():
+            event(round_idx, "belief_update", observer, "belief_update", {"scores": scores, "notes": "", "error": None})
+        for speaker in beliefs:
+            message = {"round": round_idx, "phase": "discussion", "speaker_id": speaker, "content": "hi"}
+            event(round_idx, "discussion", speaker, "public_message", message)
+    logger.close()
+
+
+def test_suspicion_report_tables(tmp_path):
+    _write_game(
+        tmp_path,
+        "g1",
+        [
+            {
+                1: {2: 0.9, 3: 0.1, 4: 0.1},
+                2: {1: 0.2, 3: 0.8, 4: 0.2},
+                3: {1: 0.9, 2: 0.1, 4: 0.1},
+                4: {1: 0.5, 2: 0.5, 3: 0.5},
+            },
+            {
+                1: {2: 0.9, 3: 0.1, 4: 0.1},
+                2: {1: 0.2, 3: 0.8, 4: 0.2},
+                3: {1: 0.9, 2: 0.1, 4: 0.1},
+                4: {1: 0.4, 2: 0.6, 3: 0.8},
+            },
+        ],
+    )
+    tensor = load_log_dir(str(tmp_path))
+    assert tensor.shape == (1, 2, 4, 4)
+    report = suspicion_report(tensor)
+
+    # Round 1: observer 2 ranks the traitor below P3 and level with P4, observer 3
+    # above both, observer 4 ties both: (0.5 + 2 + 1) / 6.
+    auc = report["auc"]
+    assert list(auc["round"]) == [1, 2]
+    assert auc["auc"][0] == pytest.approx(3.5 / 6)
+
+    deception = report["deception"]
+    assert list(deception["traitor"]) == [1, 1]
+    assert deception["deceived_share"][0] == pytest.approx(1 / 3)
+
+    # Observer 4 moves toward P2's view (P3 suspicious) and away from P3's (P1 suspicious).
+    influence = report["speaker_influence"]
+    by_speaker = dict(zip(influence["speaker"], influence["influence"]))
+    assert by_speaker[2] > 0 > by_speaker[3]
+
+    games = report["convergence_games"]
+    assert list(games["convergence_round"]) == [-1]
+
+
+def test_malformed_belief_keys_are_dropped(tmp_path):
+    clean = {
+        1: {2: 0.9, 3: 0.1, 4: 0.1},
+        2: {1: 0.2, 3: 0.8, 4: 0.2},
+        3: {1: 0.9, 2: 0.1, 4: 0.1},
+        4: {1: 0.5, 2: 0.5, 3: 0.5},
+    }
+    _write_game(tmp_path / "clean", "g1", [clean])
+    noisy = {observer: {**scores, 0: 0.7, 7: 0.7, observer: 0.7, "P2": 0.7} for observer, scores in clean.items()}
+    _write_game(tmp_path / "noisy", "g1", [noisy])
+
+    expected = load_log_dir(str(tmp_path / "clean"))
+    tensor = load_log_dir(str(tmp_path / "noisy"))
+    assert tensor.shape == expected.shape == (1, 1, 4, 4)
+    assert np.array_equal(tensor.scores, expected.scores, equal_nan=True)
+    assert np.isnan(np.diagonal(tensor.scores, axis1=2, axis2=3)).all()
+    assert suspicion_report(tensor)["auc"]["auc"][0] == pytest.approx(suspicion_report(expected)["auc"]["auc"][0])